@@ -39,19 +39,81 @@ def _print_validation_result(result) -> None:
             print(f"  - {warning}")
 
 
-def _run_live_profile_generation() -> None:
+def _run_live_profile_generation() -> dict[str, Any]:
+    """Run the live pipeline; return its GitHub spend and cache diagnostics."""
     from scripts.core.config import USERNAME
+    from scripts.github.github_cache import cache_stats
+    from scripts.github.github_ratelimit import rate_budget
     from scripts.pipeline.profile_pipeline import run_profile_pipeline
 
     print("=== GitHub Profile README Builder ===")
     print(f"User: {USERNAME}")
     run_profile_pipeline(logger=print)
     print("\nDone!")
+    return {"rate_budget": rate_budget().report(), "cache_namespaces": cache_stats()}
 
 
 def _cmd_build(args: argparse.Namespace) -> CommandResult:
-    _run_live_profile_generation()
-    return CommandResult(exit_code=0, extra={"step": "build"})
+    live = _run_live_profile_generation()
+    return CommandResult(exit_code=0, extra={"step": "build", **live})
+
+
+def _cmd_build_batch(args: argparse.Namespace) -> CommandResult:
+    from scripts.github.github_cache import cache_stats
+    from scripts.github.github_ratelimit import rate_budget
+    from scripts.pipeline.batch_build import BATCH_WORKERS, read_users_file, run_batch_build
+
+    try:
+        users = read_users_file(args.users_file)
+    except (OSError, ValueError) as exc:
+        print(f"Cannot read users file: {exc}")
+        return CommandResult(exit_code=1, errors=[str(exc)], extra={"step": "build_batch"})
+
+    workers = args.workers or BATCH_WORKERS
+    print("=== GitHub Profile README Builder (batch) ===")
+    print(f"Users: {len(users)} -> {args.output_dir}/<username>/ ({workers} workers)")
+    results = run_batch_build(users, Path(args.output_dir), workers=workers, logger=print)
+    failed = [result for result in results if not result.ok]
+    print(f"\nDone! {len(results) - len(failed)} built, {len(failed)} failed")
+    return CommandResult(
+        exit_code=1 if failed else 0,
+        errors=[f"{result.username}: {result.error}" for result in failed],
+        extra={
+            "step": "build_batch",
+            "users": len(results),
+            "failed_users": [result.username for result in failed],
+            "rate_budget": rate_budget().report(),
+            "cache_namespaces": cache_stats(),
+        },
+    )
+
+
+def _cmd_github_standin(args: argparse.Namespace) -> CommandResult:
+    from scripts.github.github_standin import GitHubStandin, StandinConfig
+
+    config = StandinConfig(
+        username=args.username,
+        repos=args.repos,
+        events=args.events,
+        latency=args.latency_ms / 1000,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        seed=args.seed,
+    )
+    standin = GitHubStandin(config, host=args.host, port=args.port)
+    print(f"=== GitHub API stand-in: {config.repos} repos for {config.username} at {standin.url} ===")
+    for name, value in standin.env().items():
+        print(f"export {name}={value}")
+    try:
+        standin.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        standin.stop()
+    counts = standin.request_counts()
+    for route, count in counts.items():
+        print(f"  {count:>7}  {route}")
+    return CommandResult(exit_code=0, extra={"step": "github_standin", "requests": counts})
 
 
 def _cmd_validate(args: argparse.Namespace) -> CommandResult:
@@ -71,13 +133,14 @@ def _cmd_generate_profile(args: argparse.Namespace) -> CommandResult:
     from scripts.pipeline.profile_pipeline import run_profile_pipeline_from_fixture
     from scripts.quality.validate_generated_profile import validate_profile
 
+    live: dict[str, Any] = {"rate_budget": None}
     if args.fixture:
         print("=== GitHub Profile README Builder (fixture mode) ===")
         print(f"Fixture: {args.fixture}")
         run_profile_pipeline_from_fixture(args.fixture, logger=print)
         print("\nDone!")
     else:
-        _run_live_profile_generation()
+        live = _run_live_profile_generation()
 
     warnings: list[str] = []
     errors: list[str] = []
@@ -97,6 +160,7 @@ def _cmd_generate_profile(args: argparse.Namespace) -> CommandResult:
             "step": "generate_profile",
             "validated": bool(args.validate),
             "fixture": args.fixture,
+            **live,
         },
     )
 
@@ -402,6 +466,48 @@ def build_parser() -> argparse.ArgumentParser:
     build_cmd = subparsers.add_parser("build", help="Generate README, SVGs, and JSON snapshot.")
     build_cmd.set_defaults(func=_cmd_build)
 
+    batch_cmd = subparsers.add_parser(
+        "build-batch",
+        help="Build profiles for many users in one process (per-user output directories).",
+    )
+    batch_cmd.add_argument(
+        "--users-file",
+        required=True,
+        help="File with one GitHub username per line (# comments allowed).",
+    )
+    batch_cmd.add_argument(
+        "--output-dir",
+        default="build/profiles",
+        help="Directory receiving one <username>/ output tree per user.",
+    )
+    batch_cmd.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Users built concurrently (default: 4).",
+    )
+    batch_cmd.set_defaults(func=_cmd_build_batch)
+
+    standin_cmd = subparsers.add_parser(
+        "github-standin",
+        help="Serve a synthetic local GitHub API for load-testing the client (Ctrl-C to stop).",
+    )
+    standin_cmd.add_argument("--host", default="127.0.0.1", help="Interface to bind.")
+    standin_cmd.add_argument("--port", type=int, default=8765, help="Port to bind (0 = any free port).")
+    standin_cmd.add_argument("--username", default="standin-user", help="Login of the synthetic account.")
+    standin_cmd.add_argument("--repos", type=int, default=1000, help="Synthetic public repos.")
+    standin_cmd.add_argument("--events", type=int, default=300, help="Synthetic public events.")
+    standin_cmd.add_argument("--latency-ms", type=float, default=0.0, help="Delay added to every response.")
+    standin_cmd.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered 502.")
+    standin_cmd.add_argument(
+        "--rate-limit",
+        type=int,
+        default=None,
+        help="Requests per resource per hour before 403s (default: unlimited).",
+    )
+    standin_cmd.add_argument("--seed", type=int, default=0, help="Seed for the synthetic account.")
+    standin_cmd.set_defaults(func=_cmd_github_standin)
+
     validate_cmd = subparsers.add_parser("validate", help="Validate generated profile outputs.")
     validate_cmd.set_defaults(func=_cmd_validate)
 
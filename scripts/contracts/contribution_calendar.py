@@ -0,0 +1,160 @@
+"""Columnar contribution calendar.
+
+GitHub returns the calendar as a ``weeks[].contributionDays[]`` tree. This
+flattens it once into parallel ``array`` columns -- date ordinals and
+non-negative counts, in calendar (chronological) order -- plus the offset at
+which each calendar week starts and a running-total column. Streaks, active
+days, rolling window totals and heatmap intensity levels are then computed
+over the columns (C-level ``array`` scans, ``bisect`` and prefix sums) instead
+of every consumer re-walking and re-parsing the dict tree.
+
+Days with an unusable date are dropped; a malformed week keeps its column
+with no days so week positions still line up with the source calendar.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from datetime import date, datetime
+from itertools import accumulate, groupby, islice
+from typing import Any, Iterable
+
+# Heatmap intensity thresholds as fractions of the busiest day (levels 1-4).
+INTENSITY_THRESHOLDS: tuple[float, ...] = (0.25, 0.5, 0.75)
+
+
+def _day_ordinal(value: Any) -> int | None:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value)).date().toordinal()
+    except ValueError:
+        return None
+
+
+def _day_count(value: Any) -> int:
+    try:
+        return max(0, int(value or 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+def intensity_level(count: int, max_count: int) -> int:
+    """Heatmap level 0-4 for *count* relative to the busiest day."""
+    if count <= 0 or max_count <= 0:
+        return 0
+    ratio = count / max_count
+    return 1 + sum(1 for threshold in INTENSITY_THRESHOLDS if ratio >= threshold)
+
+
+class ContributionCalendar:
+    """Parallel ordinal/count columns for a contribution calendar."""
+
+    __slots__ = ("ordinals", "counts", "week_offsets", "total", "_running")
+
+    def __init__(self, ordinals: array, counts: array, week_offsets: array, total: int = 0):
+        self.ordinals = ordinals
+        self.counts = counts
+        # week_offsets[w]:week_offsets[w + 1] is week w's slice of the columns.
+        self.week_offsets = week_offsets
+        self.total = total
+        # _running[i] = sum(counts[:i]), so any window total is one subtraction.
+        self._running = array("q", accumulate(counts, initial=0))
+
+    @classmethod
+    def from_weeks(cls, weeks: Iterable[Any], total: int = 0) -> "ContributionCalendar":
+        ordinals, counts, offsets = array("l"), array("l"), array("l", [0])
+        for week in weeks:
+            days = week.get("contributionDays") if isinstance(week, dict) else None
+            for day in days if isinstance(days, list) else ():
+                if not isinstance(day, dict):
+                    continue
+                ordinal = _day_ordinal(day.get("date"))
+                if ordinal is None:
+                    continue
+                ordinals.append(ordinal)
+                counts.append(_day_count(day.get("contributionCount")))
+            offsets.append(len(ordinals))
+        return cls(ordinals, counts, offsets, total)
+
+    @classmethod
+    def from_graphql(cls, calendar: Any) -> "ContributionCalendar":
+        """Build from the GraphQL ``contributionCalendar`` dict (``None`` -> empty)."""
+        if not isinstance(calendar, dict):
+            return cls.from_weeks(())
+        weeks = calendar.get("weeks")
+        return cls.from_weeks(weeks if isinstance(weeks, list) else (), _day_count(calendar.get("totalContributions")))
+
+    @classmethod
+    def of(cls, calendar: "ContributionCalendar | dict | None") -> "ContributionCalendar":
+        """Return *calendar* if it is already columnar, else build it."""
+        return calendar if isinstance(calendar, ContributionCalendar) else cls.from_graphql(calendar)
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    def date_at(self, index: int) -> date:
+        return date.fromordinal(self.ordinals[index])
+
+    def end_index(self, today: date | None = None) -> int:
+        """Number of leading days on or before *today* (all days when ``None``)."""
+        if today is None:
+            return len(self.ordinals)
+        return bisect_right(self.ordinals, today.toordinal())
+
+    def active_runs(self, today: date | None = None) -> list[tuple[int, int]]:
+        """``(start, stop)`` index ranges of consecutive active days up to *today*."""
+        runs: list[tuple[int, int]] = []
+        position = 0
+        for active, group in groupby(islice(self.counts, self.end_index(today)), key=bool):
+            length = sum(1 for _ in group)
+            if active:
+                runs.append((position, position + length))
+            position += length
+        return runs
+
+    def current_streak(self, today: date | None = None) -> tuple[int, date | None, date | None]:
+        """Length, first and last day of the run ending on the last day up to *today*."""
+        end = self.end_index(today)
+        runs = self.active_runs(today)
+        if not runs or runs[-1][1] != end:
+            return 0, None, None
+        start, stop = runs[-1]
+        return stop - start, self.date_at(start), self.date_at(stop - 1)
+
+    def longest_streak(self, today: date | None = None) -> tuple[int, date | None, date | None]:
+        """Length, first and last day of the earliest longest run up to *today*."""
+        runs = self.active_runs(today)
+        if not runs:
+            return 0, None, None
+        start, stop = max(runs, key=lambda run: run[1] - run[0])
+        return stop - start, self.date_at(start), self.date_at(stop - 1)
+
+    def active_days(self) -> int:
+        return len(self.counts) - self.counts.count(0)
+
+    def max_count(self) -> int:
+        return max(self.counts, default=0)
+
+    def window_total(self, start: int, stop: int) -> int:
+        """Contributions over days ``start:stop`` (indexes into the columns)."""
+        return self._running[stop] - self._running[start]
+
+    def weekly_totals(self, last: int | None = None) -> list[int]:
+        """Per-week contribution totals, optionally only the *last* N weeks."""
+        offsets = self.week_offsets
+        weeks = range(len(offsets) - 1)
+        if last is not None:
+            weeks = weeks[-last:] if last > 0 else weeks[:0]
+        return [self.window_total(offsets[week], offsets[week + 1]) for week in weeks]
+
+    def week_slices(self) -> list[range]:
+        """Column indexes of each calendar week, in week order."""
+        offsets = self.week_offsets
+        return [range(offsets[week], offsets[week + 1]) for week in range(len(offsets) - 1)]
+
+    def intensity_levels(self) -> array:
+        """Heatmap level (0-4) per day, relative to the busiest day."""
+        max_count = self.max_count()
+        return array("b", (intensity_level(count, max_count) for count in self.counts))
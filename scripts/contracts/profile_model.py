@@ -0,0 +1,88 @@
+"""Typed profile model built by ``compute_metrics.compute_profile_model``.
+
+Renderers read fields as attributes instead of string keys into a nested dict.
+The model is frozen and slotted. ``public_dashboard`` is the projection
+published as ``site/data/profile_snapshot.json``: a shallow copy of
+``dashboard_data`` that rebuilds only ``data_quality``, which is the one part
+that changes. No deep copy of the payload is made.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Any
+
+from scripts.contracts import DataQuality, DataScope, FocusLanes, ScorecardCard, Snapshot, SnapshotRow
+
+
+def public_data_quality(data_quality: Any) -> Any:
+    """*data_quality* without internal token fields (token_mode and any future token_*)."""
+    if not isinstance(data_quality, dict):
+        return data_quality
+    return {key: value for key, value in data_quality.items() if "token" not in key.lower()}
+
+
+def public_dashboard_data(dashboard_data: dict[str, Any]) -> dict[str, Any]:
+    """Publishable view of *dashboard_data*, sharing every unchanged value with it."""
+    public = dict(dashboard_data)
+    if "data_quality" in public:
+        public["data_quality"] = public_data_quality(public["data_quality"])
+    return public
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileModel:
+    now_utc: datetime
+    lang_count: int
+    snapshot: Snapshot
+    snapshot_rows: list[SnapshotRow]
+    snapshot_cards: list[dict[str, Any]]
+    scorecard: dict[str, Any]
+    scorecard_cards: list[ScorecardCard]
+    data_scope: DataScope
+    data_quality: DataQuality
+    featured_repo_facts: list[dict[str, Any]]
+    top_languages: list[dict[str, Any]]
+    repo_overview_rows: list[dict[str, Any]]
+    recent_created: list[dict[str, Any]]
+    focus: FocusLanes
+    activity_feed: list[dict[str, Any]]
+    recent_releases: list[dict[str, Any]]
+    recent_pull_requests: list[dict[str, Any]]
+    dashboard_data: dict[str, Any]
+    recent_repos: list[dict[str, Any]]
+    spotlight_data: list[dict[str, Any]]
+    engineering: dict[str, Any]
+    # Internal run diagnostics; never part of the public projection.
+    token_mode: str
+    cache_mode: dict[str, Any]
+
+    @property
+    def username(self) -> str:
+        return self.dashboard_data["username"]
+
+    @property
+    def generated_at(self) -> str:
+        return self.dashboard_data.get("generated_at", "")
+
+    @property
+    def primary_language(self) -> str:
+        """The dominant language NAME (e.g. 'Python'), or ''.
+
+        Null-safe: a missing/None name or a non-list top_languages yields ''
+        (never the literal 'None' or a crash), so tiles fall back to their
+        generic noun.
+        """
+        langs = self.top_languages
+        if isinstance(langs, list) and langs and isinstance(langs[0], dict):
+            return str(langs[0].get("name") or "").strip()
+        return ""
+
+    def public_dashboard(self) -> dict[str, Any]:
+        """The payload published as profile_snapshot.json (see ``public_dashboard_data``)."""
+        return public_dashboard_data(self.dashboard_data)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Shallow field mapping (values are shared, not copied)."""
+        return {field.name: getattr(self, field.name) for field in fields(self)}
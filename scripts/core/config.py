@@ -1,5 +1,9 @@
 """Theme colors and shared constants."""
 
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable
+
 # Tokyo Night palette
 BG_DARK = "#1a1b27"
 BG_CARD = "#24283b"
@@ -120,6 +124,38 @@ USERNAME = _Settings.from_env().username
 # and activity feeds so the hourly auto-commit bot never appears as real work.
 SELF_REPO = USERNAME
 
+# Batch builds render several users in one process; the user being built (and
+# where its client warnings go) is context-local so concurrent builds on worker
+# threads never see each other's.
+_ACTIVE_USERNAME: ContextVar[str | None] = ContextVar("profile_username", default=None)
+_ACTIVE_LOGGER: ContextVar[Callable[[str], None] | None] = ContextVar("profile_logger", default=None)
+
+
+def active_username(default: str | None = None) -> str:
+    """The user currently being built: the ``profile_user`` override, else *default* or USERNAME."""
+    return _ACTIVE_USERNAME.get() or default or USERNAME
+
+
+def profile_log(message: str) -> None:
+    """Send a client warning to the active build's logger (stdout outside ``profile_user``)."""
+    (_ACTIVE_LOGGER.get() or print)(message)
+
+
+@contextmanager
+def profile_user(username: str, logger=None):
+    """Build for *username* (instead of GITHUB_USERNAME) within this context.
+
+    With *logger*, ``profile_log`` messages go there instead of stdout.
+    """
+    token = _ACTIVE_USERNAME.set(username)
+    logger_token = _ACTIVE_LOGGER.set(logger) if logger is not None else None
+    try:
+        yield username
+    finally:
+        if logger_token is not None:
+            _ACTIVE_LOGGER.reset(logger_token)
+        _ACTIVE_USERNAME.reset(token)
+
 # Commit-message / actor markers produced by automation. These must never be
 # surfaced as "currently working", "shipped", or activity.
 BOT_COMMIT_MARKERS = (
@@ -33,7 +33,16 @@ def cache_mode_from_env() -> dict[str, Any]:
         ttl_seconds = int(ttl_raw)
     except ValueError:
         ttl_seconds = 21600
+    try:
+        stale_grace_seconds = max(0, int(os.environ.get("CACHE_STALE_GRACE_SECONDS", "0")))
+    except ValueError:
+        stale_grace_seconds = 0
     return {
         "bypass": bypass,
         "ttl_seconds": ttl_seconds,
+        "stale_grace_seconds": stale_grace_seconds,
     }
+
+
+def incremental_model_from_env() -> bool:
+    return os.environ.get("PROFILE_MODEL_INCREMENTAL", "").strip().lower() in {"1", "true", "yes"}
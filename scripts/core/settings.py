@@ -6,6 +6,10 @@ import os
 from dataclasses import dataclass
 from pathlib import Path
 
+CLIENT_ENGINES = ("threads", "async")
+CACHE_BACKENDS = ("files", "sqlite")
+CACHE_COMPRESSIONS = ("none", "gzip", "zstd")
+
 
 @dataclass(frozen=True)
 class Settings:
@@ -15,6 +19,10 @@ class Settings:
     cache_ttl_seconds: int
     bypass_cache: bool
     tokens: tuple[str, ...] = ()
+    client_engine: str = "threads"
+    cache_backend: str = "files"
+    cache_stale_grace_seconds: int = 0
+    cache_compression: str = "none"
 
     @staticmethod
     def from_env() -> "Settings":
@@ -36,6 +44,19 @@ class Settings:
             ttl_seconds = int(ttl_raw)
         except ValueError:
             ttl_seconds = 21600
+        engine = os.environ.get("GITHUB_CLIENT_ENGINE", "threads").strip().lower()
+        if engine not in CLIENT_ENGINES:
+            engine = "threads"
+        try:
+            stale_grace = max(0, int(os.environ.get("CACHE_STALE_GRACE_SECONDS", "0")))
+        except ValueError:
+            stale_grace = 0
+        backend = os.environ.get("GITHUB_CACHE_BACKEND", "files").strip().lower()
+        if backend not in CACHE_BACKENDS:
+            backend = "files"
+        compression = os.environ.get("GITHUB_CACHE_COMPRESSION", "none").strip().lower()
+        if compression not in CACHE_COMPRESSIONS:
+            compression = "none"
         return Settings(
             username=os.environ.get("GITHUB_USERNAME", "jguida941"),
             token=token,
@@ -44,4 +65,8 @@ class Settings:
             bypass_cache=os.environ.get("BYPASS_GITHUB_CACHE", "").lower()
             in {"1", "true", "yes"},
             tokens=tuple(tokens),
+            client_engine=engine,
+            cache_backend=backend,
+            cache_stale_grace_seconds=stale_grace,
+            cache_compression=compression,
         )
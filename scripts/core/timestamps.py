@@ -0,0 +1,83 @@
+"""Shared timestamp parsing and profile timezones.
+
+GitHub payloads repeat the same ISO timestamps across repos, events, releases
+and cache entries, and every builder used to re-parse them. ``parse_iso``
+interns parsed values in an LRU cache keyed by the raw string (datetimes are
+immutable, so sharing them is safe). Timezones are resolved once per name for
+the whole process instead of rebuilding ``ZoneInfo`` from the environment on
+every call; the environment is still read each time, so changing
+``PROFILE_TIMEZONE`` / ``PROFILE_ACTIVITY_TZ`` takes effect.
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import date, datetime, timezone, tzinfo
+from functools import lru_cache
+from typing import Any, Iterable
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+DEFAULT_TIMEZONE = "America/New_York"
+
+# Distinct timestamps in one large profile run (repos + events + releases).
+PARSE_CACHE_SIZE = 16384
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_iso_text(text: str) -> datetime | None:
+    try:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def parse_iso(value: Any) -> datetime | None:
+    """Parse an ISO-8601 timestamp into an aware UTC datetime; ``None`` if unusable.
+
+    Naive values are taken as UTC. Results are interned, so repeated strings
+    return the same object.
+    """
+    if not value:
+        return None
+    return _parse_iso_text(value if isinstance(value, str) else str(value))
+
+
+def parse_iso_many(values: Iterable[Any]) -> list[datetime | None]:
+    """``parse_iso`` over *values*, keeping positions (unusable -> ``None``)."""
+    return [parse_iso(value) for value in values]
+
+
+def localize_many(values: Iterable[Any], tz: tzinfo) -> list[datetime]:
+    """Parse *values* and convert them to *tz*, dropping unusable ones."""
+    return [parsed.astimezone(tz) for parsed in map(parse_iso, values) if parsed is not None]
+
+
+@lru_cache(maxsize=None)
+def resolve_timezone(name: str) -> tuple[tzinfo, str]:
+    """``(zone, name)`` for an IANA *name*; ``(UTC, "UTC")`` when it is unknown."""
+    try:
+        return ZoneInfo(name), name
+    except (ZoneInfoNotFoundError, ValueError):
+        return timezone.utc, "UTC"
+
+
+def profile_timezone_name() -> str:
+    return os.environ.get("PROFILE_TIMEZONE", DEFAULT_TIMEZONE).strip() or DEFAULT_TIMEZONE
+
+
+def profile_timezone() -> tzinfo:
+    """Zone for calendar windows and streaks (``PROFILE_TIMEZONE``)."""
+    return resolve_timezone(profile_timezone_name())[0]
+
+
+def activity_timezone() -> tuple[tzinfo, str]:
+    """Zone and resolved name for hour-of-day charts (``PROFILE_ACTIVITY_TZ``)."""
+    return resolve_timezone((os.environ.get("PROFILE_ACTIVITY_TZ") or DEFAULT_TIMEZONE).strip())
+
+
+def profile_today() -> date:
+    """Today's date in the profile timezone (so streaks aren't off-by-one in UTC)."""
+    return datetime.now(profile_timezone()).date()
@@ -0,0 +1,107 @@
+"""Asyncio fan-out engine for per-repo GitHub lookups.
+
+One event loop runs on a daemon thread for the whole process, and a single
+semaphore caps in-flight requests across every fan-out that uses it.
+
+This only changes scheduling, not the I/O model. The transport stays
+synchronous (pooled ``requests`` sessions), so every request still occupies
+one thread of the loop's shared executor for its whole duration, and that
+executor's size (``max_in_flight``) caps concurrency exactly as a thread pool
+would. What it saves is a ThreadPoolExecutor per fan-out call, and it bounds
+in-flight requests process-wide rather than per call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable
+
+from scripts.github.github_transport import DEFAULT_POOL_SIZE
+
+FanoutResult = tuple[Any, Any, "Exception | None"]
+
+
+class AsyncFanoutEngine:
+    """Shared event loop plus a global concurrency semaphore."""
+
+    def __init__(self, max_in_flight: int = DEFAULT_POOL_SIZE):
+        self.max_in_flight = max(1, int(max_in_flight))
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                executor = ThreadPoolExecutor(
+                    max_workers=self.max_in_flight,
+                    thread_name_prefix="gh-async",
+                )
+                loop.set_default_executor(executor)
+                thread = threading.Thread(target=loop.run_forever, name="gh-async-loop", daemon=True)
+                thread.start()
+                self._semaphore = asyncio.run_coroutine_threadsafe(_new_semaphore(self.max_in_flight), loop).result()
+                self._loop, self._thread, self._executor = loop, thread, executor
+            return self._loop
+
+    async def _run_one(self, fn: Callable[[Any], Any], item: Any) -> Any:
+        assert self._semaphore is not None
+        async with self._semaphore:
+            return await asyncio.get_running_loop().run_in_executor(None, fn, item)
+
+    async def _gather(self, fn: Callable[[Any], Any], items: list) -> list:
+        return await asyncio.gather(*(self._run_one(fn, item) for item in items), return_exceptions=True)
+
+    def map(self, fn: Callable[[Any], Any], items: Iterable[Any]) -> list[FanoutResult]:
+        """Run *fn* over *items* on the shared loop; block until all finish.
+
+        Returns ``(item, result, error)`` triples in input order; *error* is the
+        exception raised for that item, or ``None``.
+        """
+        items = list(items)
+        if not items:
+            return []
+        loop = self._ensure_loop()
+        outcomes = asyncio.run_coroutine_threadsafe(self._gather(fn, items), loop).result()
+        results: list[FanoutResult] = []
+        for item, outcome in zip(items, outcomes):
+            if isinstance(outcome, Exception):
+                results.append((item, None, outcome))
+            else:
+                results.append((item, outcome, None))
+        return results
+
+    def close(self) -> None:
+        with self._lock:
+            loop, thread, executor = self._loop, self._thread, self._executor
+            self._loop = self._thread = self._executor = self._semaphore = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join()
+        loop.close()
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+async def _new_semaphore(size: int) -> asyncio.Semaphore:
+    return asyncio.Semaphore(size)
+
+
+_ENGINE: AsyncFanoutEngine | None = None
+_ENGINE_LOCK = threading.Lock()
+
+
+def async_engine() -> AsyncFanoutEngine:
+    """Return the process-wide engine, creating it on first use."""
+    global _ENGINE
+    with _ENGINE_LOCK:
+        if _ENGINE is None:
+            _ENGINE = AsyncFanoutEngine()
+        return _ENGINE
@@ -1,13 +1,264 @@
-"""Cache read/write logic for GitHub API responses."""
+"""Cache read/write logic for GitHub API responses.
+
+Entries live in a pluggable backend selected by ``Settings.cache_backend``:
+
+* ``files`` (default) — one ``<key>.json`` body file per key, plus an optional
+  ``<key>.etag`` sidecar holding the ``ETag``/``Last-Modified`` validators
+  needed to revalidate the body with a conditional request.
+* ``sqlite`` — a single WAL-mode database with one indexed row per key, so
+  prefix / most-recent lookups are index range scans instead of directory
+  globs, and concurrent writers from the threaded fan-outs stay atomic.
+
+Freshness is decided per key namespace by ``CACHE_TTL_POLICY``: immutable
+history (closed contribution years, account metadata) never expires, volatile
+feeds get a short TTL, everything else uses ``Settings.cache_ttl_seconds``.
+Lookups are counted per namespace; see ``cache_stats``.
+
+With ``Settings.cache_stale_grace_seconds`` > 0, an entry that expired less
+than the grace window ago is served immediately (stale-while-revalidate) and a
+refresh is queued on a small background pool.
+
+Entries are kept compact: namespaces listed in ``CACHE_PROJECTIONS`` drop the
+fields nothing reads before they are written, and ``Settings.cache_compression``
+(``gzip``, or ``zstd`` when ``zstandard`` is installed) compresses bodies.
+Compressed and plain bodies are told apart by their magic bytes on read, so the
+setting can change between runs without invalidating the cache.
+"""
 
 from __future__ import annotations
 
+import contextvars
+import gzip
 import json
+import os
+import sqlite3
+import threading
 import time
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Protocol
 
+from scripts.core.config import profile_log
 from scripts.core.settings import Settings
 
+try:
+    import zstandard
+except ImportError:  # optional; GITHUB_CACHE_COMPRESSION=zstd falls back to gzip
+    zstandard = None
+
+# Known cache-key namespaces (longest match wins). Keys outside this table fall
+# back to their first ``_``-separated word.
+CACHE_NAMESPACES: tuple[str, ...] = (
+    "all_languages_aggregated",
+    "ci_count",
+    "contribution_calendar",
+    "events",
+    "graphql_private_owned_repos",
+    "graphql_public_owned_repos",
+    "langs",
+    "merged_prs_last",
+    "owned_repo_scope_counts",
+    "paginated",
+    "paginated_cursor",
+    "paginated_page",
+    "participation",
+    "releases_last",
+    "repo_change_index",
+    "repo_ci_state",
+    "repo_releases_since",
+    "repo_user_commits_v2",
+    "total_commit_contributions_graphql",
+    "total_commit_contributions_graphql_year",
+    "total_commits_v2",
+    "user_created_at",
+    "user_node_id",
+)
+
+TTL_FOREVER = -1
+
+# Per-namespace TTL in seconds (TTL_FOREVER: never expires). Unlisted
+# namespaces use Settings.cache_ttl_seconds, and a listed finite TTL is capped
+# at it, so lowering CACHE_TTL_SECONDS still shortens every volatile entry.
+CACHE_TTL_POLICY: dict[str, int] = {
+    # Closed windows / immutable facts. The repo change index invalidates its
+    # own entries by pushed_at/updated_at.
+    "repo_change_index": TTL_FOREVER,
+    "total_commit_contributions_graphql_year": TTL_FOREVER,
+    "user_created_at": TTL_FOREVER,
+    "user_node_id": TTL_FOREVER,
+    # Volatile feeds; cheap to refresh (events are fetched incrementally).
+    "events": 15 * 60,
+    "owned_repo_scope_counts": 60 * 60,
+}
+
+
+# Namespaces whose keys describe the profile user rather than a repo. A batch
+# build qualifies these per user so users share repo-level entries only.
+USER_SCOPED_NAMESPACES: frozenset[str] = frozenset(
+    {
+        "all_languages_aggregated",
+        "contribution_calendar",
+        "events",
+        "graphql_private_owned_repos",
+        "graphql_public_owned_repos",
+        "merged_prs_last",
+        "owned_repo_scope_counts",
+        "releases_last",
+        "repo_change_index",
+        "total_commit_contributions_graphql",
+        "total_commit_contributions_graphql_year",
+        "total_commits_v2",
+        "user_created_at",
+    }
+)
+
+
+# Fields each projected namespace keeps per record (dotted paths reach into
+# nested objects); everything else is dropped at write time. List payloads are
+# projected item by item. ``paginated`` holds repo listings, contributor lists
+# and single-commit lookups alike, so it keeps the union of what those read;
+# ``paginated_page`` likewise keeps what the contributor and commit walks read.
+_REPO_FIELDS: tuple[str, ...] = (
+    "name",
+    "fork",
+    "private",
+    "visibility",
+    "description",
+    "html_url",
+    "pushed_at",
+    "updated_at",
+    "created_at",
+    "stargazers_count",
+    "forks_count",
+    "language",
+    "owner.login",
+    "has_ci_workflows",
+    "workflow_file_count",
+    "language_bytes",
+    "latest_commit_message",
+)
+_CONTRIBUTOR_FIELDS: tuple[str, ...] = ("login", "contributions")
+_COMMIT_FIELDS: tuple[str, ...] = ("sha", "commit.message")
+
+CACHE_PROJECTIONS: dict[str, tuple[str, ...]] = {
+    "graphql_private_owned_repos": _REPO_FIELDS,
+    "graphql_public_owned_repos": _REPO_FIELDS,
+    "paginated": _REPO_FIELDS + _CONTRIBUTOR_FIELDS + _COMMIT_FIELDS,
+    "paginated_page": _CONTRIBUTOR_FIELDS + _COMMIT_FIELDS,
+}
+
+
+def cache_namespace(key: str) -> str:
+    """Return the namespace a cache *key* belongs to (e.g. ``langs``)."""
+    if "@" in key:
+        # Batch user qualifier (see user_scoped_key): "events@alice_100_3".
+        head, _, tail = key.partition("@")
+        key = head + tail[len(tail.split("_", 1)[0]):]
+    best = ""
+    for namespace in CACHE_NAMESPACES:
+        if key.startswith(namespace) and len(namespace) > len(best):
+            best = namespace
+    return best or key.split("_", 1)[0]
+
+
+def user_scoped_key(key: str, username: str) -> str:
+    """Qualify a user-scoped *key* (or key prefix) for *username*.
+
+    ``events_100_3`` becomes ``events@alice_100_3``; the namespace prefix is
+    kept so ``cache_namespace`` and prefix scans still work.
+    """
+    namespace = cache_namespace(key)
+    if namespace not in USER_SCOPED_NAMESPACES:
+        return key
+    return f"{namespace}@{username}{key[len(namespace):]}"
+
+
+def _projection_tree(fields: tuple[str, ...]) -> dict:
+    """``("owner.login", "name")`` -> ``{"owner": {"login": None}, "name": None}``."""
+    tree: dict = {}
+    for path in fields:
+        node = tree
+        *parents, leaf = path.split(".")
+        for part in parents:
+            node = node.setdefault(part, {})
+        node[leaf] = None
+    return tree
+
+
+_PROJECTION_TREES = {namespace: _projection_tree(fields) for namespace, fields in CACHE_PROJECTIONS.items()}
+
+
+def _project_record(record, tree: dict):
+    if not isinstance(record, dict):
+        return record
+    kept = {}
+    for name, subtree in tree.items():
+        if name in record:
+            value = record[name]
+            kept[name] = value if subtree is None else _project_record(value, subtree)
+    return kept
+
+
+def project_for_cache(key: str, data):
+    """Drop the fields of *data* that ``CACHE_PROJECTIONS`` does not keep for *key*."""
+    tree = _PROJECTION_TREES.get(cache_namespace(key))
+    if tree is None:
+        return data
+    if isinstance(data, list):
+        return [_project_record(item, tree) for item in data]
+    return _project_record(data, tree)
+
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def encode_body(text: str, compression: str) -> str | bytes:
+    """Serialize a JSON body for storage under *compression* (see module docstring)."""
+    if compression == "zstd" and zstandard is not None:
+        return zstandard.ZstdCompressor(level=10).compress(text.encode("utf-8"))
+    if compression in ("gzip", "zstd"):
+        return gzip.compress(text.encode("utf-8"), compresslevel=6, mtime=0)
+    return text
+
+
+def decode_body(body: str | bytes) -> str:
+    """Inverse of ``encode_body``; plain, gzip and zstd bodies are all accepted."""
+    if isinstance(body, str):
+        return body
+    try:
+        if body.startswith(_GZIP_MAGIC):
+            body = gzip.decompress(body)
+        elif body.startswith(_ZSTD_MAGIC):
+            if zstandard is None:
+                raise ValueError("zstd-compressed cache entry but zstandard is not installed")
+            body = zstandard.ZstdDecompressor().decompress(body)
+    except (OSError, EOFError, zlib.error) as exc:
+        raise ValueError(f"undecodable cache entry: {exc}") from exc
+    return body.decode("utf-8")
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    # Stored form; decoded (and decompressed) only when the entry is parsed.
+    body: str | bytes
+    fetched_at: float
+    validators: dict = field(default_factory=dict)
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> CacheEntry | None: ...
+
+    def put(self, key: str, body: str | bytes, validators: dict | None) -> None: ...
+
+    def touch(self, key: str) -> None: ...
+
+    def expire(self, key: str) -> None: ...
+
+    def entries_with_prefix(self, prefix: str) -> list[tuple[str, CacheEntry]]: ...
+
 
 def _cache_path(key: str, cache_dir: Path) -> Path:
     """Return the file path for a given cache key, creating the dir if needed."""
@@ -16,25 +267,379 @@ def _cache_path(key: str, cache_dir: Path) -> Path:
     return cache_dir / f"{safe}.json"
 
 
-def read_cache(key: str, settings: Settings):
-    """Return cached data for *key*, or ``None`` when stale / missing / bypassed."""
-    if settings.bypass_cache:
-        return None
+def _validators_path(key: str, cache_dir: Path) -> Path:
+    """Return the sidecar path holding HTTP validators for *key*."""
+    return _cache_path(key, cache_dir).with_suffix(".etag")
 
-    p = _cache_path(key, settings.cache_dir)
-    if p.exists():
-        if settings.cache_ttl_seconds > 0:
-            age_seconds = time.time() - p.stat().st_mtime
-            if age_seconds > settings.cache_ttl_seconds:
-                return None
+
+class FileCacheBackend:
+    """One JSON file per key under ``cache_dir`` (freshness = file mtime)."""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+
+    def _load(self, path: Path) -> CacheEntry | None:
         try:
-            return json.loads(p.read_text(encoding="utf-8"))
-        except (ValueError, OSError):
+            body = path.read_bytes()
+            fetched_at = path.stat().st_mtime
+        except OSError:
             return None
-    return None
+        try:
+            validators = json.loads(path.with_suffix(".etag").read_text(encoding="utf-8"))
+        except (ValueError, OSError):
+            validators = {}
+        return CacheEntry(body, fetched_at, validators if isinstance(validators, dict) else {})
+
+    def get(self, key: str) -> CacheEntry | None:
+        return self._load(_cache_path(key, self.cache_dir))
+
+    def put(self, key: str, body: str | bytes, validators: dict | None) -> None:
+        p = _cache_path(key, self.cache_dir)
+        if isinstance(body, bytes):
+            p.write_bytes(body)
+        else:
+            p.write_text(body, encoding="utf-8")
+        meta = _validators_path(key, self.cache_dir)
+        if validators:
+            meta.write_text(json.dumps(validators), encoding="utf-8")
+        elif meta.exists():
+            # A body written without validators must not be revalidated against
+            # validators that describe an older body.
+            try:
+                meta.unlink()
+            except OSError:
+                pass
+
+    def touch(self, key: str) -> None:
+        now = time.time()
+        try:
+            os.utime(_cache_path(key, self.cache_dir), (now, now))
+        except OSError:
+            pass
+
+    def expire(self, key: str) -> None:
+        try:
+            os.utime(_cache_path(key, self.cache_dir), (0, 0))
+        except OSError:
+            pass
+
+    def entries_with_prefix(self, prefix: str) -> list[tuple[str, CacheEntry]]:
+        safe_prefix = _cache_path(prefix, self.cache_dir).stem
+        found: list[tuple[str, CacheEntry]] = []
+        try:
+            paths = list(self.cache_dir.glob(f"{safe_prefix}*.json"))
+        except OSError:
+            return []
+        for path in paths:
+            entry = self._load(path)
+            if entry is not None:
+                found.append((path.stem, entry))
+        found.sort(key=lambda item: item[1].fetched_at, reverse=True)
+        return found
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    key TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    etag TEXT,
+    validators TEXT,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cache_entries_ns_recent ON cache_entries (namespace, fetched_at DESC);
+"""
+
+
+class SqliteCacheBackend:
+    """Single WAL-mode SQLite database with one connection per thread."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with self._init_lock:
+                if not self._initialized:
+                    conn.executescript(_SCHEMA)
+                    self._initialized = True
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _entry(row) -> CacheEntry:
+        body, fetched_at, validators = row
+        try:
+            parsed = json.loads(validators) if validators else {}
+        except ValueError:
+            parsed = {}
+        return CacheEntry(body, float(fetched_at), parsed if isinstance(parsed, dict) else {})
+
+    def get(self, key: str) -> CacheEntry | None:
+        row = self._conn().execute(
+            "SELECT body, fetched_at, validators FROM cache_entries WHERE key = ?",
+            (key,),
+        ).fetchone()
+        return self._entry(row) if row else None
+
+    def put(self, key: str, body: str | bytes, validators: dict | None) -> None:
+        # Compressed bodies are stored as BLOBs in the same column.
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, namespace, fetched_at, etag, validators, body) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    cache_namespace(key),
+                    time.time(),
+                    (validators or {}).get("etag"),
+                    json.dumps(validators) if validators else None,
+                    body,
+                ),
+            )
+
+    def touch(self, key: str) -> None:
+        conn = self._conn()
+        with conn:
+            conn.execute("UPDATE cache_entries SET fetched_at = ? WHERE key = ?", (time.time(), key))
+
+    def expire(self, key: str) -> None:
+        conn = self._conn()
+        with conn:
+            conn.execute("UPDATE cache_entries SET fetched_at = 0 WHERE key = ?", (key,))
+
+    def entries_with_prefix(self, prefix: str) -> list[tuple[str, CacheEntry]]:
+        # Range scan on the primary-key index: prefix <= key < prefix + U+FFFF.
+        rows = self._conn().execute(
+            "SELECT key, body, fetched_at, validators FROM cache_entries "
+            "WHERE key >= ? AND key < ? ORDER BY fetched_at DESC",
+            (prefix, prefix + "\uffff"),
+        ).fetchall()
+        return [(row[0], self._entry(row[1:])) for row in rows]
+
+
+_BACKENDS: dict[tuple[str, Path], CacheBackend] = {}
+_BACKENDS_LOCK = threading.Lock()
+
+
+def cache_backend(settings: Settings) -> CacheBackend:
+    """Return the (shared) backend instance configured by *settings*."""
+    kind = settings.cache_backend
+    ident = (kind, settings.cache_dir)
+    with _BACKENDS_LOCK:
+        backend = _BACKENDS.get(ident)
+        if backend is None:
+            if kind == "sqlite":
+                backend = SqliteCacheBackend(settings.cache_dir / "github_cache.sqlite3")
+            else:
+                backend = FileCacheBackend(settings.cache_dir)
+            _BACKENDS[ident] = backend
+        return backend
+
+
+# Key whose refresh is running in the current context; reads of that key miss
+# so the refresh callable actually refetches instead of re-serving stale data.
+_REVALIDATING_KEY: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "github_cache_revalidating_key",
+    default=None,
+)
+
+
+class BackgroundRefresher:
+    """De-duplicated background refreshes for stale-while-revalidate reads."""
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._pool: ThreadPoolExecutor | None = None
+        self._inflight: dict[str, Future] = {}
+
+    def submit(self, key: str, refresh) -> bool:
+        """Queue *refresh* for *key* unless one is already pending; True if queued."""
+        with self._lock:
+            if key in self._inflight:
+                return False
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="cache-refresh")
+            # Run in a copy of the caller's context so the refresh keeps its
+            # rate-budget step and profile user.
+            future = self._pool.submit(contextvars.copy_context().run, self._run, key, refresh)
+            self._inflight[key] = future
+        return True
+
+    def _run(self, key: str, refresh) -> None:
+        token = _REVALIDATING_KEY.set(key)
+        try:
+            refresh()
+        except Exception as exc:
+            profile_log(f"  Warning: background cache refresh failed for {key}: {exc}")
+        finally:
+            _REVALIDATING_KEY.reset(token)
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._inflight)
+
+    def wait(self, timeout: float | None = None) -> int:
+        """Block until queued refreshes finish (or *timeout*); return how many remain."""
+        with self._lock:
+            futures = list(self._inflight.values())
+        if futures:
+            wait(futures, timeout=timeout)
+        return self.pending()
+
+
+_REFRESHER = BackgroundRefresher()
+
+
+def wait_for_refreshes(timeout: float | None = None) -> int:
+    """Wait for outstanding stale-while-revalidate refreshes; return the remainder."""
+    return _REFRESHER.wait(timeout)
+
+
+def _parse(entry: CacheEntry | None):
+    if entry is None:
+        return None
+    try:
+        return json.loads(decode_body(entry.body))
+    except ValueError:
+        # Corrupt, truncated, or zstd without ``zstandard``: treat as a miss.
+        return None
+
+
+def ttl_for_key(key: str, settings: Settings) -> int | None:
+    """Seconds *key* stays fresh under ``CACHE_TTL_POLICY``; ``None`` = never expires."""
+    default = settings.cache_ttl_seconds
+    policy = CACHE_TTL_POLICY.get(cache_namespace(key))
+    if policy == TTL_FOREVER or (policy is None and default <= 0):
+        return None
+    if policy is None:
+        return default
+    return min(policy, default) if default > 0 else policy
+
+
+class CacheStats:
+    """Thread-safe per-namespace lookup counters for ``read_cache``."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: dict[str, dict[str, int]] = {}
+
+    def record(self, key: str, outcome: str) -> None:
+        namespace = cache_namespace(key)
+        with self._lock:
+            counts = self._counts.setdefault(namespace, {"hits": 0, "stale": 0, "misses": 0})
+            counts[outcome] += 1
+
+    def report(self) -> dict[str, dict[str, float]]:
+        """``{namespace: {hits, stale, misses, hit_rate}}``; stale serves count as hits."""
+        with self._lock:
+            snapshot = {namespace: dict(counts) for namespace, counts in self._counts.items()}
+        for counts in snapshot.values():
+            lookups = counts["hits"] + counts["stale"] + counts["misses"]
+            counts["hit_rate"] = round((counts["hits"] + counts["stale"]) / lookups, 3) if lookups else 0.0
+        return dict(sorted(snapshot.items()))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+_STATS = CacheStats()
+
+
+def cache_stats() -> dict[str, dict[str, float]]:
+    """Per-namespace hit rates for this process (see ``CacheStats.report``)."""
+    return _STATS.report()
+
+
+def read_cache(key: str, settings: Settings, *, refresh=None):
+    """Return cached data for *key*, or ``None`` when stale / missing / bypassed.
+
+    Freshness follows ``ttl_for_key``. When *refresh* is given and the entry
+    expired within the configured grace window, the stale value is returned
+    and ``refresh()`` is queued in the background; it is expected to refetch
+    and ``write_cache`` the key.
+    """
+    if settings.bypass_cache or _REVALIDATING_KEY.get() == key:
+        return None
+
+    entry = cache_backend(settings).get(key)
+    if entry is None:
+        _STATS.record(key, "misses")
+        return None
+    ttl = ttl_for_key(key, settings)
+    if ttl is not None:
+        age_seconds = time.time() - entry.fetched_at
+        if age_seconds > ttl:
+            grace = settings.cache_stale_grace_seconds
+            if refresh is None or age_seconds > ttl + grace:
+                _STATS.record(key, "misses")
+                return None
+            data = _parse(entry)
+            if data is not None:
+                _REFRESHER.submit(key, refresh)
+            _STATS.record(key, "stale" if data is not None else "misses")
+            return data
+    data = _parse(entry)
+    _STATS.record(key, "hits" if data is not None else "misses")
+    return data
+
+
+def read_stale_cache(key: str, settings: Settings):
+    """Return cached data for *key* ignoring the TTL (for 304 reuse)."""
+    if settings.bypass_cache:
+        return None
+    return _parse(cache_backend(settings).get(key))
+
+
+def read_cache_validators(key: str, settings: Settings) -> dict:
+    """Return the stored validators for *key*, or ``{}`` when none are usable."""
+    if settings.bypass_cache:
+        return {}
+    entry = cache_backend(settings).get(key)
+    return dict(entry.validators) if entry is not None else {}
+
+
+def read_cache_prefix(prefix: str, settings: Settings) -> list[tuple[str, Any]]:
+    """Return ``(key, data)`` for every entry under *prefix*, newest first.
+
+    Ignores the TTL: callers use this for last-known-good fallbacks.
+    """
+    found = []
+    for key, entry in cache_backend(settings).entries_with_prefix(prefix):
+        data = _parse(entry)
+        if data is not None:
+            found.append((key, data))
+    return found
+
+
+def touch_cache(key: str, settings: Settings) -> None:
+    """Mark *key* fresh again without rewriting (or re-parsing) its body."""
+    cache_backend(settings).touch(key)
+
+
+def expire_cache(key: str, settings: Settings) -> None:
+    """Mark *key* stale without dropping it, so its validators can still revalidate."""
+    cache_backend(settings).expire(key)
+
 
+def write_cache(key: str, data, settings: Settings, *, validators: dict | None = None) -> None:
+    """Persist *data* under *key*, with optional HTTP *validators*.
 
-def write_cache(key: str, data, settings: Settings) -> None:
-    """Persist *data* under *key*."""
-    p = _cache_path(key, settings.cache_dir)
-    p.write_text(json.dumps(data), encoding="utf-8")
+    The body is projected (``project_for_cache``) and encoded with
+    ``settings.cache_compression`` before it reaches the backend.
+    """
+    body = encode_body(json.dumps(project_for_cache(key, data), separators=(",", ":")), settings.cache_compression)
+    cache_backend(settings).put(key, body, validators)
@@ -0,0 +1,255 @@
+"""Record/replay cassettes for the GitHub HTTP layer.
+
+``http_get`` and ``http_post`` in ``github_transport`` are the only places a
+request leaves the process (REST, GraphQL, public fallbacks, both client
+engines). When a cassette is active they go through it instead:
+
+* ``record`` -- requests hit the network as usual and every exchange is kept.
+  ``save()`` writes them as gzip-compressed JSON.
+* ``replay`` -- nothing touches the network. Each request is answered from
+  the cassette, optionally after ``latency`` seconds, and optionally with
+  synthetic ``X-RateLimit-*`` headers counting down from ``rate_limit`` per
+  resource. A request the cassette does not hold raises
+  ``requests.ConnectionError``, as it would on an air-gapped box.
+
+Exchanges are matched on method, URL, query params, JSON body and the
+conditional headers (``If-None-Match``/``If-Modified-Since``); auth headers are
+never recorded. Timestamp-valued GraphQL variables (rolling windows such as the
+contribution calendar's ``from``/``to``) are matched as a placeholder, so a
+cassette recorded one day still replays the next. Repeated identical requests
+replay in recorded order and the last answer repeats after that. A conditional
+request with no recorded match falls back to the unconditional answer.
+
+From the environment (read on first use): ``GITHUB_CASSETTE`` (path),
+``GITHUB_CASSETTE_MODE`` (``replay`` by default, or ``record``),
+``GITHUB_CASSETTE_LATENCY_MS`` and ``GITHUB_CASSETTE_RATE_LIMIT``.
+"""
+
+from __future__ import annotations
+
+import atexit
+import gzip
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from http.client import responses as _REASONS
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from scripts.github.github_ratelimit import resource_for_url
+
+CASSETTE_MODES = ("record", "replay")
+_FORMAT_VERSION = 2
+_CONDITIONAL_HEADERS = ("If-None-Match", "If-Modified-Since")
+_DROPPED_HEADERS = frozenset({"set-cookie"})
+_RATE_LIMIT_WINDOW_SECONDS = 3600
+_TIMESTAMP = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}")
+
+
+def _stable_body(body: Any) -> Any:
+    """*body* with timestamp-valued GraphQL variables replaced by a placeholder."""
+    if not isinstance(body, dict) or not isinstance(body.get("variables"), dict):
+        return body
+    variables = {
+        name: "<timestamp>" if isinstance(value, str) and _TIMESTAMP.match(value) else value
+        for name, value in body["variables"].items()
+    }
+    return {**body, "variables": variables}
+
+
+def _match_key(method: str, url: str, params: dict | None, body: Any, headers: dict | None) -> str:
+    conditional = {name: (headers or {}).get(name) for name in _CONDITIONAL_HEADERS if (headers or {}).get(name)}
+    return json.dumps(
+        [
+            method.upper(),
+            url,
+            sorted((str(k), str(v)) for k, v in (params or {}).items()),
+            _stable_body(body),
+            sorted(conditional.items()),
+        ],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+
+
+def _response(interaction: dict[str, Any], headers: dict[str, str]) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = int(interaction["status"])
+    resp.reason = _REASONS.get(resp.status_code, "")
+    resp.headers = CaseInsensitiveDict(headers)
+    resp.url = interaction.get("response_url") or interaction["url"]
+    resp.encoding = "utf-8"
+    resp._content = str(interaction.get("text", "")).encode("utf-8")
+    return resp
+
+
+class Cassette:
+    """One cassette file in *mode*; see the module docstring."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        mode: str = "replay",
+        *,
+        latency: float = 0.0,
+        rate_limit: int | None = None,
+    ):
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"unknown cassette mode {mode!r}; expected one of {CASSETTE_MODES}")
+        self.path = Path(path)
+        self.mode = mode
+        self.latency = max(0.0, float(latency))
+        self.rate_limit = rate_limit
+        self._lock = threading.Lock()
+        self._interactions: list[dict[str, Any]] = []
+        self._by_key: dict[str, list[dict[str, Any]]] = {}
+        self._cursor: dict[str, int] = {}
+        self._used: dict[str, int] = {}
+        self._reset_at = int(time.time()) + _RATE_LIMIT_WINDOW_SECONDS
+        if mode == "replay":
+            self._load()
+
+    def _load(self) -> None:
+        with gzip.open(self.path, "rt", encoding="utf-8") as fh:
+            payload = json.load(fh)
+        if payload.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"{self.path}: unsupported cassette version {payload.get('version')!r}")
+        for interaction in payload.get("interactions", []):
+            self._interactions.append(interaction)
+            self._by_key.setdefault(interaction["key"], []).append(interaction)
+
+    def __len__(self) -> int:
+        return len(self._interactions)
+
+    def save(self) -> None:
+        """Write recorded exchanges (no-op in replay mode)."""
+        if self.mode != "record":
+            return
+        with self._lock:
+            payload = {"version": _FORMAT_VERSION, "interactions": list(self._interactions)}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8") as fh:
+            json.dump(payload, fh, separators=(",", ":"))
+        os.replace(tmp, self.path)
+
+    def handle(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict | None,
+        params: dict | None = None,
+        body: Any = None,
+        send: Callable[[], requests.Response],
+    ) -> requests.Response:
+        """Answer one request: *send* it and record (record mode) or replay it."""
+        key = _match_key(method, url, params, body, headers)
+        if self.mode == "record":
+            resp = send()
+            interaction = {
+                "key": key,
+                "method": method.upper(),
+                "url": url,
+                "status": resp.status_code,
+                "headers": {k: v for k, v in resp.headers.items() if k.lower() not in _DROPPED_HEADERS},
+                "text": resp.text,
+                "response_url": resp.url,
+            }
+            with self._lock:
+                self._interactions.append(interaction)
+            return resp
+        interaction = self._next(key) or self._next(_match_key(method, url, params, body, None))
+        if interaction is None:
+            raise requests.ConnectionError(f"cassette {self.path.name} has no answer for {method.upper()} {url}")
+        if self.latency:
+            time.sleep(self.latency)
+        return _response(interaction, self._replay_headers(url, interaction))
+
+    def _next(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            recorded = self._by_key.get(key)
+            if not recorded:
+                return None
+            position = self._cursor.get(key, 0)
+            self._cursor[key] = position + 1
+            return recorded[min(position, len(recorded) - 1)]
+
+    def _replay_headers(self, url: str, interaction: dict[str, Any]) -> dict[str, str]:
+        headers = dict(interaction.get("headers") or {})
+        if self.rate_limit is None:
+            return headers
+        resource = resource_for_url(url)
+        with self._lock:
+            used = self._used[resource] = self._used.get(resource, 0) + 1
+        for name in list(headers):
+            if name.lower().startswith("x-ratelimit-"):
+                del headers[name]
+        headers.update(
+            {
+                "X-RateLimit-Limit": str(self.rate_limit),
+                "X-RateLimit-Remaining": str(max(0, self.rate_limit - used)),
+                "X-RateLimit-Used": str(used),
+                "X-RateLimit-Reset": str(self._reset_at),
+                "X-RateLimit-Resource": resource,
+            }
+        )
+        return headers
+
+
+_ACTIVE: Cassette | None = None
+_ENV_LOADED = False
+_ACTIVE_LOCK = threading.Lock()
+
+
+def cassette_from_env() -> Cassette | None:
+    """The cassette configured by ``GITHUB_CASSETTE*`` variables, if any."""
+    path = os.environ.get("GITHUB_CASSETTE", "").strip()
+    if not path:
+        return None
+    mode = os.environ.get("GITHUB_CASSETTE_MODE", "replay").strip().lower()
+    try:
+        latency = max(0.0, float(os.environ.get("GITHUB_CASSETTE_LATENCY_MS", "0"))) / 1000
+    except ValueError:
+        latency = 0.0
+    try:
+        rate_limit: int | None = int(os.environ["GITHUB_CASSETTE_RATE_LIMIT"])
+    except (KeyError, ValueError):
+        rate_limit = None
+    return Cassette(path, mode, latency=latency, rate_limit=rate_limit)
+
+
+def active_cassette() -> Cassette | None:
+    """The cassette ``http_get``/``http_post`` should use (``None`` = live network)."""
+    global _ACTIVE, _ENV_LOADED
+    if _ENV_LOADED:
+        return _ACTIVE
+    with _ACTIVE_LOCK:
+        if not _ENV_LOADED:
+            cassette = cassette_from_env()
+            if cassette is not None:
+                atexit.register(cassette.save)
+                _ACTIVE = cassette
+            _ENV_LOADED = True
+    return _ACTIVE
+
+
+@contextmanager
+def use_cassette(cassette: Cassette) -> Iterator[Cassette]:
+    """Route the transport through *cassette* for the block, then save it."""
+    global _ACTIVE, _ENV_LOADED
+    with _ACTIVE_LOCK:
+        previous, previous_loaded = _ACTIVE, _ENV_LOADED
+        _ACTIVE, _ENV_LOADED = cassette, True
+    try:
+        yield cassette
+    finally:
+        with _ACTIVE_LOCK:
+            _ACTIVE, _ENV_LOADED = previous, previous_loaded
+        cassette.save()
@@ -9,22 +9,48 @@ import json
 import os
 import re
 import hashlib
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from typing import Iterator
 
 import requests
+from scripts.core.config import active_username, profile_log
 from scripts.core.runtime_env import token_mode_from_env
+from scripts.core.timestamps import parse_iso, profile_timezone, profile_timezone_name
 
 # ── sub-module imports ───────────────────────────────────────────────
-from scripts.core.settings import Settings  # noqa: F401
-from scripts.github.github_cache import read_cache, write_cache  # noqa: F401
+from scripts.core.settings import CLIENT_ENGINES, Settings  # noqa: F401
+from scripts.github.github_async import async_engine
+from scripts.github.github_concurrency import concurrency_stats  # noqa: F401
+from scripts.github.github_deferred import DeferredPoller
+from scripts.github.github_event_log import event_id, event_log
+from scripts.github.github_repo_index import RepoChangeIndex
+from scripts.github.github_ratelimit import bind_step, budget_step, rate_budget  # noqa: F401
+from scripts.github.github_cache import (  # noqa: F401
+    cache_stats,
+    expire_cache,
+    user_scoped_key,
+    wait_for_refreshes,
+    read_cache,
+    read_cache_prefix,
+    read_cache_validators,
+    read_stale_cache,
+    touch_cache,
+    write_cache,
+)
 from scripts.github.github_transport import (  # noqa: F401
+    DEFAULT_POOL_SIZE,
+    conditional_headers,
+    pool_stats,
+    single_flight_stats,
     request_with_retry,
     request_public_with_retry,
+    response_validators,
 )
-from scripts.github.github_graphql import graphql_query  # noqa: F401
+from scripts.github.github_graphql import graphql_query, graphql_repository_batch  # noqa: F401
 
 # ── module-level settings (backward compat) ──────────────────────────
 _settings = Settings.from_env()
@@ -34,8 +60,13 @@ CACHE_TTL_SECONDS: int = _settings.cache_ttl_seconds
 BYPASS_CACHE: bool = _settings.bypass_cache
 TOKEN: str = _settings.token
 USERNAME: str = _settings.username
-API: str = "https://api.github.com"
-GRAPHQL: str = "https://api.github.com/graphql"
+# GITHUB_API_URL / GITHUB_GRAPHQL_URL (set by Actions) may point at a stand-in
+# server such as github_standin for load tests.
+API: str = os.environ.get("GITHUB_API_URL", "").strip().rstrip("/") or "https://api.github.com"
+GRAPHQL: str = os.environ.get("GITHUB_GRAPHQL_URL", "").strip() or f"{API}/graphql"
+# Fan-out pool width for per-repo lookups. Actual request concurrency is set
+# by the shared adaptive limiter (github_concurrency) inside the transport.
+FANOUT_MAX_WORKERS: int = DEFAULT_POOL_SIZE
 
 
 # ── thin internal wrappers (keep old call-sites identical) ───────────
@@ -50,17 +81,48 @@ def _cache_path(key: str) -> Path:
     return _cp(key, _settings.cache_dir)
 
 
-def _get_cached(key: str):
-    return read_cache(key, _settings)
+def _user() -> str:
+    """The profile user for this context (a batch build overrides USERNAME)."""
+    return active_username(USERNAME)
+
+
+def _scoped(key: str) -> str:
+    user = _user()
+    return key if user == USERNAME else user_scoped_key(key, user)
+
+
+def _get_cached(key: str, refresh=None):
+    return read_cache(_scoped(key), _settings, refresh=refresh)
+
+
+def _set_cached(key: str, data, validators: dict | None = None):
+    write_cache(_scoped(key), data, _settings, validators=validators)
+
+
+def _get_stale_cached(key: str):
+    return read_stale_cache(_scoped(key), _settings)
 
 
-def _set_cached(key: str, data):
-    write_cache(key, data, _settings)
+def _get_cache_validators(key: str) -> dict:
+    return read_cache_validators(_scoped(key), _settings)
 
 
-def _request_with_retry(url, headers=None, params=None, max_retries=3):
+def _touch_cached(key: str):
+    touch_cache(_scoped(key), _settings)
+
+
+def _expire_cached(key: str):
+    expire_cache(_scoped(key), _settings)
+
+
+def _request_with_retry(url, headers=None, params=None, max_retries=3, conditional=None):
     return request_with_retry(
-        url, _settings, headers=headers, params=params, max_retries=max_retries,
+        url,
+        _settings,
+        headers=headers,
+        params=params,
+        max_retries=max_retries,
+        conditional=conditional,
     )
 
 
@@ -72,21 +134,97 @@ def _graphql_query(query: str, variables: dict) -> dict | None:
     return graphql_query(query, variables, _settings)
 
 
-# ── private helpers (domain logic, kept in facade) ───────────────────
+def _graphql_repository_batch(repos, fields, **kwargs) -> dict:
+    return graphql_repository_batch(repos, fields, _settings, **kwargs)
 
-def _profile_timezone():
-    tz_name = os.environ.get("PROFILE_TIMEZONE", "America/New_York").strip() or "America/New_York"
-    try:
-        return ZoneInfo(tz_name)
-    except ZoneInfoNotFoundError:
-        return timezone.utc
 
+def use_client_engine(engine: str) -> None:
+    """Switch the fan-out engine (``"threads"`` or ``"async"``) for this process."""
+    global _settings
+    if engine not in CLIENT_ENGINES:
+        raise ValueError(f"unknown client engine {engine!r}; expected one of {CLIENT_ENGINES}")
+    _settings = replace(_settings, client_engine=engine)
+
+
+def _fan_out(fn, items, max_workers: int):
+    """Run *fn* over *items*, yielding ``(item, result, error)`` triples.
+
+    The ``threads`` engine keeps the historical per-call ThreadPoolExecutor;
+    the ``async`` engine routes every fan-out through one shared event loop
+    whose semaphore bounds in-flight requests process-wide. Either way each
+    call is charged to the rate-budget step that was active at fan-out time.
+    """
+    fn = bind_step(fn)
+    if _settings.client_engine == "async":
+        yield from async_engine().map(fn, items)
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(fn, item): item for item in items}
+        for f in as_completed(futures):
+            try:
+                yield futures[f], f.result(), None
+            except Exception as exc:
+                yield futures[f], None, exc
+
+
+_REPO_INDEX_KEY = "repo_change_index"
+_REPO_INDEX_LOCK = threading.Lock()
+
+
+def _indexed_fan_out(field, fn, repos, max_workers: int, per_repo_key, *, prefetch=None, reusable=None):
+    """``_fan_out`` over *repos*, skipping repos the change index can answer.
+
+    Repos whose ``pushed_at``/``updated_at`` has not moved since *field* was
+    recorded yield the recorded value without an API call. Moved repos get
+    their per-repo cache entry (``per_repo_key(repo)``) expired so a still
+    fresh TTL cannot hide the change, then go through *prefetch* (the batched
+    GraphQL path) and *fn*. *prefetch* returns ``{(owner, name): value}`` for
+    the repos it resolved; those are yielded directly -- not re-read through
+    the cache, which a bypassed cache would lose -- and only the rest reach
+    *fn*. Every non-``None`` result is recorded back.
+    """
+    index = RepoChangeIndex(_get_cached(_REPO_INDEX_KEY))
+    known, changed = index.split(repos, field, reusable)
+    for repo, value in known:
+        yield repo, value, None
+    if not changed:
+        return
+    for repo in changed:
+        if index.moved(repo):
+            _expire_cached(per_repo_key(repo))
+    resolved = (prefetch(changed) or {}) if prefetch is not None else {}
+    fresh = []
+    remaining = []
+    for repo in changed:
+        value = resolved.get((repo.get("owner", {}).get("login", _user()), repo.get("name", "")))
+        if value is None:
+            remaining.append(repo)
+            continue
+        fresh.append((repo, value))
+        yield repo, value, None
+    for repo, value, exc in _fan_out(fn, remaining, max_workers):
+        if exc is None and value is not None:
+            fresh.append((repo, value))
+        yield repo, value, exc
+    if fresh:
+        # Concurrent stages record different fields; re-read under the lock
+        # so one stage's merge does not drop another's.
+        with _REPO_INDEX_LOCK:
+            latest = RepoChangeIndex(_get_cached(_REPO_INDEX_KEY))
+            for repo, value in fresh:
+                latest.record(repo, field, value)
+            _set_cached(_REPO_INDEX_KEY, latest.to_dict())
+
+
+# ── private helpers (domain logic, kept in facade) ───────────────────
 
 def _calendar_window(days: int) -> tuple[datetime, datetime, str]:
     window_days = max(1, int(days))
-    tz = _profile_timezone()
+    tz = profile_timezone()
     now_local = datetime.now(tz)
-    end_local = now_local
+    # Whole local days: the query variables (and so cassette match keys) stay
+    # the same for the whole day instead of changing every microsecond.
+    end_local = now_local.replace(hour=23, minute=59, second=59, microsecond=0)
     start_local = (now_local - timedelta(days=window_days - 1)).replace(
         hour=0,
         minute=0,
@@ -100,24 +238,12 @@ def _calendar_window(days: int) -> tuple[datetime, datetime, str]:
     )
 
 
-def _parse_iso_datetime(value: str) -> datetime | None:
-    if not value:
-        return None
-    try:
-        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
-    except ValueError:
-        return None
-    if parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=timezone.utc)
-    return parsed.astimezone(timezone.utc)
-
-
 def _repo_signature(repos: list | None) -> str:
     if not repos:
         return "none"
     parts = []
     for repo in repos:
-        owner = repo.get("owner", {}).get("login", USERNAME)
+        owner = repo.get("owner", {}).get("login", _user())
         name = repo.get("name", "")
         pushed = (repo.get("pushed_at") or "")[:19]
         if "has_ci_workflows" in repo:
@@ -136,7 +262,7 @@ def _count_commits_from_commits_endpoint(owner: str, repo: str, use_public: bool
     Uses the `Link` header's `rel="last"` page number as total count.
     """
     url = f"{API}/repos/{owner}/{repo}/commits"
-    params = {"author": USERNAME, "per_page": 1, "page": 1}
+    params = {"author": _user(), "per_page": 1, "page": 1}
     requester = _request_public_with_retry if use_public else _request_with_retry
     resp = requester(url, params=params)
 
@@ -158,7 +284,7 @@ def _count_commits_from_commits_endpoint(owner: str, repo: str, use_public: bool
 def _is_public_owned_repo(repo: dict) -> bool:
     """True when repo is publicly visible and owned by USERNAME."""
     owner_login = repo.get("owner", {}).get("login", "")
-    is_owner = owner_login.lower() == USERNAME.lower()
+    is_owner = owner_login.lower() == _user().lower()
     visibility = repo.get("visibility")
     if visibility is None:
         visibility = "private" if repo.get("private") else "public"
@@ -166,7 +292,7 @@ def _is_public_owned_repo(repo: dict) -> bool:
 
 
 def _normalize_graphql_repo(node: dict) -> dict:
-    owner_login = (node.get("owner") or {}).get("login", USERNAME)
+    owner_login = (node.get("owner") or {}).get("login", _user())
     language_name = (node.get("primaryLanguage") or {}).get("name")
     visibility = str(node.get("visibility", "PUBLIC")).lower()
     workflows_dir = node.get("workflowsDir")
@@ -213,6 +339,7 @@ def _normalize_graphql_repo(node: dict) -> dict:
         "description": node.get("description", ""),
         "html_url": node.get("url", ""),
         "pushed_at": node.get("pushedAt", ""),
+        "updated_at": node.get("updatedAt", ""),
         "created_at": node.get("createdAt", ""),
         "stargazers_count": int(node.get("stargazerCount", 0)),
         "forks_count": int(node.get("forkCount", 0)),
@@ -226,119 +353,90 @@ def _normalize_graphql_repo(node: dict) -> dict:
 
 
 def _graphql_public_owned_repos(include_forks: bool) -> list:
+    """Public owned repos via GraphQL; the non-fork list is derived, not re-queried.
+
+    One pagination of the fork-inclusive listing fills both cache entries
+    (``graphql_public_owned_repos_1`` and ``_0``), so ``get_repos(False)`` and
+    ``get_repos(True)`` in the same run cost a single query.
+    """
     cache_key = f"graphql_public_owned_repos_{int(include_forks)}"
-    cached = _get_cached(cache_key)
+    cached = _get_cached(cache_key, refresh=lambda: _graphql_public_owned_repos(include_forks))
     if cached is not None:
         return cached
 
-    if include_forks:
-        query = """
-        query($login: String!, $cursor: String) {
-          user(login: $login) {
-            repositories(
-              ownerAffiliations: OWNER
-              privacy: PUBLIC
-              first: 100
-              after: $cursor
-              orderBy: { field: CREATED_AT, direction: DESC }
-            ) {
-              pageInfo { hasNextPage endCursor }
-              nodes {
-                name
-                isFork
-                isPrivate
-                visibility
-                description
-                url
-                pushedAt
-                createdAt
-                stargazerCount
-                forkCount
-                owner { login }
-                primaryLanguage { name }
-                defaultBranchRef {
-                  target {
-                    __typename
-                    ... on Commit {
-                      messageHeadline
-                    }
-                  }
-                }
-                workflowsDir: object(expression: "HEAD:.github/workflows") {
-                  __typename
-                  ... on Tree {
-                    entries { name }
-                  }
-                }
-                languages(first: 20, orderBy: { field: SIZE, direction: DESC }) {
-                  edges {
-                    size
-                    node { name }
-                  }
+    if not include_forks:
+        all_repos = _get_cached("graphql_public_owned_repos_1")
+        if isinstance(all_repos, list):
+            nonfork = [repo for repo in all_repos if not repo.get("fork")]
+            _set_cached(cache_key, nonfork)
+            return nonfork
+
+    all_repos = _fetch_graphql_public_owned_repos()
+    nonfork = [repo for repo in all_repos if not repo.get("fork")]
+    _set_cached("graphql_public_owned_repos_1", all_repos)
+    _set_cached("graphql_public_owned_repos_0", nonfork)
+    return all_repos if include_forks else nonfork
+
+
+def _fetch_graphql_public_owned_repos() -> list:
+    query = """
+    query($login: String!, $cursor: String) {
+      user(login: $login) {
+        repositories(
+          ownerAffiliations: OWNER
+          privacy: PUBLIC
+          first: 100
+          after: $cursor
+          orderBy: { field: CREATED_AT, direction: DESC }
+        ) {
+          pageInfo { hasNextPage endCursor }
+          nodes {
+            name
+            isFork
+            isPrivate
+            visibility
+            description
+            url
+            pushedAt
+            updatedAt
+            createdAt
+            stargazerCount
+            forkCount
+            owner { login }
+            primaryLanguage { name }
+            defaultBranchRef {
+              target {
+                __typename
+                ... on Commit {
+                  messageHeadline
                 }
               }
             }
-          }
-        }
-        """
-    else:
-        query = """
-        query($login: String!, $cursor: String) {
-          user(login: $login) {
-            repositories(
-              ownerAffiliations: OWNER
-              privacy: PUBLIC
-              isFork: false
-              first: 100
-              after: $cursor
-              orderBy: { field: CREATED_AT, direction: DESC }
-            ) {
-              pageInfo { hasNextPage endCursor }
-              nodes {
-                name
-                isFork
-                isPrivate
-                visibility
-                description
-                url
-                pushedAt
-                createdAt
-                stargazerCount
-                forkCount
-                owner { login }
-                primaryLanguage { name }
-                defaultBranchRef {
-                  target {
-                    __typename
-                    ... on Commit {
-                      messageHeadline
-                    }
-                  }
-                }
-                workflowsDir: object(expression: "HEAD:.github/workflows") {
-                  __typename
-                  ... on Tree {
-                    entries { name }
-                  }
-                }
-                languages(first: 20, orderBy: { field: SIZE, direction: DESC }) {
-                  edges {
-                    size
-                    node { name }
-                  }
-                }
+            workflowsDir: object(expression: "HEAD:.github/workflows") {
+              __typename
+              ... on Tree {
+                entries { name }
+              }
+            }
+            languages(first: 20, orderBy: { field: SIZE, direction: DESC }) {
+              edges {
+                size
+                node { name }
               }
             }
           }
         }
-        """
+      }
+      rateLimit { cost remaining resetAt }
+    }
+    """
 
     repos = []
     cursor = None
     saw_page = False
 
     while True:
-        data = _graphql_query(query, {"login": USERNAME, "cursor": cursor})
+        data = _graphql_query(query, {"login": _user(), "cursor": cursor})
         user = (data or {}).get("user")
         repo_conn = (user or {}).get("repositories")
         if not isinstance(repo_conn, dict):
@@ -358,7 +456,6 @@ def _graphql_public_owned_repos(include_forks: bool) -> list:
         if not cursor:
             break
 
-    _set_cached(cache_key, repos)
     return repos
 
 
@@ -395,6 +492,7 @@ def _graphql_private_owned_repos(limit: int = 40) -> list:
             description
             url
             pushedAt
+            updatedAt
             createdAt
             stargazerCount
             forkCount
@@ -416,7 +514,7 @@ def _graphql_private_owned_repos(limit: int = 40) -> list:
     }
     """
     try:
-        data = _graphql_query(query, {"login": USERNAME, "first": max(1, int(limit))})
+        data = _graphql_query(query, {"login": _user(), "first": max(1, int(limit))})
     except Exception:
         return []
     user = (data or {}).get("user")
@@ -429,6 +527,147 @@ def _graphql_private_owned_repos(limit: int = 40) -> list:
     return repos
 
 
+def _repo_ids(repos: list) -> list[tuple[str, str]]:
+    ids = []
+    for repo in repos:
+        owner = repo.get("owner", {}).get("login", _user())
+        name = repo.get("name", "")
+        if name:
+            ids.append((owner, name))
+    return ids
+
+
+def _user_node_id() -> str | None:
+    cache_key = f"user_node_id_{_user()}"
+    cached = _get_cached(cache_key)
+    if isinstance(cached, str) and cached:
+        return cached
+    data = _graphql_query("query($login: String!) { user(login: $login) { id } }", {"login": _user()})
+    node_id = ((data or {}).get("user") or {}).get("id")
+    if not isinstance(node_id, str) or not node_id:
+        return None
+    _set_cached(cache_key, node_id)
+    return node_id
+
+
+def _prefetch_commit_counts_batched(repos: list) -> dict[tuple[str, str], int]:
+    """Resolve per-repo commit counts via batched GraphQL.
+
+    Counts commits on each default branch authored by USERNAME. Resolved
+    counts are returned by ``(owner, name)`` and written to the per-repo
+    cache; repos the batch cannot resolve are left to the REST path.
+    """
+    resolved: dict[tuple[str, str], int] = {}
+    if not TOKEN:
+        return resolved
+    pending = [
+        repo_id
+        for repo_id in _repo_ids(repos)
+        if _get_cached(f"repo_user_commits_v2_{repo_id[0]}_{repo_id[1]}_{_user()}") is None
+    ]
+    if not pending:
+        return resolved
+    author_id = _user_node_id()
+    if not author_id:
+        return resolved
+    fields = (
+        "defaultBranchRef { target { ... on Commit { "
+        "history(author: { id: $authorId }) { totalCount } } } }"
+    )
+    found = _graphql_repository_batch(
+        pending, fields, variable_decls="$authorId: ID!", variables={"authorId": author_id},
+    )
+    for (owner, name), node in found.items():
+        if node is None:
+            continue
+        target = (node.get("defaultBranchRef") or {}).get("target") or {}
+        history = target.get("history") if isinstance(target, dict) else None
+        if node.get("defaultBranchRef") is None:
+            count = 0  # empty repository; REST answers 409
+        elif isinstance(history, dict) and "totalCount" in history:
+            count = int(history["totalCount"])
+        else:
+            continue
+        _set_cached(f"repo_user_commits_v2_{owner}_{name}_{_user()}", {"count": count})
+        resolved[(owner, name)] = count
+    return resolved
+
+
+def _prefetch_ci_states_batched(repos: list) -> dict[tuple[str, str], bool]:
+    """Resolve ``.github/workflows`` presence via batched GraphQL.
+
+    Returned by ``(owner, name)`` and written to the per-repo cache.
+    """
+    resolved: dict[tuple[str, str], bool] = {}
+    if not TOKEN:
+        return resolved
+    pending = [
+        repo_id
+        for repo_id in _repo_ids(repos)
+        if _get_cached(f"repo_ci_state_{repo_id[0]}_{repo_id[1]}") is None
+    ]
+    if not pending:
+        return resolved
+    fields = 'object(expression: "HEAD:.github/workflows") { ... on Tree { entries { name } } }'
+    found = _graphql_repository_batch(pending, fields)
+    for (owner, name), node in found.items():
+        if node is None:
+            continue
+        tree = node.get("object")
+        entries = tree.get("entries") if isinstance(tree, dict) else None
+        has_ci = isinstance(entries, list) and len(entries) > 0
+        _set_cached(f"repo_ci_state_{owner}_{name}", has_ci)
+        resolved[(owner, name)] = has_ci
+    return resolved
+
+
+def _prefetch_release_counts_batched(
+    repos: list, cutoff: datetime, per_repo: int = 100,
+) -> dict[tuple[str, str], int]:
+    """Resolve recent release counts via batched GraphQL.
+
+    Returned by ``(owner, name)`` and written to the per-repo cache. A repo
+    whose newest *per_repo* releases all fall inside the window (and that has
+    more) is left to the paginating REST path.
+    """
+    resolved: dict[tuple[str, str], int] = {}
+    if not TOKEN:
+        return resolved
+    day = cutoff.date().isoformat()
+    pending = [
+        repo_id
+        for repo_id in _repo_ids(repos)
+        if _get_cached(f"repo_releases_since_{repo_id[0]}_{repo_id[1]}_{day}") is None
+    ]
+    if not pending:
+        return resolved
+    fields = (
+        f"releases(first: {per_repo}, orderBy: {{ field: CREATED_AT, direction: DESC }}) "
+        "{ totalCount nodes { publishedAt createdAt } }"
+    )
+    found = _graphql_repository_batch(pending, fields, nodes_per_repo=per_repo)
+    for (owner, name), node in found.items():
+        releases = (node or {}).get("releases")
+        if not isinstance(releases, dict) or not isinstance(releases.get("nodes"), list):
+            continue
+        nodes = [n for n in releases["nodes"] if isinstance(n, dict)]
+        total = 0
+        reached_older_release = False
+        for release in nodes:
+            released_at = parse_iso(release.get("publishedAt") or release.get("createdAt"))
+            if released_at is None:
+                continue
+            if released_at >= cutoff:
+                total += 1
+            else:
+                reached_older_release = True
+        if not reached_older_release and int(releases.get("totalCount") or 0) > len(nodes):
+            continue
+        _set_cached(f"repo_releases_since_{owner}_{name}_{day}", total)
+        resolved[(owner, name)] = total
+    return resolved
+
+
 def get_private_repos(limit: int = 40) -> list:
     """Public wrapper: recently-pushed private owned repos (metadata only)."""
     try:
@@ -440,13 +679,26 @@ def get_private_repos(limit: int = 40) -> list:
 # ── public API (signatures unchanged) ────────────────────────────────
 
 def paginated_get(endpoint: str, params: dict | None = None, per_page: int = 100) -> list:
-    """Fetch all pages from a REST endpoint."""
-    cache_key = f"paginated_{endpoint}_{json.dumps(params or {}, sort_keys=True)}"
-    cached = _get_cached(cache_key)
+    """Fetch all pages from a REST endpoint.
+
+    An expired cache entry is revalidated page by page with the ETags stored
+    alongside it; a 304 page reuses its slice of the cached list, and when
+    every page comes back 304 the entry is simply marked fresh again. The key
+    includes *per_page*, since the 304 slices depend on the page size.
+    """
+    cache_key = f"paginated_{endpoint}_{json.dumps(params or {}, sort_keys=True)}_{per_page}"
+    cached = _get_cached(cache_key, refresh=lambda: paginated_get(endpoint, params, per_page))
     if cached is not None:
         return cached
 
+    stale = _get_stale_cached(cache_key)
+    prior_pages = _get_cache_validators(cache_key).get("pages") if isinstance(stale, list) else None
+    if not isinstance(prior_pages, list):
+        prior_pages = []
+
     results = []
+    page_validators: list[dict] = []
+    all_not_modified = bool(prior_pages)
     p = dict(params or {})
     p["per_page"] = per_page
     page = 1
@@ -454,10 +706,18 @@ def paginated_get(endpoint: str, params: dict | None = None, per_page: int = 100
     while True:
         p["page"] = page
         url = f"{API}/{endpoint}" if not endpoint.startswith("http") else endpoint
-        resp = _request_with_retry(url, params=p)
-        if resp.status_code != 200:
+        prior = prior_pages[page - 1] if page <= len(prior_pages) else None
+        resp = _request_with_retry(url, params=p, conditional=conditional_headers(prior) or None)
+        if resp.status_code == 304 and prior is not None:
+            data = stale[(page - 1) * per_page : page * per_page]
+            page_validators.append(prior)
+        elif resp.status_code != 200:
+            all_not_modified = False
             break
-        data = resp.json()
+        else:
+            data = resp.json()
+            page_validators.append(response_validators(resp))
+            all_not_modified = False
         if not data:
             break
         results.extend(data)
@@ -465,13 +725,73 @@ def paginated_get(endpoint: str, params: dict | None = None, per_page: int = 100
             break
         page += 1
 
-    _set_cached(cache_key, results)
+    if all_not_modified and len(page_validators) == len(prior_pages):
+        _touch_cached(cache_key)
+        return stale
+
+    validators = {"pages": page_validators} if all(page_validators) and page_validators else None
+    _set_cached(cache_key, results, validators=validators)
     return results
 
 
+def iter_paginated(endpoint: str, params: dict | None = None, per_page: int = 100) -> Iterator[dict]:
+    """Yield items from a REST endpoint lazily, one page at a time.
+
+    A caller that stops iterating fetches no further pages. Each page is
+    cached under its own key (revalidated with its own ETag once stale), and a
+    resume cursor -- how many pages have been read and whether the last one
+    was reached -- is persisted after every fetched page. An interrupted run
+    replays the pages it already has from the cache and continues with the
+    first missing one; a fully read listing never spends a request on the
+    empty page past its end.
+    """
+    base = f"{endpoint}_{json.dumps(params or {}, sort_keys=True)}_{per_page}"
+    cursor_key = f"paginated_cursor_{base}"
+    cursor = _get_cached(cursor_key) or {}
+    pages_read = int(cursor.get("pages", 0) or 0)
+    complete = bool(cursor.get("complete"))
+    url = f"{API}/{endpoint}" if not endpoint.startswith("http") else endpoint
+    p = dict(params or {})
+    p["per_page"] = per_page
+    page = 1
+
+    while not (complete and page > pages_read):
+        page_key = f"paginated_page_{base}_{page}"
+        data = _get_cached(page_key)
+        if data is None:
+            stale = _get_stale_cached(page_key)
+            prior = _get_cache_validators(page_key) if stale is not None else {}
+            p["page"] = page
+            resp = _request_with_retry(url, params=p, conditional=conditional_headers(prior) or None)
+            if resp.status_code == 304 and stale is not None:
+                _touch_cached(page_key)
+                data = stale
+            elif resp.status_code != 200:
+                return
+            else:
+                data = resp.json()
+                _set_cached(page_key, data, validators=response_validators(resp) or None)
+        # Rewrite the cursor whenever this page moves the frontier or changes
+        # whether it is the last one: a refetched "last" page that now comes
+        # back full must reopen the listing, not end it early.
+        last = not data or len(data) < per_page
+        if (last or page >= pages_read) and (page, last) != (pages_read, complete):
+            pages_read, complete = page, last
+            _set_cached(cursor_key, {"pages": pages_read, "complete": complete})
+        if not data:
+            return
+        yield from data
+        if len(data) < per_page:
+            return
+        page += 1
+
+
 def get_repos(include_forks: bool = False) -> list:
     """Get public repos owned by USERNAME, optionally including forks."""
-    cached_graphql = _get_cached(f"graphql_public_owned_repos_{int(include_forks)}")
+    cached_graphql = _get_cached(
+        f"graphql_public_owned_repos_{int(include_forks)}",
+        refresh=lambda: _graphql_public_owned_repos(include_forks),
+    )
     if isinstance(cached_graphql, list) and cached_graphql:
         return cached_graphql
 
@@ -481,11 +801,11 @@ def get_repos(include_forks: bool = False) -> list:
             if repos:
                 return repos
         except Exception as exc:
-            print(f"  Warning: GraphQL repo listing failed; falling back to REST ({exc})")
+            profile_log(f"  Warning: GraphQL repo listing failed; falling back to REST ({exc})")
 
     try:
         repos = paginated_get(
-            f"users/{USERNAME}/repos",
+            f"users/{_user()}/repos",
             {"sort": "created", "direction": "desc", "type": "owner"},
         )
         repos = [r for r in repos if _is_public_owned_repo(r)]
@@ -498,11 +818,11 @@ def get_repos(include_forks: bool = False) -> list:
             if isinstance(exc, requests.HTTPError) and exc.response is not None
             else "network"
         )
-        print(f"  Warning: REST repo listing unavailable ({status}); falling back to GraphQL")
+        profile_log(f"  Warning: REST repo listing unavailable ({status}); falling back to GraphQL")
         try:
             return _graphql_public_owned_repos(include_forks)
         except Exception:
-            print("  Warning: GraphQL fallback unavailable; returning empty repo list")
+            profile_log("  Warning: GraphQL fallback unavailable; returning empty repo list")
             return []
 
 
@@ -517,7 +837,7 @@ def get_owned_repo_scope_counts() -> dict:
       - private_owned (None when unavailable)
     """
     cache_key = "owned_repo_scope_counts"
-    cached = _get_cached(cache_key)
+    cached = _get_cached(cache_key, refresh=get_owned_repo_scope_counts)
     if cached is not None:
         if (
             isinstance(cached, dict)
@@ -559,7 +879,7 @@ def get_owned_repo_scope_counts() -> dict:
           }
         }
         """
-        data = _graphql_query(query, {"login": USERNAME})
+        data = _graphql_query(query, {"login": _user()})
         user = (data or {}).get("user")
         if isinstance(user, dict):
             private_owned = int(user["privateOwned"]["totalCount"])
@@ -594,21 +914,28 @@ def get_owned_repo_scope_counts() -> dict:
 def get_repo_languages(owner: str, repo: str) -> dict:
     """Get language byte counts for a single repo."""
     cache_key = f"langs_{owner}_{repo}"
-    cached = _get_cached(cache_key)
+    cached = _get_cached(cache_key, refresh=lambda: get_repo_languages(owner, repo))
     if cached is not None:
         return cached
 
     url = f"{API}/repos/{owner}/{repo}/languages"
-    resp = _request_with_retry(url)
+    validators = _get_cache_validators(cache_key)
+    resp = _request_with_retry(url, conditional=conditional_headers(validators) or None)
+    if resp.status_code == 304:
+        stale = _get_stale_cached(cache_key)
+        if stale is not None:
+            _touch_cached(cache_key)
+            return stale
+        resp = _request_with_retry(url)
     data = resp.json() if resp.status_code == 200 else {}
-    _set_cached(cache_key, data)
+    _set_cached(cache_key, data, validators=response_validators(resp) if resp.status_code == 200 else None)
     return data
 
 
-def get_all_languages(repos: list | None = None, max_workers: int = 10) -> dict:
+def get_all_languages(repos: list | None = None, max_workers: int = FANOUT_MAX_WORKERS) -> dict:
     """Aggregate language byte counts across all repos (parallelized)."""
     cache_key = "all_languages_aggregated"
-    cached = _get_cached(cache_key)
+    cached = _get_cached(cache_key, refresh=lambda: get_all_languages(repos, max_workers))
     if cached is not None:
         return cached
 
@@ -638,31 +965,37 @@ def get_all_languages(repos: list | None = None, max_workers: int = 10) -> dict:
     def fetch_one(repo):
         return get_repo_languages(repo["owner"]["login"], repo["name"])
 
-    with ThreadPoolExecutor(max_workers=max_workers) as pool:
-        futures = {pool.submit(fetch_one, r): r for r in repos}
-        for f in as_completed(futures):
-            try:
-                langs = f.result()
-                for lang, bytes_ in langs.items():
-                    totals[lang] = totals.get(lang, 0) + bytes_
-            except Exception as exc:
-                repo = futures[f]
-                print(f"  Warning: failed to fetch languages for {repo['name']}: {exc}")
+    def per_repo_key(repo):
+        return f"langs_{repo['owner']['login']}_{repo['name']}"
+
+    for repo, langs, exc in _indexed_fan_out("languages", fetch_one, repos, max_workers, per_repo_key):
+        if exc is not None:
+            profile_log(f"  Warning: failed to fetch languages for {repo['name']}: {exc}")
+            continue
+        for lang, bytes_ in langs.items():
+            totals[lang] = totals.get(lang, 0) + bytes_
 
     _set_cached(cache_key, totals)
     return totals
 
 
 def get_events(per_page: int = 100, max_pages: int = 3) -> list:
-    """Get recent public events (GitHub caps at 300 events / 3 pages)."""
+    """Get recent public events (GitHub caps at 300 events / 3 pages).
+
+    New events are appended to the local event log; paging stops at the first
+    id at or below the log's high-water mark, so a steady-state run costs one
+    request. The newest ``per_page * max_pages`` logged events are returned.
+    """
     cache_key = f"events_{per_page}_{max_pages}"
-    cached = _get_cached(cache_key)
+    cached = _get_cached(cache_key, refresh=lambda: get_events(per_page, max_pages))
     if cached is not None:
         return cached
 
-    results = []
+    log = event_log(_settings, _user())
+    high_water = log.high_water_id()
+    fetched = []
     for page in range(1, max_pages + 1):
-        url = f"{API}/users/{USERNAME}/events/public"
+        url = f"{API}/users/{_user()}/events/public"
         try:
             resp = _request_with_retry(url, params={"per_page": per_page, "page": page})
         except requests.RequestException as exc:
@@ -678,16 +1011,16 @@ def get_events(per_page: int = 100, max_pages: int = 3) -> list:
                             if isinstance(public_exc, requests.HTTPError) and public_exc.response is not None
                             else "network"
                         )
-                        print(
+                        profile_log(
                             "  Warning: events endpoint unavailable "
                             f"(auth={status}, public={public_status}); using partial/empty event data"
                         )
                         break
                 else:
-                    print(f"  Warning: events endpoint unavailable ({status}); using partial/empty event data")
+                    profile_log(f"  Warning: events endpoint unavailable ({status}); using partial/empty event data")
                     break
             else:
-                print("  Warning: events endpoint unavailable (network); using partial/empty event data")
+                profile_log("  Warning: events endpoint unavailable (network); using partial/empty event data")
                 break
 
         if resp.status_code != 200:
@@ -695,14 +1028,23 @@ def get_events(per_page: int = 100, max_pages: int = 3) -> list:
         data = resp.json()
         if not data:
             break
-        results.extend(data)
-        if len(data) < per_page:
+        unseen = [event for event in data if (event_id(event) or 0) > high_water]
+        fetched.extend(unseen)
+        if len(unseen) < len(data) or len(data) < per_page:
             break
 
+    log.append(fetched)
+    results = log.events(limit=per_page * max_pages)
     _set_cached(cache_key, results)
     return results
 
 
+def get_event_aggregates() -> dict:
+    """Full-history aggregates from the local event log (hourly type counts,
+    release and merged-PR timestamps); empty counts when nothing is logged."""
+    return event_log(_settings, _user()).aggregates()
+
+
 def _count_repo_releases_since(owner: str, repo: str, cutoff: datetime, per_page: int = 100) -> int | None:
     cache_key = f"repo_releases_since_{owner}_{repo}_{cutoff.date().isoformat()}"
     cached = _get_cached(cache_key)
@@ -751,7 +1093,7 @@ def _count_repo_releases_since(owner: str, repo: str, cutoff: datetime, per_page
             if not isinstance(release, dict):
                 continue
             when = str(release.get("published_at") or release.get("created_at") or "")
-            released_at = _parse_iso_datetime(when)
+            released_at = parse_iso(when)
             if released_at is None:
                 continue
             if released_at >= cutoff:
@@ -770,7 +1112,7 @@ def _count_repo_releases_since(owner: str, repo: str, cutoff: datetime, per_page
 def get_releases_last_n_days(
     repos: list | None = None,
     days: int = 30,
-    max_workers: int = 8,
+    max_workers: int = FANOUT_MAX_WORKERS,
 ) -> int | None:
     """
     Count published releases in the last N days across owned public non-fork repos.
@@ -785,7 +1127,7 @@ def get_releases_last_n_days(
     cutoff = datetime.now(timezone.utc) - timedelta(days=max(1, int(days)))
     repo_sig = _repo_signature(repos)
     cache_key = f"releases_last_{days}_{repo_sig}"
-    cached = _get_cached(cache_key)
+    cached = _get_cached(cache_key, refresh=lambda: get_releases_last_n_days(repos, days, max_workers))
     if cached is not None:
         if isinstance(cached, dict):
             total = cached.get("total")
@@ -802,28 +1144,44 @@ def get_releases_last_n_days(
 
     total_known = 0
     unknown_repos = 0
+    day = cutoff.date().isoformat()
 
-    def fetch_one(repo_obj: dict) -> int | None:
-        owner = repo_obj.get("owner", {}).get("login", USERNAME)
+    def fetch_one(repo_obj: dict) -> dict | None:
+        owner = repo_obj.get("owner", {}).get("login", _user())
         name = repo_obj.get("name", "")
         if not name:
-            return 0
-        return _count_repo_releases_since(owner, name, cutoff)
-
-    with ThreadPoolExecutor(max_workers=max_workers) as pool:
-        futures = {pool.submit(fetch_one, repo): repo for repo in repos}
-        for future in as_completed(futures):
-            try:
-                count = future.result()
-            except Exception:
-                count = None
-            if count is None:
-                unknown_repos += 1
-            else:
-                total_known += int(count)
+            return {"day": day, "count": 0}
+        count = _count_repo_releases_since(owner, name, cutoff)
+        return None if count is None else {"day": day, "count": count}
+
+    def per_repo_key(repo_obj: dict) -> str:
+        owner = repo_obj.get("owner", {}).get("login", _user())
+        return f"repo_releases_since_{owner}_{repo_obj.get('name', '')}_{day}"
+
+    def reusable(recorded) -> bool:
+        # A count from an earlier window is still right when it was zero:
+        # a new release moves the repo's stamp.
+        return isinstance(recorded, dict) and (recorded.get("day") == day or recorded.get("count") == 0)
+
+    for _repo, recorded, exc in _indexed_fan_out(
+        f"releases_{days}",
+        fetch_one,
+        repos,
+        max_workers,
+        per_repo_key,
+        prefetch=lambda changed: {
+            repo_id: {"day": day, "count": count}
+            for repo_id, count in _prefetch_release_counts_batched(changed, cutoff).items()
+        },
+        reusable=reusable,
+    ):
+        if exc is not None or recorded is None:
+            unknown_repos += 1
+        else:
+            total_known += int(recorded["count"])
 
     if unknown_repos > 0:
-        print(
+        profile_log(
             "  Warning: release counting unavailable for "
             f"{unknown_repos} repos; showing partial total"
         )
@@ -836,20 +1194,9 @@ def get_releases_last_n_days(
 
 def _get_recent_release_cache(days: int, exclude_signature: str) -> int | None:
     """Return a recent cached release count for the same day window when available."""
-    prefix = f"releases_last_{days}_"
-    candidates: list[tuple[float, Path]] = []
-    try:
-        for path in CACHE_DIR.glob(f"{prefix}*.json"):
-            if path.stem.endswith(exclude_signature):
-                continue
-            candidates.append((path.stat().st_mtime, path))
-    except OSError:
-        return None
-
-    for _mtime, path in sorted(candidates, key=lambda item: item[0], reverse=True):
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except (OSError, ValueError):
+    prefix = _scoped(f"releases_last_{days}_")
+    for key, payload in read_cache_prefix(prefix, _settings):
+        if key.endswith(exclude_signature):
             continue
         if isinstance(payload, dict):
             total = payload.get("total")
@@ -872,7 +1219,7 @@ def get_merged_prs_last_n_days(days: int = 365) -> int | None:
     start, _end, window_day = _calendar_window(window_days)
     since = start.date().isoformat()
     cache_key = f"merged_prs_last_{window_days}_{window_day}"
-    cached = _get_cached(cache_key)
+    cached = _get_cached(cache_key, refresh=lambda: get_merged_prs_last_n_days(days))
     if cached is not None:
         if isinstance(cached, dict):
             try:
@@ -886,7 +1233,7 @@ def get_merged_prs_last_n_days(days: int = 365) -> int | None:
             fallback = _get_recent_merged_pr_cache(window_days=window_days, exclude_day=window_day)
             return fallback
 
-    query = f"author:{USERNAME} user:{USERNAME} is:pr is:merged merged:>={since}"
+    query = f"author:{_user()} user:{_user()} is:pr is:merged merged:>={since}"
     params = {"q": query, "per_page": 1}
     url = f"{API}/search/issues"
 
@@ -925,22 +1272,14 @@ def get_merged_prs_last_n_days(days: int = 365) -> int | None:
 
 def _get_recent_merged_pr_cache(window_days: int, exclude_day: str) -> int | None:
     """Return the most recent cached merged PR total for the same window when available."""
-    prefix = f"merged_prs_last_{window_days}_"
-    candidates: list[tuple[str, Path]] = []
-    try:
-        for path in CACHE_DIR.glob(f"{prefix}*.json"):
-            day = path.stem.replace(prefix, "", 1)
-            if day == exclude_day:
-                continue
-            candidates.append((day, path))
-    except OSError:
-        return None
-
-    for _day, path in sorted(candidates, key=lambda item: item[0], reverse=True):
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except (OSError, ValueError):
-            continue
+    prefix = _scoped(f"merged_prs_last_{window_days}_")
+    candidates = [
+        (key.replace(prefix, "", 1), payload)
+        for key, payload in read_cache_prefix(prefix, _settings)
+        if key.replace(prefix, "", 1) != exclude_day
+    ]
+
+    for _day, payload in sorted(candidates, key=lambda item: item[0], reverse=True):
         if isinstance(payload, dict):
             total = payload.get("total")
         else:
@@ -955,9 +1294,8 @@ def _get_recent_merged_pr_cache(window_days: int, exclude_day: str) -> int | Non
 def get_contribution_calendar(days: int = 365) -> dict | None:
     """Fetch contribution calendar via GraphQL for a rolling window."""
     start, end, window_day = _calendar_window(days)
-    tz_name = os.environ.get("PROFILE_TIMEZONE", "America/New_York").strip() or "America/New_York"
-    cache_key = f"contribution_calendar_{days}_{tz_name}_{window_day}"
-    cached = _get_cached(cache_key)
+    cache_key = f"contribution_calendar_{days}_{profile_timezone_name()}_{window_day}"
+    cached = _get_cached(cache_key, refresh=lambda: get_contribution_calendar(days))
     if cached is not None:
         return cached
 
@@ -982,7 +1320,7 @@ def get_contribution_calendar(days: int = 365) -> dict | None:
     data = _graphql_query(
         query,
         {
-            "login": USERNAME,
+            "login": _user(),
             "from": start.isoformat().replace("+00:00", "Z"),
             "to": end.isoformat().replace("+00:00", "Z"),
         },
@@ -998,37 +1336,98 @@ def get_contribution_calendar(days: int = 365) -> dict | None:
         return None
 
 
+# /stats/participation answers 202 while GitHub computes the numbers; those
+# repos are re-polled in the background for up to this long.
+PARTICIPATION_POLL_DEADLINE_SECONDS = 30.0
+# Extra wait past the poll deadline for a request already in flight; after
+# that the caller stops waiting and reports zeros.
+PARTICIPATION_WAIT_GRACE_SECONDS = 10.0
+_PARTICIPATION_POLLER = DeferredPoller(deadline=PARTICIPATION_POLL_DEADLINE_SECONDS)
+
+
+def _fetch_participation(owner: str, repo: str) -> list | None:
+    """Owner weekly commit counts (cached on success); ``None`` while GitHub answers 202."""
+    resp = _request_with_retry(f"{API}/repos/{owner}/{repo}/stats/participation")
+    if resp.status_code != 200:
+        return None
+    owner_commits = (resp.json() or {}).get("owner", [])
+    if not isinstance(owner_commits, list):
+        return None
+    _set_cached(f"participation_{owner}_{repo}", owner_commits)
+    return owner_commits
+
+
+def warm_participation_stats(repos: list, max_workers: int = FANOUT_MAX_WORKERS) -> int:
+    """Request participation stats for *repos* now; return how many are still generating.
+
+    Repos answered with 202 are handed to the background poller, so a later
+    ``get_repo_commits_last_n_weeks`` in the same run collects the real data
+    instead of zeros.
+    """
+    pending = [
+        repo
+        for repo in repos
+        if _get_cached(f"participation_{repo['owner']['login']}_{repo['name']}") is None
+        and not _PARTICIPATION_POLLER.tracking(_scoped(f"participation_{repo['owner']['login']}_{repo['name']}"))
+    ]
+
+    def fetch_one(repo):
+        return _fetch_participation(repo["owner"]["login"], repo["name"])
+
+    generating = 0
+    for repo, weekly, exc in _fan_out(fetch_one, pending, max_workers):
+        if exc is None and weekly is None:
+            owner, name = repo["owner"]["login"], repo["name"]
+            _PARTICIPATION_POLLER.submit(
+                _scoped(f"participation_{owner}_{name}"),
+                lambda owner=owner, name=name: _fetch_participation(owner, name),
+            )
+            generating += 1
+    return generating
+
+
 def get_repo_commits_last_n_weeks(owner: str, repo: str, weeks: int = 12) -> list:
-    """Get weekly commit counts for last N weeks (participation stats)."""
+    """Get weekly commit counts for last N weeks (participation stats).
+
+    A repo warmed by ``warm_participation_stats`` waits for its background
+    poll (at most ``PARTICIPATION_POLL_DEADLINE_SECONDS`` plus
+    ``PARTICIPATION_WAIT_GRACE_SECONDS``). A repo that first answers 202 here
+    gets zeros straight away while a poll starts, so the caller is never held
+    up; the polled result is cached for the next call or run. Zeros are never
+    cached.
+    """
     cache_key = f"participation_{owner}_{repo}"
     cached = _get_cached(cache_key)
     if cached is not None:
-        return cached
-
-    url = f"{API}/repos/{owner}/{repo}/stats/participation"
-    try:
-        resp = _request_with_retry(url)
-    except requests.RequestException as exc:
-        status = (
-            exc.response.status_code
-            if isinstance(exc, requests.HTTPError) and exc.response is not None
-            else "network"
-        )
-        # This endpoint is not always accessible for every repo/token context.
-        print(f"  Warning: participation stats unavailable for {owner}/{repo} ({status}); using zeros")
-        return [0] * weeks
+        return cached[-weeks:]
 
-    if resp.status_code != 200:
-        # GitHub can return 202 while stats are being generated.
+    poll_key = _scoped(cache_key)
+    if not _PARTICIPATION_POLLER.tracking(poll_key):
+        try:
+            owner_commits = _fetch_participation(owner, repo)
+        except requests.RequestException as exc:
+            status = (
+                exc.response.status_code
+                if isinstance(exc, requests.HTTPError) and exc.response is not None
+                else "network"
+            )
+            # This endpoint is not always accessible for every repo/token context.
+            profile_log(f"  Warning: participation stats unavailable for {owner}/{repo} ({status}); using zeros")
+            return [0] * weeks
+        if owner_commits is not None:
+            return owner_commits[-weeks:]
+        # Not warmed: start generating, but keep this caller off the poll.
+        _PARTICIPATION_POLLER.submit(poll_key, lambda: _fetch_participation(owner, repo))
+        profile_log(f"  Warning: participation stats for {owner}/{repo} still generating; using zeros")
         return [0] * weeks
 
-    data = resp.json()
-    owner_commits = data.get("owner", [])[-weeks:]
-    if not isinstance(owner_commits, list):
+    owner_commits = _PARTICIPATION_POLLER.result(
+        poll_key, timeout=_PARTICIPATION_POLLER.deadline + PARTICIPATION_WAIT_GRACE_SECONDS,
+    )
+    if owner_commits is None:
+        profile_log(f"  Warning: participation stats for {owner}/{repo} still generating; using zeros")
         return [0] * weeks
-
-    _set_cached(cache_key, owner_commits)
-    return owner_commits
+    return owner_commits[-weeks:]
 
 
 def get_repo_user_commit_count(owner: str, repo: str) -> int | None:
@@ -1039,8 +1438,8 @@ def get_repo_user_commit_count(owner: str, repo: str) -> int | None:
       - int: a concrete commit count
       - None: the count could not be determined for this repo in this run
     """
-    cache_key = f"repo_user_commits_v2_{owner}_{repo}_{USERNAME}"
-    cached = _get_cached(cache_key)
+    cache_key = f"repo_user_commits_v2_{owner}_{repo}_{_user()}"
+    cached = _get_cached(cache_key, refresh=lambda: get_repo_user_commit_count(owner, repo))
     if cached is not None:
         if isinstance(cached, dict):
             return cached.get("count")
@@ -1054,17 +1453,20 @@ def get_repo_user_commit_count(owner: str, repo: str) -> int | None:
         return value
 
     try:
-        contributors = paginated_get(
+        # Contributors come back most-active first, so the user is usually on
+        # page one; stop reading as soon as they are found.
+        saw_contributors = False
+        for contributor in iter_paginated(
             f"repos/{owner}/{repo}/contributors",
             {"anon": "false"},
             per_page=100,
-        )
-        if contributors:
-            for contributor in contributors:
-                login = contributor.get("login", "")
-                if login.lower() == USERNAME.lower():
-                    count = int(contributor.get("contributions", 0))
-                    return _cache_and_return(count)
+        ):
+            saw_contributors = True
+            login = contributor.get("login", "")
+            if login.lower() == _user().lower():
+                count = int(contributor.get("contributions", 0))
+                return _cache_and_return(count)
+        if saw_contributors:
             return _cache_and_return(0)
     except requests.HTTPError as exc:
         status = exc.response.status_code if exc.response is not None else None
@@ -1098,8 +1500,56 @@ def get_repo_user_commit_count(owner: str, repo: str) -> int | None:
         raise
 
 
+def _user_created_year() -> int:
+    """Year the profile user's account was created (immutable, never expires in the cache)."""
+    cache_key = f"user_created_at_{_user()}"
+    created_at = _get_cached(cache_key)
+    if not created_at:
+        data = _graphql_query("query($login: String!) { user(login: $login) { createdAt } }", {"login": _user()})
+        try:
+            created_at = data["user"]["createdAt"]
+        except (TypeError, KeyError):
+            created_at = None
+        if created_at:
+            _set_cached(cache_key, created_at)
+    parsed = parse_iso(created_at)
+    return parsed.year if parsed is not None else 2008
+
+
+def _commit_contributions_by_year(years: list[int]) -> dict[int, int]:
+    """Fetch totalCommitContributions for *years* in one aliased GraphQL document."""
+    if not years:
+        return {}
+    fields = "\n".join(
+        f'    y{year}: contributionsCollection(from: "{year}-01-01T00:00:00Z", to: "{year}-12-31T23:59:59Z") '
+        "{ totalCommitContributions }"
+        for year in years
+    )
+    query = f"""
+    query($login: String!) {{
+      user(login: $login) {{
+{fields}
+      }}
+    }}
+    """
+    data = _graphql_query(query, {"login": _user()})
+    user = (data or {}).get("user") or {}
+    totals: dict[int, int] = {}
+    for year in years:
+        try:
+            totals[year] = int(user[f"y{year}"]["totalCommitContributions"])
+        except (TypeError, KeyError, ValueError):
+            continue
+    return totals
+
+
 def get_total_commit_contributions_via_graphql() -> int | None:
-    """Fallback total commit metric using GraphQL contributionsCollection."""
+    """Fallback total commit metric using GraphQL contributionsCollection.
+
+    Completed years never change, so each is cached under its own key with a
+    TTL_FOREVER policy; only the current year and any uncached past years are
+    queried, all in a single aliased document.
+    """
     cache_key = "total_commit_contributions_graphql_all_time"
     cached = _get_cached(cache_key)
     if cached is not None:
@@ -1108,58 +1558,33 @@ def get_total_commit_contributions_via_graphql() -> int | None:
     if not TOKEN:
         return None
 
-    created_query = """
-    query($login: String!) {
-      user(login: $login) {
-        createdAt
-      }
-    }
-    """
-    created_data = _graphql_query(created_query, {"login": USERNAME})
-    try:
-        created_at = created_data["user"]["createdAt"]
-        start_year = datetime.fromisoformat(created_at.replace("Z", "+00:00")).year
-    except (TypeError, KeyError, ValueError, AttributeError):
-        start_year = 2008
-
     current_year = datetime.now(timezone.utc).year
-    year_query = """
-    query($login: String!, $from: DateTime!, $to: DateTime!) {
-      user(login: $login) {
-        contributionsCollection(from: $from, to: $to) {
-          totalCommitContributions
-        }
-      }
-    }
-    """
-    total = 0
-    saw_value = False
-    for year in range(start_year, current_year + 1):
-        data = _graphql_query(
-            year_query,
-            {
-                "login": USERNAME,
-                "from": f"{year}-01-01T00:00:00Z",
-                "to": f"{year}-12-31T23:59:59Z",
-            },
-        )
-        try:
-            year_total = int(data["user"]["contributionsCollection"]["totalCommitContributions"])
-            total += year_total
-            saw_value = True
-        except (TypeError, KeyError, ValueError):
-            continue
+    totals: dict[int, int] = {}
+    missing: list[int] = []
+    for year in range(_user_created_year(), current_year + 1):
+        past = _get_cached(f"total_commit_contributions_graphql_year_{year}") if year < current_year else None
+        if past is not None:
+            totals[year] = int(past)
+        else:
+            missing.append(year)
 
-    if not saw_value:
+    fetched = _commit_contributions_by_year(missing)
+    for year, year_total in fetched.items():
+        totals[year] = year_total
+        if year < current_year:
+            _set_cached(f"total_commit_contributions_graphql_year_{year}", year_total)
+
+    if not totals:
         return None
 
+    total = sum(totals.values())
     _set_cached(cache_key, total)
     return total
 
 
 def get_total_commits(
     repos: list | None = None,
-    max_workers: int = 4,
+    max_workers: int = FANOUT_MAX_WORKERS,
     use_global_fallback: bool = False,
 ) -> int | None:
     """Count commits authored by USERNAME across the selected repos."""
@@ -1169,7 +1594,10 @@ def get_total_commits(
         "total_commits_v2_owned_public_nonfork_"
         f"{_repo_signature(repos)}_{int(use_global_fallback)}"
     )
-    cached = _get_cached(cache_key)
+    cached = _get_cached(
+        cache_key,
+        refresh=lambda: get_total_commits(repos, max_workers, use_global_fallback),
+    )
     if cached is not None:
         if isinstance(cached, dict):
             return cached.get("total")
@@ -1185,19 +1613,19 @@ def get_total_commits(
     def fetch_one(repo):
         return get_repo_user_commit_count(repo["owner"]["login"], repo["name"])
 
-    with ThreadPoolExecutor(max_workers=max_workers) as pool:
-        futures = {pool.submit(fetch_one, r): r for r in repos}
-        for f in as_completed(futures):
-            repo = futures[f]
-            try:
-                count = f.result()
-                if count is None:
-                    unknown += 1
-                else:
-                    total_known += int(count)
-            except Exception as exc:
-                failures += 1
-                print(f"  Warning: commit count failed for {repo['name']}: {exc}")
+    def per_repo_key(repo):
+        return f"repo_user_commits_v2_{repo['owner']['login']}_{repo['name']}_{_user()}"
+
+    for repo, count, exc in _indexed_fan_out(
+        "commits", fetch_one, repos, max_workers, per_repo_key, prefetch=_prefetch_commit_counts_batched,
+    ):
+        if exc is not None:
+            failures += 1
+            profile_log(f"  Warning: commit count failed for {repo['name']}: {exc}")
+        elif count is None:
+            unknown += 1
+        else:
+            total_known += int(count)
 
     total: int | None
     if not repos:
@@ -1211,7 +1639,7 @@ def get_total_commits(
     if use_global_fallback and repos and total is None:
         fallback_total = get_total_commit_contributions_via_graphql()
         if fallback_total is not None:
-            print("  Info: using GraphQL commit contribution fallback for total commits")
+            profile_log("  Info: using GraphQL commit contribution fallback for total commits")
             total = fallback_total
         else:
             calendar = get_contribution_calendar()
@@ -1221,19 +1649,19 @@ def get_total_commits(
                 except (TypeError, ValueError):
                     calendar_total = 0
                 if calendar_total > 0:
-                    print("  Info: using contribution-calendar fallback for total commits")
+                    profile_log("  Info: using contribution-calendar fallback for total commits")
                     total = calendar_total
 
     _set_cached(cache_key, {"total": total, "unknown_repos": unknown, "failed_repos": failures})
     return total
 
 
-def get_repos_with_ci(repos: list | None = None, max_workers: int = 10) -> int:
+def get_repos_with_ci(repos: list | None = None, max_workers: int = FANOUT_MAX_WORKERS) -> int:
     """Count repos that have CI/CD workflows."""
     if repos is None:
         repos = get_repos()
     cache_key = f"ci_count_{_repo_signature(repos)}"
-    cached = _get_cached(cache_key)
+    cached = _get_cached(cache_key, refresh=lambda: get_repos_with_ci(repos, max_workers))
     if cached is not None:
         return cached
 
@@ -1245,53 +1673,18 @@ def get_repos_with_ci(repos: list | None = None, max_workers: int = 10) -> int:
     count = 0
 
     def check_ci(repo):
-        owner = repo["owner"]["login"]
-        name = repo["name"]
-        per_repo_cache_key = f"repo_ci_state_{owner}_{name}"
-        cached_state = _get_cached(per_repo_cache_key)
-        if cached_state is not None:
-            return bool(cached_state)
-
-        url = f"{API}/repos/{owner}/{name}/contents/.github/workflows"
-        try:
-            resp = _request_with_retry(url)
-        except requests.HTTPError as exc:
-            status = exc.response.status_code if exc.response is not None else None
-            # 404 means the folder does not exist (normal for repos without Actions).
-            if status == 404:
-                _set_cached(per_repo_cache_key, False)
-                return False
-            # 401/403 can occur from token scope restrictions. Retry without auth.
-            if status in {401, 403}:
-                try:
-                    resp = _request_public_with_retry(url)
-                except requests.HTTPError as public_exc:
-                    public_status = public_exc.response.status_code if public_exc.response is not None else None
-                    if public_status == 404:
-                        _set_cached(per_repo_cache_key, False)
-                        return False
-                    return None
-            else:
-                raise
-
-        if resp.status_code == 200:
-            data = resp.json()
-            if isinstance(data, list) and len(data) > 0:
-                _set_cached(per_repo_cache_key, True)
-                return True
-            _set_cached(per_repo_cache_key, False)
-            return False
-        return False
-
-    with ThreadPoolExecutor(max_workers=max_workers) as pool:
-        futures = [pool.submit(check_ci, r) for r in repos]
-        for f in as_completed(futures):
-            try:
-                result = f.result()
-                if result is True:
-                    count += 1
-            except Exception as exc:
-                print(f"  Warning: CI check failed: {exc}")
+        return get_repo_ci_state(repo["owner"]["login"], repo["name"])
+
+    def per_repo_key(repo):
+        return f"repo_ci_state_{repo['owner']['login']}_{repo['name']}"
+
+    for _repo, result, exc in _indexed_fan_out(
+        "ci", check_ci, repos, max_workers, per_repo_key, prefetch=_prefetch_ci_states_batched,
+    ):
+        if exc is not None:
+            profile_log(f"  Warning: CI check failed: {exc}")
+        elif result is True:
+            count += 1
 
     _set_cached(cache_key, count)
     return count
@@ -0,0 +1,144 @@
+"""Adaptive (AIMD) concurrency limit shared by every GitHub request.
+
+Fan-out pools are sized to ``ADAPTIVE_MAX_CONCURRENCY`` and every HTTP call
+in ``github_transport`` takes a slot from one process-wide limiter first, so
+the real request concurrency is decided here rather than by each pool:
+
+* additive increase -- each healthy response adds ``1 / limit``, so the
+  limit grows by about one slot per round of in-flight requests, but only
+  while latency stays within ``LATENCY_TOLERANCE`` times the best latency
+  seen so far;
+* multiplicative decrease -- a 429, a 5xx, a 403 carrying ``Retry-After`` or
+  ``X-RateLimit-Remaining: 0`` (secondary/primary rate limit), or a
+  connection error halves the limit. Simultaneous failures from one burst
+  count once: the limit is cut at most once per ``BACKOFF_COOLDOWN_SECONDS``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Mapping
+
+ADAPTIVE_MIN_CONCURRENCY = 2
+ADAPTIVE_INITIAL_CONCURRENCY = 10
+ADAPTIVE_MAX_CONCURRENCY = 32
+LATENCY_TOLERANCE = 2.0
+BACKOFF_COOLDOWN_SECONDS = 1.0
+_LATENCY_SMOOTHING = 0.2
+# Latency growth below this many seconds is jitter, not degradation.
+_LATENCY_SLACK_SECONDS = 0.05
+
+
+def is_backoff_response(status: int, headers: Mapping[str, str]) -> bool:
+    """True for responses that mean "slow down" (see module docstring)."""
+    if status == 429 or status >= 500:
+        return True
+    if status == 403:
+        return headers.get("Retry-After") is not None or headers.get("X-RateLimit-Remaining") == "0"
+    return False
+
+
+class _Slot:
+    def __init__(self):
+        self._started = time.perf_counter()
+        self.outcome: tuple[int, Mapping[str, str]] | None = None
+
+    def observe(self, status: int, headers: Mapping[str, str]) -> None:
+        self.outcome = (status, headers)
+
+
+class AdaptiveLimiter:
+    """Thread-safe AIMD limit on concurrent requests."""
+
+    def __init__(
+        self,
+        initial: int = ADAPTIVE_INITIAL_CONCURRENCY,
+        *,
+        minimum: int = ADAPTIVE_MIN_CONCURRENCY,
+        maximum: int = ADAPTIVE_MAX_CONCURRENCY,
+    ):
+        self.minimum = max(1, int(minimum))
+        self.maximum = max(self.minimum, int(maximum))
+        self._limit = float(min(self.maximum, max(self.minimum, int(initial))))
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._peak = self._limit
+        self._backoffs = 0
+        self._last_backoff = float("-inf")
+        self._latency: float | None = None
+        self._best_latency: float | None = None
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @contextmanager
+    def slot(self) -> Iterator[_Slot]:
+        """Hold one request slot; call ``observe`` on it with the response.
+
+        A slot left without an observed response (the request raised) counts
+        as a failure.
+        """
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+        slot = _Slot()
+        try:
+            yield slot
+        finally:
+            elapsed = time.perf_counter() - slot._started
+            with self._cond:
+                self._in_flight -= 1
+                if slot.outcome is None:
+                    self._back_off()
+                else:
+                    self._record(*slot.outcome, elapsed)
+                self._cond.notify_all()
+
+    def _record(self, status: int, headers: Mapping[str, str], elapsed: float) -> None:
+        if is_backoff_response(status, headers):
+            self._back_off()
+            return
+        if self._latency is None:
+            self._latency = elapsed
+        else:
+            self._latency += _LATENCY_SMOOTHING * (elapsed - self._latency)
+        if self._best_latency is None or self._latency < self._best_latency:
+            self._best_latency = self._latency
+        healthy = max(LATENCY_TOLERANCE * self._best_latency, self._best_latency + _LATENCY_SLACK_SECONDS)
+        if self._latency <= healthy:
+            self._limit = min(float(self.maximum), self._limit + 1.0 / self._limit)
+            self._peak = max(self._peak, self._limit)
+
+    def _back_off(self) -> None:
+        now = time.monotonic()
+        if now - self._last_backoff < BACKOFF_COOLDOWN_SECONDS:
+            return
+        self._last_backoff = now
+        self._backoffs += 1
+        self._limit = max(float(self.minimum), self._limit / 2)
+
+    def stats(self) -> dict[str, float]:
+        with self._cond:
+            return {
+                "limit": self.limit,
+                "peak": int(self._peak),
+                "backoffs": self._backoffs,
+                "in_flight": self._in_flight,
+            }
+
+
+_LIMITER = AdaptiveLimiter()
+
+
+def adaptive_limiter() -> AdaptiveLimiter:
+    """The process-wide limiter every transport request goes through."""
+    return _LIMITER
+
+
+def concurrency_stats() -> dict[str, float]:
+    """Current limit, peak limit, backoff count and in-flight requests."""
+    return _LIMITER.stats()
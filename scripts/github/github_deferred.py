@@ -0,0 +1,103 @@
+"""Deferred results for endpoints that answer ``202 Accepted`` while computing.
+
+GitHub's ``/repos/{o}/{r}/stats/*`` endpoints start generating statistics on
+the first request and answer ``202`` until they are ready. A ``DeferredPoller``
+takes over such a request: it polls on a small background pool with
+exponential backoff until the endpoint yields a value or the deadline passes,
+so the caller can fire every request early and collect the results later.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Any, Callable
+
+from scripts.core.config import profile_log
+
+# A poll function returns the value once ready, or None while still pending.
+PollFn = Callable[[], Any]
+
+
+class DeferredPoller:
+    """Poll pending results in the background; see the module docstring."""
+
+    def __init__(
+        self,
+        *,
+        initial_delay: float = 1.0,
+        max_delay: float = 8.0,
+        deadline: float = 30.0,
+        max_workers: int = 8,
+    ):
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._pool: ThreadPoolExecutor | None = None
+        self._futures: dict[str, Future] = {}
+
+    def submit(self, key: str, poll: PollFn) -> Future:
+        """Start polling *key* unless it already is; return its future.
+
+        The future resolves to the polled value, or ``None`` when the deadline
+        passed or a poll raised. An unresolved key is forgotten once its poll
+        ends, so a later ``submit`` starts polling it again.
+        """
+        with self._lock:
+            existing = self._futures.get(key)
+            if existing is not None:
+                return existing
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="deferred-poll")
+            # Keep the caller's rate-budget step and profile user.
+            future = self._pool.submit(contextvars.copy_context().run, self._poll, key, poll, time.monotonic())
+            self._futures[key] = future
+        # Outside the lock: the callback runs at once if the poll already ended.
+        future.add_done_callback(lambda done: self._forget_unresolved(key, done))
+        return future
+
+    def _forget_unresolved(self, key: str, future: Future) -> None:
+        if future.cancelled() or future.exception() is not None or future.result() is None:
+            with self._lock:
+                if self._futures.get(key) is future:
+                    del self._futures[key]
+
+    def _poll(self, key: str, poll: PollFn, started: float) -> Any:
+        delay = self.initial_delay
+        while True:
+            remaining = started + self.deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            time.sleep(min(delay, remaining))
+            try:
+                value = poll()
+            except Exception as exc:
+                profile_log(f"  Warning: deferred poll for {key} failed: {exc}")
+                return None
+            if value is not None:
+                return value
+            delay = min(self.max_delay, delay * 2)
+
+    def tracking(self, key: str) -> bool:
+        with self._lock:
+            return key in self._futures
+
+    def result(self, key: str, timeout: float | None = None) -> Any:
+        """Wait for *key*'s poll (at most *timeout* seconds); ``None`` if unresolved."""
+        with self._lock:
+            future = self._futures.get(key)
+        if future is None:
+            return None
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeout:
+            return None
+
+    def pending(self) -> int:
+        with self._lock:
+            return sum(1 for future in self._futures.values() if not future.done())
@@ -0,0 +1,168 @@
+"""Append-only local log of public GitHub events.
+
+``/users/{user}/events/public`` only ever exposes the newest 300 events, and
+every run used to re-download all of them. The log keeps every event it has
+seen, keyed by event id. A run then only needs the pages above the high-water
+mark, and history reaches back past the API horizon at no extra API cost.
+
+Layout under ``<cache_dir>/event_log/<username>/``:
+
+* ``events.jsonl`` -- one event per line, in the order it was appended (oldest
+  first). Lines are never rewritten; only a compaction past
+  ``EVENT_LOG_MAX_EVENTS`` drops the oldest ones.
+* ``state.json`` -- the high-water id plus aggregates that are folded in as
+  events are appended, so they cover the full history even after compaction:
+  event counts per UTC hour and type (the activity rhythm re-buckets these
+  into the profile timezone), release timestamps and merged-PR timestamps.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Iterable
+
+from scripts.core.settings import Settings
+
+# Events kept on disk; aggregates in state.json are never truncated.
+EVENT_LOG_MAX_EVENTS = 5000
+_STATE_VERSION = 1
+
+_LOCK = threading.Lock()
+
+
+def event_id(event: dict[str, Any]) -> int | None:
+    try:
+        return int(event.get("id"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _empty_state() -> dict[str, Any]:
+    return {
+        "version": _STATE_VERSION,
+        "high_water_id": 0,
+        "event_count": 0,
+        "hourly": {},
+        "release_times": [],
+        "merged_pr_times": [],
+    }
+
+
+def _fold(state: dict[str, Any], event: dict[str, Any]) -> None:
+    """Fold one new event into the aggregates."""
+    created_at = str(event.get("created_at", ""))
+    event_type = str(event.get("type", ""))
+    state["event_count"] += 1
+    if created_at and event_type:
+        # "2026-10-16T13:05:00Z" -> "2026-10-16T13"
+        bucket = state["hourly"].setdefault(created_at[:13], {})
+        bucket[event_type] = bucket.get(event_type, 0) + 1
+    if not created_at:
+        return
+    if event_type == "ReleaseEvent":
+        state["release_times"].append(created_at)
+    elif event_type == "PullRequestEvent":
+        payload = event.get("payload", {}) or {}
+        if payload.get("action") == "closed" and (payload.get("pull_request", {}) or {}).get("merged"):
+            state["merged_pr_times"].append(created_at)
+
+
+class EventLog:
+    """Event log rooted at *directory*; see the module docstring for the layout."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self._events_path = self.directory / "events.jsonl"
+        self._state_path = self.directory / "state.json"
+
+    def _read_state(self) -> dict[str, Any]:
+        try:
+            state = json.loads(self._state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return _empty_state()
+        if not isinstance(state, dict) or state.get("version") != _STATE_VERSION:
+            return _empty_state()
+        return state
+
+    def _write_state(self, state: dict[str, Any]) -> None:
+        tmp = self._state_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp, self._state_path)
+
+    def high_water_id(self) -> int:
+        """Id of the newest event in the log (0 when empty)."""
+        return int(self._read_state().get("high_water_id", 0) or 0)
+
+    def aggregates(self) -> dict[str, Any]:
+        """Aggregates over every event ever appended."""
+        state = self._read_state()
+        return {
+            "event_count": state["event_count"],
+            "hourly": state["hourly"],
+            "release_times": list(state["release_times"]),
+            "merged_pr_times": list(state["merged_pr_times"]),
+        }
+
+    def events(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """Logged events, newest first (the API's order)."""
+        rows: list[dict[str, Any]] = []
+        try:
+            with self._events_path.open(encoding="utf-8") as fh:
+                for line in fh:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        rows.append(json.loads(line))
+                    except ValueError:
+                        continue  # torn final line from an interrupted append
+        except OSError:
+            return []
+        rows.reverse()
+        return rows if limit is None else rows[:limit]
+
+    def append(self, new_events: Iterable[dict[str, Any]]) -> int:
+        """Append events newer than the high-water mark; return how many were added.
+
+        *new_events* may be in any order and may overlap what is already logged.
+        """
+        with _LOCK:
+            state = self._read_state()
+            high_water = int(state.get("high_water_id", 0) or 0)
+            fresh: dict[int, dict[str, Any]] = {}
+            for event in new_events:
+                eid = event_id(event)
+                if eid is not None and eid > high_water:
+                    fresh[eid] = event
+            if not fresh:
+                return 0
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with self._events_path.open("a", encoding="utf-8") as fh:
+                for eid in sorted(fresh):
+                    fh.write(json.dumps(fresh[eid], separators=(",", ":")) + "\n")
+                    _fold(state, fresh[eid])
+            state["high_water_id"] = max(fresh)
+            self._write_state(state)
+            if state["event_count"] > EVENT_LOG_MAX_EVENTS:
+                self._compact()
+            return len(fresh)
+
+    def _compact(self) -> None:
+        # Keep the newest EVENT_LOG_MAX_EVENTS events once the file doubles
+        # past the cap. The aggregates already cover the dropped ones.
+        kept = self.events()
+        if len(kept) <= 2 * EVENT_LOG_MAX_EVENTS:
+            return
+        kept = kept[:EVENT_LOG_MAX_EVENTS]
+        tmp = self._events_path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as fh:
+            for event in reversed(kept):
+                fh.write(json.dumps(event, separators=(",", ":")) + "\n")
+        os.replace(tmp, self._events_path)
+
+
+def event_log(settings: Settings, username: str) -> EventLog:
+    return EventLog(settings.cache_dir / "event_log" / username)
@@ -2,47 +2,109 @@
 
 from __future__ import annotations
 
+import json
+import os
+
 import requests
 
 from scripts.core.settings import Settings
-from scripts.github.github_transport import _auth_headers_for_token, candidate_tokens
+from scripts.github.github_ratelimit import rate_budget, token_key
+from scripts.github.github_transport import _auth_headers_for_token, candidate_tokens, http_post
+
+GRAPHQL_ENDPOINT = (
+    os.environ.get("GITHUB_GRAPHQL_URL", "").strip()
+    or (os.environ.get("GITHUB_API_URL", "").strip().rstrip("/") or "https://api.github.com") + "/graphql"
+)
 
-GRAPHQL_ENDPOINT = "https://api.github.com/graphql"
+# Aliased repository lookups folded into one batched document.
+MAX_BATCH_ALIASES = 40
+# Upper bound on connection nodes a batched document may request. GitHub's hard
+# limit is 500k; staying far below it keeps each batch well under the
+# 5000-point per-query cost ceiling.
+MAX_BATCH_NODES = 10_000
 
 
 def graphql_query(
     query: str,
     variables: dict,
     settings: Settings,
+    *,
+    allow_partial: bool = False,
 ) -> dict | None:
     """Execute a GraphQL query against the GitHub API.
 
     Returns the ``data`` portion of the response, or ``None`` on any error.
     On a 401 (e.g. an expired PERSONAL_GITHUB_TOKEN) the next available token
-    is tried before giving up.
+    is tried before giving up. Queries that select ``rateLimit { cost remaining
+    resetAt }`` have that cost charged to the rate budget. With
+    *allow_partial*, a response carrying both ``data`` and ``errors`` (e.g. one
+    missing repository in a batched document) still returns its ``data``.
     """
-    tokens = candidate_tokens(settings)
+    budget = rate_budget()
+    tokens = budget.order_tokens(candidate_tokens(settings), "graphql")
     for idx, token in enumerate(tokens):
+        key = token_key(token)
+        budget.before_request(key, "graphql")
         try:
-            resp = requests.post(
+            resp = http_post(
                 GRAPHQL_ENDPOINT,
                 headers=_auth_headers_for_token(token),
                 json={"query": query, "variables": variables},
             )
         except requests.RequestException:
             return None
-        if resp.status_code == 401 and idx < len(tokens) - 1:
-            continue
         if resp.status_code != 200:
+            budget.record(key, "graphql", resp.headers, status=resp.status_code)
+            if resp.status_code == 401 and idx < len(tokens) - 1:
+                continue
             return None
 
         try:
             payload = resp.json()
         except ValueError:
-            return None
+            payload = None
+        data = payload.get("data") if isinstance(payload, dict) else None
+        cost = None
+        if isinstance(data, dict) and isinstance(data.get("rateLimit"), dict):
+            cost = budget.record_graphql_cost(key, data["rateLimit"])
+        budget.record(key, "graphql", resp.headers, status=resp.status_code, cost=cost)
         if not isinstance(payload, dict):
             return None
-        if payload.get("errors"):
+        if payload.get("errors") and not (allow_partial and isinstance(data, dict)):
             return None
-        return payload.get("data")
+        return data
     return None
+
+
+def graphql_repository_batch(
+    repos: list[tuple[str, str]],
+    fields: str,
+    settings: Settings,
+    *,
+    variable_decls: str = "",
+    variables: dict | None = None,
+    nodes_per_repo: int = 1,
+) -> dict[tuple[str, str], dict | None]:
+    """Look up many repositories with aliased ``rN: repository(...)`` documents.
+
+    *fields* is the selection set applied to every repository. Repos are split
+    into chunks bounded by ``MAX_BATCH_ALIASES`` and by ``MAX_BATCH_NODES`` given
+    *nodes_per_repo* (the connection nodes each selection can return). The
+    result maps every requested ``(owner, name)`` to its repository object, or
+    ``None`` when that repo (or its whole chunk) could not be resolved.
+    """
+    per_chunk = max(1, min(MAX_BATCH_ALIASES, MAX_BATCH_NODES // max(1, nodes_per_repo)))
+    header = f"query({variable_decls})" if variable_decls else "query"
+    results: dict[tuple[str, str], dict | None] = {}
+    for start in range(0, len(repos), per_chunk):
+        chunk = repos[start : start + per_chunk]
+        aliases = "\n".join(
+            f"  r{idx}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{ {fields} }}"
+            for idx, (owner, name) in enumerate(chunk)
+        )
+        document = f"{header} {{\n{aliases}\n  rateLimit {{ cost remaining resetAt }}\n}}"
+        data = graphql_query(document, dict(variables or {}), settings, allow_partial=True)
+        for idx, repo in enumerate(chunk):
+            node = data.get(f"r{idx}") if isinstance(data, dict) else None
+            results[repo] = node if isinstance(node, dict) else None
+    return results
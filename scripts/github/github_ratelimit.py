@@ -0,0 +1,244 @@
+"""Process-wide GitHub rate-limit budget.
+
+Every REST and GraphQL request reports its ``X-RateLimit-*`` headers (and the
+GraphQL ``rateLimit { cost remaining resetAt }`` field when a query asks for
+it) here. The budget throttles callers before a token runs dry, tries
+candidate tokens in the caller's order with exhausted ones moved last, and
+attributes spend to the pipeline step that made each call.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Iterator, Mapping
+
+# Requests kept in hand per token/resource window; below this we wait for reset.
+RESERVE_REQUESTS = 25
+# Below this fraction of the window limit, requests are paced evenly until reset.
+PACE_FRACTION = 0.10
+# Never sleep longer than this for a single request: a longer wait is cut to
+# this, and the request then goes out (and may fail over to another token or
+# cached data).
+MAX_THROTTLE_SECONDS = 90.0
+
+_STEP: contextvars.ContextVar[str] = contextvars.ContextVar("github_rate_step", default="unscoped")
+
+
+def token_key(token: str) -> str:
+    """Stable, non-reversible label for a token (never store the token itself)."""
+    if not token:
+        return "anonymous"
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:10]
+
+
+def token_key_from_headers(headers: Mapping[str, str]) -> str:
+    auth = headers.get("Authorization", "")
+    return token_key(auth.split(" ", 1)[1] if " " in auth else auth)
+
+
+def resource_for_url(url: str) -> str:
+    """GitHub rate-limit resource bucket a request URL is charged against."""
+    if url.rstrip("/").endswith("/graphql"):
+        return "graphql"
+    if "/search/" in url:
+        return "search"
+    return "core"
+
+
+@dataclass
+class _Window:
+    limit: int | None = None
+    remaining: int | None = None
+    reset: float | None = None
+    # When the next paced request on this window may start (shared by threads).
+    next_slot: float = 0.0
+
+
+class RateBudget:
+    """Thread-safe budget tracker shared by every GitHub call in the process."""
+
+    def __init__(self, *, sleep: Callable[[float], None] = time.sleep, clock: Callable[[], float] = time.time):
+        self._sleep = sleep
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._windows: dict[tuple[str, str], _Window] = {}
+        self._steps: dict[str, dict[str, Any]] = {}
+
+    # ── throttling ──────────────────────────────────────────────────
+    def _wait_seconds(self, window: _Window, now: float) -> float:
+        if window.remaining is None or window.reset is None:
+            return 0.0
+        until_reset = max(0.0, window.reset - now)
+        if until_reset <= 0:
+            return 0.0
+        if window.remaining <= RESERVE_REQUESTS:
+            return until_reset + 1.0
+        if window.limit and window.remaining < window.limit * PACE_FRACTION:
+            return until_reset / window.remaining
+        return 0.0
+
+    def before_request(self, key: str, resource: str) -> float:
+        """Block (bounded) when *key* is low on budget; return seconds slept.
+
+        Waits are assigned under the lock from the window's ``next_slot``, so
+        concurrent callers queue one pacing interval behind each other instead
+        of all sleeping the same interval and firing together.
+        """
+        with self._lock:
+            window = self._windows.setdefault((key, resource), _Window())
+            now = self._clock()
+            wait = self._wait_seconds(window, now)
+            if wait > 0:
+                if window.remaining is not None and window.remaining > RESERVE_REQUESTS:
+                    wait += max(0.0, window.next_slot - now)
+                wait = min(wait, MAX_THROTTLE_SECONDS)
+                window.next_slot = max(window.next_slot, now + wait)
+            if window.remaining is not None:
+                # Reserve one unit now so concurrent callers see the spend.
+                window.remaining -= 1
+        if wait > 0:
+            self._sleep(wait)
+            with self._lock:
+                self._step_entry(_STEP.get())["throttled_seconds"] += wait
+        return wait
+
+    def order_tokens(self, tokens: tuple[str, ...], resource: str) -> tuple[str, ...]:
+        """Keep the caller's token order, moving exhausted tokens to the back.
+
+        Tokens are not interchangeable: the PAT sees private repos and
+        contributions that the GITHUB_TOKEN fallback cannot, so requests are
+        never rotated across them by remaining budget. A token is demoted only
+        once it is down to its reserve for *resource*.
+        """
+        if len(tokens) < 2:
+            return tokens
+        now = self._clock()
+        with self._lock:
+            exhausted = {token: self._is_exhausted(self._windows.get((token_key(token), resource)), now) for token in tokens}
+        return tuple(sorted(tokens, key=lambda token: exhausted[token]))
+
+    @staticmethod
+    def _is_exhausted(window: _Window | None, now: float) -> bool:
+        if window is None or window.remaining is None or window.reset is None:
+            return False
+        return window.remaining <= RESERVE_REQUESTS and window.reset > now
+
+    # ── accounting ──────────────────────────────────────────────────
+    def record(
+        self,
+        key: str,
+        resource: str,
+        headers: Mapping[str, str] | None,
+        *,
+        status: int | None = None,
+        cost: int | None = None,
+    ) -> None:
+        """Update the window for *key* from response headers and charge the step."""
+        headers = headers or {}
+        resource = str(headers.get("X-RateLimit-Resource") or resource)
+        with self._lock:
+            window = self._windows.setdefault((key, resource), _Window())
+            limit = _int_or_none(headers.get("X-RateLimit-Limit"))
+            remaining = _int_or_none(headers.get("X-RateLimit-Remaining"))
+            reset = _int_or_none(headers.get("X-RateLimit-Reset"))
+            if limit is not None:
+                window.limit = limit
+            if remaining is not None:
+                window.remaining = remaining
+            if reset is not None:
+                window.reset = float(reset)
+            entry = self._step_entry(_STEP.get())
+            entry["requests"] += 1
+            # Authorized conditional requests answered with 304 are free.
+            charged = 0 if status == 304 else (cost if cost is not None else 1)
+            entry["cost"][resource] = entry["cost"].get(resource, 0) + charged
+
+    def record_graphql_cost(self, key: str, rate_limit: Mapping[str, Any]) -> int | None:
+        """Apply a GraphQL ``rateLimit`` object; return its ``cost`` when present."""
+        remaining = _int_or_none(rate_limit.get("remaining"))
+        reset_at = rate_limit.get("resetAt")
+        reset: float | None = None
+        if isinstance(reset_at, str) and reset_at:
+            try:
+                reset = datetime.fromisoformat(reset_at.replace("Z", "+00:00")).timestamp()
+            except ValueError:
+                reset = None
+        with self._lock:
+            window = self._windows.setdefault((key, "graphql"), _Window())
+            if remaining is not None:
+                window.remaining = remaining
+            if reset is not None:
+                window.reset = reset
+        return _int_or_none(rate_limit.get("cost"))
+
+    def _step_entry(self, step: str) -> dict[str, Any]:
+        return self._steps.setdefault(step, {"requests": 0, "cost": {}, "throttled_seconds": 0.0})
+
+    def report(self) -> dict[str, Any]:
+        """Spend per pipeline step plus the last-seen window for each token."""
+        with self._lock:
+            return {
+                "steps": {
+                    step: {
+                        "requests": entry["requests"],
+                        "cost": dict(entry["cost"]),
+                        "throttled_seconds": round(entry["throttled_seconds"], 3),
+                    }
+                    for step, entry in self._steps.items()
+                },
+                "windows": [
+                    {
+                        "token": key,
+                        "resource": resource,
+                        "limit": window.limit,
+                        "remaining": window.remaining,
+                        "reset": window.reset,
+                    }
+                    for (key, resource), window in sorted(self._windows.items())
+                ],
+            }
+
+
+def _int_or_none(value) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+_BUDGET = RateBudget()
+
+
+def rate_budget() -> RateBudget:
+    """Return the process-wide budget."""
+    return _BUDGET
+
+
+@contextmanager
+def budget_step(name: str) -> Iterator[None]:
+    """Attribute every GitHub call made inside the block to pipeline step *name*."""
+    token = _STEP.set(name)
+    try:
+        yield
+    finally:
+        _STEP.reset(token)
+
+
+def bind_step(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap *fn* so worker threads charge the step that was active at bind time.
+
+    The whole bind-time context is carried over (e.g. the profile user of a
+    batch build); each call runs in its own copy, so concurrent calls are safe.
+    """
+    context = contextvars.copy_context()
+
+    def run(*args, **kwargs):
+        return context.copy().run(fn, *args, **kwargs)
+
+    return run
@@ -0,0 +1,85 @@
+"""Per-repo change index for the repo fan-outs.
+
+The aggregate cache keys (``ci_count_{sig}``, ``releases_last_{days}_{sig}``,
+``total_commits_v2_..._{sig}``) hash ``pushed_at`` over the whole repo list,
+so one push invalidates them for every repo. The index remembers, per repo,
+the ``pushed_at``/``updated_at`` stamp it last saw together with the last
+per-repo result of each fan-out (commit count, CI state, languages, release
+count). When an aggregate is rebuilt, repos whose stamp has not moved answer
+from the index and only the changed ones are probed again.
+
+The index is one cache entry (``repo_change_index``) holding
+``{"owner/name": {"stamp": ..., "fields": {field: value}}}``. A moved stamp
+drops every field recorded for that repo.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+_MISSING = object()
+
+
+def repo_id(repo: dict) -> str:
+    owner = (repo.get("owner") or {}).get("login", "")
+    return f"{owner}/{repo.get('name', '')}"
+
+
+def repo_stamp(repo: dict) -> str:
+    """``pushed_at|updated_at`` to the second; empty when neither is known."""
+    pushed = str(repo.get("pushed_at") or "")[:19]
+    updated = str(repo.get("updated_at") or "")[:19]
+    return f"{pushed}|{updated}" if pushed or updated else ""
+
+
+class RepoChangeIndex:
+    """In-memory view of the persisted index; see the module docstring."""
+
+    def __init__(self, data: dict | None = None):
+        self._repos: dict[str, dict[str, Any]] = {}
+        if isinstance(data, dict):
+            for key, entry in data.items():
+                if isinstance(entry, dict) and isinstance(entry.get("fields"), dict):
+                    self._repos[key] = {"stamp": str(entry.get("stamp", "")), "fields": dict(entry["fields"])}
+
+    def lookup(self, repo: dict, field: str, default=None):
+        """The recorded *field* for *repo* if its stamp has not moved, else *default*."""
+        stamp = repo_stamp(repo)
+        entry = self._repos.get(repo_id(repo))
+        if not stamp or entry is None or entry["stamp"] != stamp:
+            return default
+        return entry["fields"].get(field, default)
+
+    def moved(self, repo: dict) -> bool:
+        """True when *repo* was indexed before under a different stamp."""
+        entry = self._repos.get(repo_id(repo))
+        return entry is not None and entry["stamp"] != repo_stamp(repo)
+
+    def record(self, repo: dict, field: str, value: Any) -> None:
+        stamp = repo_stamp(repo)
+        if not stamp:
+            return
+        key = repo_id(repo)
+        entry = self._repos.get(key)
+        if entry is None or entry["stamp"] != stamp:
+            entry = self._repos[key] = {"stamp": stamp, "fields": {}}
+        entry["fields"][field] = value
+
+    def split(self, repos: list, field: str, reusable=None) -> tuple[list[tuple[dict, Any]], list[dict]]:
+        """Partition *repos* into ``(known, changed)``.
+
+        ``known`` pairs each unchanged repo with its recorded value; *reusable*
+        may veto a recorded value (e.g. one computed for another day's window).
+        """
+        known: list[tuple[dict, Any]] = []
+        changed: list[dict] = []
+        for repo in repos:
+            value = self.lookup(repo, field, _MISSING)
+            if value is _MISSING or (reusable is not None and not reusable(value)):
+                changed.append(repo)
+            else:
+                known.append((repo, value))
+        return known, changed
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        return {key: {"stamp": e["stamp"], "fields": dict(e["fields"])} for key, e in self._repos.items()}
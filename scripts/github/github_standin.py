@@ -0,0 +1,559 @@
+"""Local stand-in for the slice of the GitHub API that ``github_client`` uses.
+
+For load tests: point the client at it with ``GITHUB_API_URL`` and
+``GITHUB_GRAPHQL_URL`` and it answers from a synthetic account of any size,
+with configurable latency, error rate and rate limiting, without spending real
+quota. Start it with ``profile_cli.py github-standin`` or ``GitHubStandin``.
+
+Emulated endpoints:
+
+* REST: ``/users/{u}/repos``, ``/users/{u}/events/public``,
+  ``/repos/{o}/{r}/{contributors,commits,releases,languages}``,
+  ``/repos/{o}/{r}/contents/.github/workflows``,
+  ``/repos/{o}/{r}/stats/participation`` (``202`` for the first
+  ``participation_pending`` calls per repo) and ``/search/issues``. Lists
+  paginate with ``per_page``/``page`` and ``Link`` headers. ``GET`` bodies
+  carry an ``ETag`` and honour ``If-None-Match``.
+* GraphQL: ``user { id createdAt }``, ``repositories`` listings and aliased
+  ``totalCount`` lookups, ``contributionsCollection`` calendars and aliased
+  ``totalCommitContributions``, and aliased ``rN: repository(...)`` batches
+  selecting commit history, ``.github/workflows`` and releases. Queries are
+  matched by shape, not parsed; anything else gets a GraphQL error.
+
+The account is deterministic for a given ``StandinConfig.seed``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+_LANGUAGES = ("Python", "TypeScript", "Go", "Rust", "Shell", "HTML", "C++", "Java")
+_EVENT_TYPES = ("PushEvent", "PullRequestEvent", "CreateEvent", "IssuesEvent", "ReleaseEvent", "WatchEvent")
+_EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class StandinConfig:
+    username: str = "standin-user"
+    repos: int = 100
+    fork_ratio: float = 0.1
+    workflow_ratio: float = 0.6
+    contributors_per_repo: int = 3
+    max_user_commits: int = 400
+    max_releases_per_repo: int = 4
+    events: int = 300
+    # Seconds added before every response.
+    latency: float = 0.0
+    # Probability that a request answers 502 instead.
+    error_rate: float = 0.0
+    # Requests per resource per window before 403s; None disables limiting.
+    rate_limit: int | None = None
+    rate_limit_window: int = 3600
+    # 202 answers per repo before /stats/participation returns data.
+    participation_pending: int = 1
+    seed: int = 0
+
+
+def _iso(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+@dataclass
+class _Repo:
+    name: str
+    fork: bool
+    created_at: datetime
+    pushed_at: datetime
+    languages: dict[str, int]
+    workflows: list[str]
+    user_commits: int
+    contributors: list[dict[str, Any]]
+    releases: list[datetime]
+    participation: list[int]
+
+
+@dataclass
+class SyntheticAccount:
+    """Everything the stand-in serves, generated from a ``StandinConfig``."""
+
+    config: StandinConfig
+    repos: list[_Repo] = field(default_factory=list)
+    events: list[dict[str, Any]] = field(default_factory=list)
+    by_name: dict[str, _Repo] = field(default_factory=dict)
+
+    @classmethod
+    def generate(cls, config: StandinConfig) -> "SyntheticAccount":
+        rng = random.Random(config.seed)
+        account = cls(config)
+        user = config.username
+        for idx in range(max(0, config.repos)):
+            created = _EPOCH - timedelta(days=idx % 3000, hours=idx % 24)
+            pushed = created + timedelta(days=rng.randint(0, 400))
+            user_commits = rng.randint(0, max(0, config.max_user_commits))
+            others = [
+                {"login": f"contrib-{rng.randint(0, 999):03d}", "contributions": rng.randint(1, 200)}
+                for _ in range(max(0, config.contributors_per_repo - 1))
+            ]
+            contributors = sorted(
+                [{"login": user, "contributions": user_commits}, *others] if user_commits else others,
+                key=lambda c: -c["contributions"],
+            )
+            langs = rng.sample(_LANGUAGES, rng.randint(1, 3))
+            account.repos.append(
+                _Repo(
+                    name=f"repo-{idx:05d}",
+                    fork=rng.random() < config.fork_ratio,
+                    created_at=created,
+                    pushed_at=min(pushed, _EPOCH),
+                    languages={lang: rng.randint(1_000, 500_000) for lang in langs},
+                    workflows=["ci.yml"] if rng.random() < config.workflow_ratio else [],
+                    user_commits=user_commits,
+                    contributors=contributors,
+                    releases=sorted(
+                        (_EPOCH - timedelta(days=rng.randint(0, 720)) for _ in range(rng.randint(0, config.max_releases_per_repo))),
+                        reverse=True,
+                    ),
+                    participation=[rng.randint(0, 12) for _ in range(52)],
+                )
+            )
+        account.by_name = {repo.name: repo for repo in account.repos}
+        for idx in range(max(0, config.events)):
+            repo = account.repos[idx % len(account.repos)] if account.repos else None
+            event_type = _EVENT_TYPES[idx % len(_EVENT_TYPES)]
+            payload: dict[str, Any] = {}
+            if event_type == "PushEvent":
+                payload = {"size": 1, "commits": [{"sha": f"{idx:040x}", "message": "synthetic commit"}]}
+            elif event_type == "PullRequestEvent":
+                payload = {"action": "closed", "pull_request": {"merged": idx % 2 == 0, "title": "synthetic PR"}}
+            elif event_type == "ReleaseEvent":
+                payload = {"action": "published", "release": {"tag_name": f"v{idx}", "html_url": ""}}
+            account.events.append(
+                {
+                    "id": str(90_000_000 - idx),
+                    "type": event_type,
+                    "actor": {"login": user},
+                    "repo": {"name": f"{user}/{repo.name if repo else 'none'}"},
+                    "payload": payload,
+                    "created_at": _iso(_EPOCH - timedelta(hours=idx * 3)),
+                }
+            )
+        return account
+
+    def repo(self, owner: str, name: str) -> _Repo | None:
+        if owner.lower() != self.config.username.lower():
+            return None
+        return self.by_name.get(name)
+
+    def daily_contributions(self, day: date) -> int:
+        return random.Random(f"{self.config.seed}-{day.isoformat()}").choice((0, 0, 1, 2, 3, 5, 8))
+
+    # ── REST shapes ───────────────────────────────────────────────────
+
+    def rest_repo(self, repo: _Repo) -> dict[str, Any]:
+        user = self.config.username
+        return {
+            "name": repo.name,
+            "full_name": f"{user}/{repo.name}",
+            "owner": {"login": user},
+            "fork": repo.fork,
+            "private": False,
+            "visibility": "public",
+            "description": f"Synthetic repository {repo.name}",
+            "html_url": f"https://github.com/{user}/{repo.name}",
+            "created_at": _iso(repo.created_at),
+            "pushed_at": _iso(repo.pushed_at),
+            "updated_at": _iso(repo.pushed_at),
+            "stargazers_count": sum(repo.participation) % 50,
+            "forks_count": len(repo.contributors),
+            "language": next(iter(repo.languages)),
+        }
+
+    # ── GraphQL shapes ────────────────────────────────────────────────
+
+    def graphql_repo(self, repo: _Repo) -> dict[str, Any]:
+        user = self.config.username
+        return {
+            "name": repo.name,
+            "isFork": repo.fork,
+            "isPrivate": False,
+            "visibility": "PUBLIC",
+            "description": f"Synthetic repository {repo.name}",
+            "url": f"https://github.com/{user}/{repo.name}",
+            "pushedAt": _iso(repo.pushed_at),
+            "updatedAt": _iso(repo.pushed_at),
+            "createdAt": _iso(repo.created_at),
+            "stargazerCount": sum(repo.participation) % 50,
+            "forkCount": len(repo.contributors),
+            "owner": {"login": user},
+            "primaryLanguage": {"name": next(iter(repo.languages))},
+            "defaultBranchRef": {"target": {"__typename": "Commit", "messageHeadline": "synthetic commit"}},
+            "workflowsDir": (
+                {"__typename": "Tree", "entries": [{"name": n} for n in repo.workflows]} if repo.workflows else None
+            ),
+            "languages": {
+                "edges": [{"size": size, "node": {"name": lang}} for lang, size in repo.languages.items()]
+            },
+        }
+
+
+class _RateLimiter:
+    def __init__(self, limit: int | None, window: int):
+        self.limit = limit
+        self.window = max(1, window)
+        self._lock = threading.Lock()
+        self._reset_at = time.time() + self.window
+        self._used: dict[str, int] = {}
+
+    def charge(self, resource: str) -> tuple[bool, dict[str, str]]:
+        """Charge one request; return (allowed, X-RateLimit-* headers)."""
+        if self.limit is None:
+            return True, {}
+        with self._lock:
+            now = time.time()
+            if now >= self._reset_at:
+                self._reset_at = now + self.window
+                self._used.clear()
+            used = self._used[resource] = self._used.get(resource, 0) + 1
+            reset_at = int(self._reset_at)
+        headers = {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(max(0, self.limit - used)),
+            "X-RateLimit-Used": str(min(used, self.limit)),
+            "X-RateLimit-Reset": str(reset_at),
+            "X-RateLimit-Resource": resource,
+        }
+        return used <= self.limit, headers
+
+
+_ALIAS_REPO_RE = re.compile(r'(\w+):\s*repository\(owner:\s*"([^"]+)",\s*name:\s*"([^"]+)"\)')
+_ALIAS_REPOS_RE = re.compile(r"(\w+):\s*repositories\(([^)]*)\)")
+_ALIAS_YEAR_RE = re.compile(r'(\w+):\s*contributionsCollection\(from:\s*"([^"]+)",\s*to:\s*"([^"]+)"\)')
+
+
+def _parse_when(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_StandinHTTPServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # noqa: A002 - BaseHTTPRequestHandler signature
+        pass
+
+    # ── plumbing ──────────────────────────────────────────────────────
+
+    def _send(self, status: int, payload: Any, headers: dict[str, str] | None = None) -> None:
+        body = b"" if status == 304 else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _admit(self, route: str, resource: str) -> dict[str, str] | None:
+        """Apply latency, injected errors and rate limiting; None means answered."""
+        standin = self.server.standin
+        standin.count(route)
+        if standin.config.latency:
+            time.sleep(standin.config.latency)
+        allowed, headers = standin.limiter.charge(resource)
+        if not allowed:
+            self._send(403, {"message": "API rate limit exceeded (stand-in)"}, headers)
+            return None
+        if standin.config.error_rate and standin.roll() < standin.config.error_rate:
+            self._send(502, {"message": "Server Error (stand-in)"}, headers)
+            return None
+        return headers
+
+    def _page(self, items: list, query: dict[str, list[str]], path: str, headers: dict[str, str]) -> None:
+        per_page = max(1, min(100, int((query.get("per_page") or ["30"])[0])))
+        page = max(1, int((query.get("page") or ["1"])[0]))
+        last = max(1, -(-len(items) // per_page))
+        links = []
+        base = {k: v[0] for k, v in query.items()}
+        host = f"http://{self.headers.get('Host', 'localhost')}"
+        if page < last:
+            links.append(f'<{host}{path}?{urlencode({**base, "page": page + 1})}>; rel="next"')
+            links.append(f'<{host}{path}?{urlencode({**base, "page": last})}>; rel="last"')
+        if links:
+            headers = {**headers, "Link": ", ".join(links)}
+        self._send_get(items[(page - 1) * per_page : page * per_page], headers)
+
+    def _send_get(self, payload: Any, headers: dict[str, str], status: int = 200) -> None:
+        etag = '"' + hashlib.sha1(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()[:20] + '"'
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            self._send(304, None, {**headers, "ETag": etag})
+            return
+        self._send(status, payload, {**headers, "ETag": etag} if status == 200 else headers)
+
+    # ── REST ──────────────────────────────────────────────────────────
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        standin = self.server.standin
+        account = standin.account
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        segments = [s for s in parts.path.split("/") if s]
+        resource = "search" if segments[:1] == ["search"] else "core"
+        route = list(segments)
+        if route[:1] == ["repos"]:
+            route[1:3] = ["*", "*"]
+        elif route[:1] == ["users"]:
+            route[1:2] = ["*"]
+        headers = self._admit(f"GET {'/'.join(route)}", resource)
+        if headers is None:
+            return
+        user = account.config.username.lower()
+
+        if len(segments) == 3 and segments[0] == "users" and segments[1].lower() == user and segments[2] == "repos":
+            self._page([account.rest_repo(r) for r in account.repos], query, parts.path, headers)
+            return
+        if segments[:1] == ["users"] and segments[2:] == ["events", "public"] and segments[1].lower() == user:
+            self._page(account.events[:300], query, parts.path, headers)
+            return
+        if segments == ["search", "issues"]:
+            merged = sum(1 for e in account.events if (e["payload"].get("pull_request") or {}).get("merged"))
+            self._send_get({"total_count": merged, "incomplete_results": False, "items": []}, headers)
+            return
+        if len(segments) >= 4 and segments[0] == "repos":
+            repo = account.repo(segments[1], segments[2])
+            if repo is not None:
+                self._repo_get(repo, segments[3:], query, parts.path, headers)
+                return
+        self._send(404, {"message": "Not Found"}, headers)
+
+    def _repo_get(self, repo: _Repo, rest: list[str], query, path: str, headers: dict[str, str]) -> None:
+        standin = self.server.standin
+        user = standin.config.username
+        if rest == ["contributors"]:
+            self._page(repo.contributors, query, path, headers)
+        elif rest == ["commits"]:
+            author = (query.get("author") or [""])[0]
+            total = repo.user_commits if author.lower() == user.lower() else sum(c["contributions"] for c in repo.contributors)
+            commits = [{"sha": f"{i:040x}", "commit": {"message": "synthetic commit"}} for i in range(total)]
+            self._page(commits, query, path, headers)
+        elif rest == ["releases"]:
+            releases = [
+                {"tag_name": f"v{i}", "published_at": _iso(when), "created_at": _iso(when)}
+                for i, when in enumerate(repo.releases)
+            ]
+            self._page(releases, query, path, headers)
+        elif rest == ["languages"]:
+            self._send_get(dict(repo.languages), headers)
+        elif rest == ["contents", ".github", "workflows"]:
+            if repo.workflows:
+                self._send_get([{"name": n, "type": "file"} for n in repo.workflows], headers)
+            else:
+                self._send(404, {"message": "Not Found"}, headers)
+        elif rest == ["stats", "participation"]:
+            if standin.participation_pending(repo.name):
+                self._send(202, {}, headers)
+            else:
+                owner = repo.participation
+                self._send_get({"all": [n * 2 for n in owner], "owner": owner}, headers)
+        else:
+            self._send(404, {"message": "Not Found"}, headers)
+
+    # ── GraphQL ───────────────────────────────────────────────────────
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        parts = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        if parts.path.rstrip("/") != "/graphql":
+            self._send(404, {"message": "Not Found"})
+            return
+        headers = self._admit("POST graphql", "graphql")
+        if headers is None:
+            return
+        try:
+            request = json.loads(raw or b"{}")
+        except ValueError:
+            self._send(400, {"message": "Problems parsing JSON"}, headers)
+            return
+        query = str(request.get("query") or "")
+        variables = request.get("variables") or {}
+        data, errors = self.server.standin.resolve_graphql(query, variables)
+        if "rateLimit" in query and isinstance(data, dict):
+            remaining = headers.get("X-RateLimit-Remaining", "5000")
+            data["rateLimit"] = {"cost": 1, "remaining": int(remaining), "resetAt": _iso(datetime.now(timezone.utc))}
+        payload: dict[str, Any] = {"data": data}
+        if errors:
+            payload["errors"] = errors
+        self._send(200, payload, headers)
+
+
+class _StandinHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    standin: "GitHubStandin"
+
+
+class GitHubStandin:
+    """The stand-in server; ``with GitHubStandin(config) as standin:`` serves in a thread."""
+
+    def __init__(self, config: StandinConfig | None = None, *, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or StandinConfig()
+        self.account = SyntheticAccount.generate(self.config)
+        self.limiter = _RateLimiter(self.config.rate_limit, self.config.rate_limit_window)
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.config.seed + 1)
+        self._participation_calls: dict[str, int] = {}
+        self._requests: dict[str, int] = {}
+        self._httpd = _StandinHTTPServer((host, port), _Handler)
+        self._httpd.standin = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def env(self) -> dict[str, str]:
+        """Environment that points ``github_client`` at this server."""
+        return {
+            "GITHUB_API_URL": self.url,
+            "GITHUB_GRAPHQL_URL": f"{self.url}/graphql",
+            "GITHUB_USERNAME": self.config.username,
+        }
+
+    def start(self) -> "GitHubStandin":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, name="github-standin", daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "GitHubStandin":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def count(self, route: str) -> None:
+        with self._lock:
+            self._requests[route] = self._requests.get(route, 0) + 1
+
+    def request_counts(self) -> dict[str, int]:
+        """Requests served so far, by route (``GET repos/*/contributors`` ...)."""
+        with self._lock:
+            return dict(sorted(self._requests.items()))
+
+    def roll(self) -> float:
+        with self._lock:
+            return self._rng.random()
+
+    def participation_pending(self, name: str) -> bool:
+        with self._lock:
+            calls = self._participation_calls[name] = self._participation_calls.get(name, 0) + 1
+        return calls <= self.config.participation_pending
+
+    def resolve_graphql(self, query: str, variables: dict) -> tuple[dict | None, list[dict]]:
+        """``(data, errors)`` for *query*, matched by shape (see module docstring)."""
+        account = self.account
+        login = str(variables.get("login") or "")
+        if "repository(owner:" in query:
+            return self._repository_batch(query, variables)
+        if login and login.lower() != account.config.username.lower():
+            return {"user": None}, [{"type": "NOT_FOUND", "message": f"Could not resolve to a User with the login of '{login}'."}]
+        if "contributionCalendar" in query:
+            return {"user": {"contributionsCollection": {"contributionCalendar": self._calendar(
+                _parse_when(variables["from"]), _parse_when(variables["to"])
+            )}}}, []
+        if "totalCommitContributions" in query:
+            user: dict[str, Any] = {}
+            for alias, start, end in _ALIAS_YEAR_RE.findall(query):
+                cal = self._calendar(_parse_when(start), _parse_when(end))
+                user[alias] = {"totalCommitContributions": cal["totalContributions"]}
+            return {"user": user}, []
+        if _ALIAS_REPOS_RE.search(query) and "totalCount" in query and "nodes" not in query:
+            user = {}
+            for alias, args in _ALIAS_REPOS_RE.findall(query):
+                user[alias] = {"totalCount": len(self._filter_repos(args))}
+            return {"user": user}, []
+        if "repositories(" in query:
+            return {"user": {"repositories": self._repo_listing(query, variables)}}, []
+        if re.search(r"user\(login: \$login\)\s*\{\s*id\s*\}", query):
+            return {"user": {"id": f"U_standin_{account.config.username}"}}, []
+        if re.search(r"user\(login: \$login\)\s*\{\s*createdAt\s*\}", query):
+            return {"user": {"createdAt": "2015-01-01T00:00:00Z"}}, []
+        return None, [{"message": "stand-in does not emulate this query"}]
+
+    def _filter_repos(self, args: str) -> list[_Repo]:
+        if "PRIVATE" in args:
+            return []
+        repos = self.account.repos
+        if "isFork: true" in args:
+            return [r for r in repos if r.fork]
+        if "isFork: false" in args:
+            return [r for r in repos if not r.fork]
+        return list(repos)
+
+    def _repo_listing(self, query: str, variables: dict) -> dict[str, Any]:
+        match = re.search(r"repositories\(([^)]*)\)", query)
+        repos = self._filter_repos(match.group(1) if match else "")
+        first = int(variables.get("first") or 100)
+        start = int(variables.get("cursor") or 0)
+        chunk = repos[start : start + first]
+        end = start + len(chunk)
+        return {
+            "totalCount": len(repos),
+            "pageInfo": {"hasNextPage": end < len(repos), "endCursor": str(end)},
+            "nodes": [self.account.graphql_repo(r) for r in chunk],
+        }
+
+    def _calendar(self, start: datetime, end: datetime) -> dict[str, Any]:
+        weeks: list[dict[str, Any]] = []
+        total = 0
+        day = start.date()
+        while day <= end.date():
+            count = self.account.daily_contributions(day)
+            total += count
+            weekday = (day.weekday() + 1) % 7
+            if not weeks or weekday == 0:
+                weeks.append({"contributionDays": []})
+            weeks[-1]["contributionDays"].append({"date": day.isoformat(), "contributionCount": count, "weekday": weekday})
+            day += timedelta(days=1)
+        return {"totalContributions": total, "weeks": weeks}
+
+    def _repository_batch(self, query: str, variables: dict) -> tuple[dict, list[dict]]:
+        data: dict[str, Any] = {}
+        errors: list[dict] = []
+        first = re.search(r"releases\(first:\s*(\d+)", query)
+        for alias, owner, name in _ALIAS_REPO_RE.findall(query):
+            repo = self.account.repo(owner, name)
+            if repo is None:
+                data[alias] = None
+                errors.append({"type": "NOT_FOUND", "path": [alias], "message": f"Could not resolve to a Repository with the name '{owner}/{name}'."})
+                continue
+            node: dict[str, Any] = {}
+            if "history(" in query:
+                node["defaultBranchRef"] = {"target": {"history": {"totalCount": repo.user_commits}}}
+            if ".github/workflows" in query:
+                node["object"] = {"entries": [{"name": n} for n in repo.workflows]} if repo.workflows else None
+            if first:
+                nodes = [{"publishedAt": _iso(w), "createdAt": _iso(w)} for w in repo.releases[: int(first.group(1))]]
+                node["releases"] = {"totalCount": len(repo.releases), "nodes": nodes}
+            data[alias] = node
+        return data, errors
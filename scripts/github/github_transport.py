@@ -1,12 +1,250 @@
-"""HTTP GET/POST with auth headers, rate-limit handling, and public fallback."""
+"""HTTP GET/POST with auth headers, rate-limit handling, and public fallback.
+
+All requests go through a shared pool of keep-alive sessions so repeated
+calls to api.github.com reuse TCP+TLS connections. Identical GETs that are in
+flight at the same time are coalesced (single-flight): one request is sent and
+every caller gets the same response, whose JSON is parsed once.
+
+Every request also holds a slot of the process-wide adaptive concurrency
+limit (``github_concurrency``), so fan-out width follows GitHub's health.
+
+With a cassette active (see ``github_cassette``) ``http_get``/``http_post``
+record or replay exchanges instead of only talking to the network.
+"""
 
 from __future__ import annotations
 
+import json as _json
+import threading
 import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Callable, Hashable, Iterator
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from scripts.core.settings import Settings
+from scripts.github.github_cassette import active_cassette
+from scripts.github.github_concurrency import ADAPTIVE_MAX_CONCURRENCY, adaptive_limiter
+from scripts.github.github_ratelimit import (
+    MAX_THROTTLE_SECONDS,
+    rate_budget,
+    resource_for_url,
+    token_key,
+    token_key_from_headers,
+)
+
+# Matches the widest fan-out the adaptive limiter can allow, so every request
+# slot can hold a warm keep-alive session without blocking on the pool.
+DEFAULT_POOL_SIZE = ADAPTIVE_MAX_CONCURRENCY
+
+
+def _new_session() -> requests.Session:
+    """Return a keep-alive session with a small per-host connection pool."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=2)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class SessionPool:
+    """Bounded, thread-safe pool of keep-alive ``requests.Session`` objects.
+
+    A checkout that reuses an idle session (and its open TCP+TLS connections)
+    counts as a hit; one that has to build a fresh session counts as a miss.
+    At most ``max_size`` sessions exist at once; extra callers wait for a slot.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_POOL_SIZE):
+        self.max_size = max(1, int(max_size))
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._lock = threading.Lock()
+        self._idle: list[requests.Session] = []
+        self.hits = 0
+        self.misses = 0
+
+    @contextmanager
+    def session(self) -> Iterator[requests.Session]:
+        self._slots.acquire()
+        with self._lock:
+            if self._idle:
+                sess = self._idle.pop()
+                self.hits += 1
+            else:
+                sess = None
+                self.misses += 1
+        if sess is None:
+            sess = _new_session()
+        try:
+            yield sess
+        finally:
+            with self._lock:
+                self._idle.append(sess)
+            self._slots.release()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "idle": len(self._idle),
+                "max_size": self.max_size,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for sess in idle:
+            sess.close()
+
+
+_POOL = SessionPool()
+
+
+def session_pool() -> SessionPool:
+    """Return the process-wide session pool."""
+    return _POOL
+
+
+def configure_session_pool(max_size: int) -> SessionPool:
+    """Replace the shared pool with one bounded at *max_size* sessions."""
+    global _POOL
+    old = _POOL
+    _POOL = SessionPool(max_size)
+    old.close()
+    return _POOL
+
+
+def pool_stats() -> dict[str, int]:
+    """Hit/miss counters for the shared session pool."""
+    return _POOL.stats()
+
+
+class SharedResponse:
+    """A response handed to several coalesced callers; ``json()`` parses once."""
+
+    _UNPARSED = object()
+
+    def __init__(self, response: requests.Response):
+        self._response = response
+        self._lock = threading.Lock()
+        self._parsed: Any = self._UNPARSED
+
+    def json(self, **kwargs):
+        with self._lock:
+            if self._parsed is self._UNPARSED:
+                self._parsed = self._response.json(**kwargs)
+        return self._parsed
+
+    def __getattr__(self, name: str):
+        return getattr(self._response, name)
+
+
+class _Flight:
+    __slots__ = ("future", "followers")
+
+    def __init__(self):
+        self.future: Future = Future()
+        self.followers = 0
+
+
+class SingleFlight:
+    """Run at most one call per key at a time; concurrent callers share its outcome."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: dict[Hashable, _Flight] = {}
+        self._coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any], *, share: Callable[[Any], Any] = lambda value: value):
+        """Return ``fn()``, or the result of the identical call already in flight.
+
+        When anyone joined, the leader's result is passed through *share* once
+        and that shared value is what every caller receives.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                flight.followers += 1
+                self._coalesced += 1
+        if not leader:
+            return flight.future.result()
+        try:
+            result = fn()
+        except BaseException as exc:
+            with self._lock:
+                del self._flights[key]
+            flight.future.set_exception(exc)
+            raise
+        with self._lock:
+            del self._flights[key]
+            if flight.followers:
+                result = share(result)
+        flight.future.set_result(result)
+        return result
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"coalesced": self._coalesced, "in_flight": len(self._flights)}
+
+
+_SINGLE_FLIGHT = SingleFlight()
+
+
+def single_flight_stats() -> dict[str, int]:
+    """Requests answered by joining an identical in-flight request."""
+    return _SINGLE_FLIGHT.stats()
+
+
+def _flight_key(kind: str, url: str, params: dict | None, *parts: Any) -> tuple:
+    return (kind, url, _json.dumps(params or {}, sort_keys=True, default=str), *parts)
+
+
+def _share_response(resp: requests.Response) -> SharedResponse:
+    return resp if isinstance(resp, SharedResponse) else SharedResponse(resp)
+
+
+def http_get(url: str, *, headers: dict[str, str], params: dict | None = None) -> requests.Response:
+    """Single GET over a pooled keep-alive session (or the active cassette)."""
+
+    def send() -> requests.Response:
+        with _POOL.session() as sess:
+            return sess.get(url, headers=headers, params=params)
+
+    cassette = active_cassette()
+    with adaptive_limiter().slot() as slot:
+        if cassette is None:
+            resp = send()
+        else:
+            resp = cassette.handle("GET", url, headers=headers, params=params, send=send)
+        _observe(slot, resp)
+    return resp
+
+
+def http_post(url: str, *, headers: dict[str, str], json: dict | None = None) -> requests.Response:
+    """Single POST over a pooled keep-alive session (or the active cassette)."""
+
+    def send() -> requests.Response:
+        with _POOL.session() as sess:
+            return sess.post(url, headers=headers, json=json)
+
+    cassette = active_cassette()
+    with adaptive_limiter().slot() as slot:
+        if cassette is None:
+            resp = send()
+        else:
+            resp = cassette.handle("POST", url, headers=headers, body=json, send=send)
+        _observe(slot, resp)
+    return resp
+
+
+def _observe(slot, resp) -> None:
+    slot.observe(getattr(resp, "status_code", 200), getattr(resp, "headers", None) or {})
 
 
 def _auth_headers_for_token(token: str) -> dict[str, str]:
@@ -32,30 +270,94 @@ def candidate_tokens(settings: Settings) -> tuple[str, ...]:
 _PUBLIC_HEADERS: dict[str, str] = {"Accept": "application/vnd.github+json"}
 
 
+def response_validators(resp: requests.Response) -> dict[str, str]:
+    """Extract ``ETag``/``Last-Modified`` from *resp* for later revalidation."""
+    validators: dict[str, str] = {}
+    etag = resp.headers.get("ETag")
+    if etag:
+        validators["etag"] = etag
+    last_modified = resp.headers.get("Last-Modified")
+    if last_modified:
+        validators["last_modified"] = last_modified
+    return validators
+
+
+def conditional_headers(validators: dict | None) -> dict[str, str]:
+    """Build ``If-None-Match``/``If-Modified-Since`` headers from stored validators."""
+    if not validators:
+        return {}
+    h: dict[str, str] = {}
+    if validators.get("etag"):
+        h["If-None-Match"] = str(validators["etag"])
+    if validators.get("last_modified"):
+        h["If-Modified-Since"] = str(validators["last_modified"])
+    return h
+
+
+def _rate_limited_wait(resp: requests.Response) -> float | None:
+    """Seconds to wait before retrying a 403 rate-limit response, else ``None``.
+
+    Secondary limits carry ``Retry-After``; primary exhaustion reports
+    ``X-RateLimit-Remaining: 0`` with a reset epoch. Waits longer than
+    ``MAX_THROTTLE_SECONDS`` are not worth blocking the run for.
+    """
+    if resp.status_code != 403:
+        return None
+    retry_after = resp.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            wait = float(retry_after)
+        except ValueError:
+            return None
+    elif resp.headers.get("X-RateLimit-Remaining") == "0":
+        try:
+            wait = float(resp.headers.get("X-RateLimit-Reset", "")) - time.time() + 1
+        except ValueError:
+            return None
+    else:
+        return None
+    return max(0.0, wait) if wait <= MAX_THROTTLE_SECONDS else None
+
+
 def _request_once(
     url: str,
     hdrs: dict[str, str],
     params: dict | None,
     max_retries: int,
 ) -> requests.Response:
-    """Single GET attempt with 429/5xx retry; raises on other non-200."""
+    """Single GET attempt with 429/5xx retry; raises on other non-200.
+
+    A 304 (only possible when *hdrs* carries conditional headers) is returned
+    as-is so the caller can reuse its cached body, and so is a 202 (stats
+    still being generated) so the caller can poll later instead of retrying
+    immediately. Every attempt is metered by the process-wide rate budget.
+    """
+    budget = rate_budget()
+    key = token_key_from_headers(hdrs)
+    resource = resource_for_url(url)
     last_error: Exception | None = None
     resp: requests.Response | None = None
     for attempt in range(max_retries):
+        budget.before_request(key, resource)
         try:
-            resp = requests.get(url, headers=hdrs, params=params)
+            resp = http_get(url, headers=hdrs, params=params)
         except requests.RequestException as exc:
             last_error = exc
             if attempt == max_retries - 1:
                 raise
             time.sleep(2**attempt)
             continue
-        if resp.status_code == 200:
+        budget.record(key, resource, resp.headers, status=resp.status_code)
+        if resp.status_code in (200, 202, 304):
             return resp
         if resp.status_code == 429 or resp.status_code >= 500:
             wait = int(resp.headers.get("Retry-After", 2**attempt))
             time.sleep(wait)
             continue
+        limited_wait = _rate_limited_wait(resp)
+        if limited_wait is not None and attempt < max_retries - 1:
+            time.sleep(limited_wait)
+            continue
         resp.raise_for_status()
     if last_error is not None:
         raise last_error
@@ -70,20 +372,49 @@ def request_with_retry(
     headers: dict[str, str] | None = None,
     params: dict | None = None,
     max_retries: int = 3,
+    conditional: dict[str, str] | None = None,
 ) -> requests.Response:
     """Send an authenticated GET request and retry on 429/5xx.
 
     When the caller does not supply explicit headers, iterate over the
     available tokens and transparently retry with the next token on a 401
     (e.g. an expired PERSONAL_GITHUB_TOKEN falling back to GITHUB_TOKEN).
+    *conditional* headers (see ``conditional_headers``) are merged into every
+    attempt; the caller must then handle a 304 response.
     """
+    extra = dict(conditional or {})
     if headers is not None:
-        return _request_once(url, headers, params, max_retries)
+        key = _flight_key("get", url, params, tuple(sorted({**headers, **extra}.items())))
+        return _SINGLE_FLIGHT.do(
+            key,
+            lambda: _request_once(url, {**headers, **extra}, params, max_retries),
+            share=_share_response,
+        )
+    key = _flight_key(
+        "get",
+        url,
+        params,
+        tuple(sorted(extra.items())),
+        tuple(token_key(token) for token in candidate_tokens(settings)),
+    )
+    return _SINGLE_FLIGHT.do(
+        key,
+        lambda: _request_with_token_fallback(url, settings, extra, params, max_retries),
+        share=_share_response,
+    )
+
 
-    tokens = candidate_tokens(settings)
+def _request_with_token_fallback(
+    url: str,
+    settings: Settings,
+    extra: dict[str, str],
+    params: dict | None,
+    max_retries: int,
+) -> requests.Response:
+    tokens = rate_budget().order_tokens(candidate_tokens(settings), resource_for_url(url))
     for idx, token in enumerate(tokens):
         try:
-            return _request_once(url, _auth_headers_for_token(token), params, max_retries)
+            return _request_once(url, {**_auth_headers_for_token(token), **extra}, params, max_retries)
         except requests.HTTPError as exc:
             status = getattr(exc.response, "status_code", None)
             if status == 401 and idx < len(tokens) - 1:
@@ -100,17 +431,29 @@ def request_public_with_retry(
     max_retries: int = 2,
 ) -> requests.Response:
     """Send a public (unauthenticated) GET request for fallback checks."""
+    return _SINGLE_FLIGHT.do(
+        _flight_key("public", url, params),
+        lambda: _request_public(url, params, max_retries),
+        share=_share_response,
+    )
+
+
+def _request_public(url: str, params: dict | None, max_retries: int) -> requests.Response:
+    budget = rate_budget()
+    resource = resource_for_url(url)
     last_error: Exception | None = None
     resp: requests.Response | None = None
     for attempt in range(max_retries):
+        budget.before_request("anonymous", resource)
         try:
-            resp = requests.get(url, headers=_PUBLIC_HEADERS, params=params)
+            resp = http_get(url, headers=_PUBLIC_HEADERS, params=params)
         except requests.RequestException as exc:
             last_error = exc
             if attempt == max_retries - 1:
                 raise
             time.sleep(2**attempt)
             continue
+        budget.record("anonymous", resource, resp.headers, status=resp.status_code)
         if resp.status_code == 200:
             return resp
         if resp.status_code == 429 or resp.status_code >= 500:
@@ -48,11 +48,14 @@ MODULE_HOMES: tuple[ModuleHome, ...] = (
     ModuleHome("scripts/config.py", "scripts/core/config.py", "core", "theme and shared constants"),
     ModuleHome("scripts/settings.py", "scripts/core/settings.py", "core", "GitHub API settings"),
     ModuleHome("scripts/runtime_env.py", "scripts/core/runtime_env.py", "core", "runtime environment parsing"),
+    ModuleHome("scripts/core/timestamps.py", "scripts/core/timestamps.py", "core", "cached timestamp parsing and profile timezones"),
     # --- contracts: profile data and metric definitions ------------------------
     ModuleHome("scripts/contracts/schema.py", "scripts/contracts/__init__.py", "contracts", "profile data and README contracts"),
     ModuleHome("scripts/contracts/metrics.py", "scripts/contracts/profile_contract.py", "contracts", "metric definitions and formatting rules"),
     ModuleHome("scripts/contracts/design_predicates.py", "scripts/contracts/design_predicates.py", "contracts", "pure design-conformance predicates (button radius/anatomy/material/mechanic/focus)"),
     ModuleHome("scripts/contracts/page_manifest.py", "scripts/contracts/page_manifest.py", "contracts", "page manifest render_source parser and committed-route producer check"),
+    ModuleHome("scripts/contracts/contribution_calendar.py", "scripts/contracts/contribution_calendar.py", "contracts", "columnar contribution calendar (streaks, windows, intensity)"),
+    ModuleHome("scripts/contracts/profile_model.py", "scripts/contracts/profile_model.py", "contracts", "typed profile model and public projection"),
     # --- github: API facade, transports and repo auditing ----------------------
     ModuleHome("scripts/github/client.py", "scripts/github/github_client.py", "github", "GitHub API facade"),
     ModuleHome("scripts/github/transport.py", "scripts/github/github_transport.py", "github", "GitHub HTTP transport"),
@@ -61,6 +64,14 @@ MODULE_HOMES: tuple[ModuleHome, ...] = (
     ModuleHome("scripts/github/gh_cli.py", "scripts/github/gh_cli.py", "github", "GitHub CLI JSON wrapper"),
     ModuleHome("scripts/diagnostics/actions_audit.py", "scripts/github/actions_audit.py", "github", "GitHub Actions run auditing"),
     ModuleHome("scripts/diagnostics/branch_protection.py", "scripts/github/branch_protection.py", "github", "branch protection auditing and updates"),
+    ModuleHome("scripts/github/github_async.py", "scripts/github/github_async.py", "github", "GitHub asyncio fan-out engine"),
+    ModuleHome("scripts/github/github_ratelimit.py", "scripts/github/github_ratelimit.py", "github", "GitHub rate-limit budget tracker"),
+    ModuleHome("scripts/github/github_event_log.py", "scripts/github/github_event_log.py", "github", "GitHub public event log"),
+    ModuleHome("scripts/github/github_repo_index.py", "scripts/github/github_repo_index.py", "github", "per-repo change index"),
+    ModuleHome("scripts/github/github_cassette.py", "scripts/github/github_cassette.py", "github", "record/replay HTTP cassettes"),
+    ModuleHome("scripts/github/github_standin.py", "scripts/github/github_standin.py", "github", "local GitHub API stand-in server"),
+    ModuleHome("scripts/github/github_concurrency.py", "scripts/github/github_concurrency.py", "github", "adaptive request concurrency limit"),
+    ModuleHome("scripts/github/github_deferred.py", "scripts/github/github_deferred.py", "github", "background polling of deferred (202) results"),
     # --- pipeline: data collection, modelling and output orchestration ---------
     ModuleHome("scripts/analytics/collect.py", "scripts/pipeline/collect_data.py", "pipeline", "GitHub data collection"),
     ModuleHome("scripts/analytics/model.py", "scripts/pipeline/compute_metrics.py", "pipeline", "profile model computation"),
@@ -68,6 +79,10 @@ MODULE_HOMES: tuple[ModuleHome, ...] = (
     ModuleHome("scripts/profile_pipeline.py", "scripts/pipeline/profile_pipeline.py", "pipeline", "profile pipeline orchestration"),
     ModuleHome("scripts/render/outputs.py", "scripts/pipeline/render_outputs.py", "pipeline", "output rendering orchestration"),
     ModuleHome("scripts/pipeline/web_render.py", "scripts/pipeline/web_render.py", "pipeline", "web dashboard generator (token-driven, themed)"),
+    ModuleHome("scripts/pipeline/stage_graph.py", "scripts/pipeline/stage_graph.py", "pipeline", "pipeline stage dependency-graph executor"),
+    ModuleHome("scripts/pipeline/batch_build.py", "scripts/pipeline/batch_build.py", "pipeline", "multi-user batch profile build"),
+    ModuleHome("scripts/pipeline/event_index.py", "scripts/pipeline/event_index.py", "pipeline", "single-pass index of the public events feed"),
+    ModuleHome("scripts/pipeline/model_sections.py", "scripts/pipeline/model_sections.py", "pipeline", "incremental profile-model sections"),
     # --- rendering: SVG theme helpers and card renderers -----------------------
     ModuleHome("scripts/render/card_theme.py", "scripts/rendering/card_theme.py", "rendering", "SVG card theme helpers"),
     ModuleHome("scripts/render/svg_utils.py", "scripts/rendering/svg_utils.py", "rendering", "SVG formatting utilities"),
@@ -78,6 +78,11 @@ TEST_GROUPS: tuple[TestGroup, ...] = (
             "test_compute_metrics_accuracy.py",
             "test_compute_metrics_integration.py",
             "test_profile_pipeline_fixture.py",
+            "test_stage_graph.py",
+            "test_batch_build.py",
+            "test_event_index.py",
+            "test_contribution_calendar.py",
+            "test_model_sections.py",
         ),
     ),
     TestGroup(
@@ -89,6 +94,14 @@ TEST_GROUPS: tuple[TestGroup, ...] = (
             "test_github_client.py",
             "test_settings_tokens.py",
             "test_token_fallback.py",
+            "test_github_transport.py",
+            "test_github_ratelimit.py",
+            "test_github_cache.py",
+            "test_github_event_log.py",
+            "test_github_cassette.py",
+            "test_github_standin.py",
+            "test_github_concurrency.py",
+            "test_github_deferred.py",
         ),
     ),
     TestGroup(
@@ -107,6 +120,7 @@ TEST_GROUPS: tuple[TestGroup, ...] = (
         (
             "test_profile_cli.py",
             "test_runtime_env.py",
+            "test_timestamps.py",
         ),
     ),
 )
@@ -0,0 +1,94 @@
+"""Build many users' profiles in one process.
+
+Every user runs the normal live pipeline under ``profile_user`` with its own
+output directory, ``<output_dir>/<username>/``. The HTTP session pool, the
+cache and the rate budget are process singletons, so all users share them:
+repo-level cache entries (languages, CI state, participation) are fetched once
+for the whole team, and token pacing sees the combined spend. Their stats in
+each user's log are labelled as process totals for that reason. Client
+warnings are routed to the user's own log block via ``profile_user``.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+
+from scripts.core.config import profile_user
+from scripts.pipeline.profile_pipeline import run_profile_pipeline
+
+# Users built concurrently; each build also fans out per stage and per repo.
+BATCH_WORKERS = 4
+
+_LOGIN_RE = re.compile(r"^[A-Za-z0-9](?:[A-Za-z0-9-]{0,38})$")
+
+
+@dataclass(frozen=True)
+class BatchUserResult:
+    username: str
+    output_dir: Path
+    ok: bool
+    seconds: float
+    error: str = ""
+
+
+def read_users_file(path: str | Path) -> list[str]:
+    """Usernames from *path*: one per line, ``#`` comments and blanks ignored.
+
+    Duplicates are dropped (first occurrence wins); a line that is not a valid
+    GitHub login raises ``ValueError`` so a typo never becomes a directory name.
+    """
+    users: list[str] = []
+    for lineno, raw in enumerate(Path(path).read_text(encoding="utf-8").splitlines(), start=1):
+        name = raw.split("#", 1)[0].strip()
+        if not name:
+            continue
+        if not _LOGIN_RE.match(name):
+            raise ValueError(f"{path}:{lineno}: not a GitHub username: {name!r}")
+        if name not in users:
+            users.append(name)
+    return users
+
+
+def _build_one(username: str, output_dir: Path) -> tuple[BatchUserResult, list[str]]:
+    lines: list[str] = []
+    root = output_dir / username
+    started = time.perf_counter()
+    try:
+        with profile_user(username, logger=lines.append):
+            run_profile_pipeline(logger=lines.append, output_root=root)
+    except Exception as exc:  # one user's failure must not abort the batch
+        return BatchUserResult(username, root, False, time.perf_counter() - started, str(exc)), lines
+    return BatchUserResult(username, root, True, time.perf_counter() - started), lines
+
+
+def run_batch_build(
+    usernames: list[str],
+    output_dir: Path,
+    *,
+    workers: int = BATCH_WORKERS,
+    logger=print,
+) -> list[BatchUserResult]:
+    """Build every user in *usernames*; return one result per user, in input order.
+
+    Each user's log is buffered and emitted as one block when that user finishes.
+    """
+    results: dict[str, BatchUserResult] = {}
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="batch") as pool:
+        futures = {
+            pool.submit(contextvars.copy_context().run, _build_one, username, output_dir): username
+            for username in usernames
+        }
+        for future in as_completed(futures):
+            result, lines = future.result()
+            results[result.username] = result
+            logger(f"\n=== {result.username} ===")
+            for line in lines:
+                logger(line)
+            status = "ok" if result.ok else f"FAILED: {result.error}"
+            logger(f"--- {result.username}: {status} ({result.seconds:.1f}s) -> {result.output_dir}")
+    return [results[username] for username in usernames]
@@ -4,12 +4,17 @@ from __future__ import annotations
 
 import json
 import subprocess
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 from scripts.github import github_client as gh
+from scripts.core.config import FEATURED_REPOS
+from scripts.contracts.contribution_calendar import ContributionCalendar
 from scripts.core.runtime_env import cache_mode_from_env, token_mode_from_env
+from scripts.pipeline.event_index import EventIndex
+from scripts.pipeline.stage_graph import Stage, run_stage_graph
 
 
 def detect_token_mode() -> str:
@@ -35,22 +40,52 @@ class CollectedProfileData:
     token_mode: str
     cache_mode: dict[str, Any]
     private_repos: list[dict[str, Any]] = field(default_factory=list)
+    stage_timings: dict[str, float] = field(default_factory=dict)
+    # Full-history aggregates from the local event log (see github_event_log).
+    event_aggregates: dict[str, Any] = field(default_factory=dict)
+    # ``events`` indexed once (see event_index); rebuilt from ``events`` when
+    # absent, e.g. for fixture payloads.
+    event_index: EventIndex | None = None
+    # ``calendar`` flattened into columns once (see contribution_calendar);
+    # consumers fall back to building it from ``calendar`` when absent.
+    calendar_model: ContributionCalendar | None = None
 
 
-def collect_profile_data(logger=print) -> CollectedProfileData:
-    logger("\n[1/7] Fetching repo scope counts...")
-    repo_counts = gh.get_owned_repo_scope_counts()
-    logger(
+# Stage pool width: the repo-dependent stages fan out per repo themselves.
+COLLECT_STAGE_WORKERS = 4
+
+
+def _stage_previous_snapshot(values, log, *, output_root: Path = Path(".")) -> dict[str, Any]:
+    return {"previous_snapshot": _read_previous_snapshot(output_root)}
+
+
+def _stage_scope_counts(values, log) -> dict[str, Any]:
+    log("\n[1/7] Fetching repo scope counts...")
+    with gh.budget_step("repo_scope_counts"):
+        scope_counts = gh.get_owned_repo_scope_counts()
+    log(
         "  Scope totals:"
-        f" public non-fork={repo_counts['public_owned_nonfork']},"
-        f" public forks={repo_counts['public_owned_forks']},"
-        f" public total={repo_counts['public_owned_total']},"
-        f" private owned={repo_counts['private_owned'] if repo_counts['private_owned'] is not None else 'n/a'}"
+        f" public non-fork={scope_counts['public_owned_nonfork']},"
+        f" public forks={scope_counts['public_owned_forks']},"
+        f" public total={scope_counts['public_owned_total']},"
+        f" private owned={scope_counts['private_owned'] if scope_counts['private_owned'] is not None else 'n/a'}"
     )
+    return {"scope_counts": scope_counts}
 
-    logger("[2/7] Fetching repos...")
-    repos = gh.get_repos(include_forks=False)
-    all_repos = gh.get_repos(include_forks=True)
+
+def _stage_repos(values, log) -> dict[str, Any]:
+    log("[2/7] Fetching repos...")
+    with gh.budget_step("repos"):
+        # One fork-inclusive listing; the non-fork view is a filter of it.
+        all_repos = gh.get_repos(include_forks=True)
+    repos = [repo for repo in all_repos if not repo.get("fork")]
+    return {"repos": repos, "all_repos": all_repos}
+
+
+def _stage_repo_counts(values, log) -> dict[str, Any]:
+    repo_counts = dict(values["scope_counts"])
+    repos = values["repos"]
+    all_repos = values["all_repos"]
     # Keep scope counts and fetched repo lists consistent when the scope endpoint degrades.
     if repos and int(repo_counts.get("public_owned_nonfork", 0) or 0) == 0:
         repo_counts["public_owned_nonfork"] = len(repos)
@@ -61,57 +96,81 @@ def collect_profile_data(logger=print) -> CollectedProfileData:
             0,
             int(repo_counts["public_owned_total"]) - int(repo_counts["public_owned_nonfork"]),
         )
-    previous_snapshot = _read_previous_snapshot()
     if repo_counts.get("private_owned") is None:
-        previous_private = _prev_int(previous_snapshot, "private_owned_repos")
+        previous_private = _prev_int(values["previous_snapshot"], "private_owned_repos")
         if previous_private is not None:
             repo_counts["private_owned"] = previous_private
-    logger(
+    log(
         f"  Found {len(repos)} public non-fork repos "
         f"({len(all_repos)} public owned total, {repo_counts['public_owned_forks']} forks)"
     )
+    return {"repo_counts": repo_counts}
+
 
-    logger("[3/7] Fetching language data...")
-    language_bytes = gh.get_all_languages(repos)
+def _stage_languages(values, log) -> dict[str, Any]:
+    log("[3/7] Fetching language data...")
+    with gh.budget_step("languages"):
+        language_bytes = gh.get_all_languages(values["repos"])
     lang_count = len([lang for lang, bytes_ in language_bytes.items() if bytes_ > 0])
-    logger(f"  {lang_count} languages across all repos")
+    log(f"  {lang_count} languages across all repos")
+    return {"language_bytes": language_bytes}
 
-    logger("[4/7] Fetching events...")
-    events = gh.get_events()
-    logger(f"  {len(events)} recent events")
 
+def _stage_events(values, log) -> dict[str, Any]:
+    log("[4/7] Fetching events...")
+    with gh.budget_step("events"):
+        events = gh.get_events()
+    event_aggregates = gh.get_event_aggregates()
+    log(f"  {len(events)} recent events ({event_aggregates['event_count']} in local event log)")
+
+    event_index = EventIndex(events)
     latest_push_message_by_repo: dict[str, str] = {}
-    for event in events:
-        if event.get("type") != "PushEvent":
-            continue
-        repo_full_name = event.get("repo", {}).get("name", "")
+    for event in event_index.of_type("PushEvent"):
+        repo_full_name = event.repo
         if not repo_full_name or repo_full_name in latest_push_message_by_repo:
             continue
-        commits = event.get("payload", {}).get("commits", [])
+        commits = event.payload.get("commits", [])
         if not commits:
             continue
         message = commits[-1].get("message", "").split("\n")[0].strip()
         if message:
             latest_push_message_by_repo[repo_full_name] = message
+    return {
+        "events": events,
+        "event_index": event_index,
+        "event_aggregates": event_aggregates,
+        "latest_push_message_by_repo": latest_push_message_by_repo,
+    }
+
 
-    logger("[5/7] Fetching public repo commit count...")
-    public_scope_commits = gh.get_total_commits(repos, use_global_fallback=True)
+def _stage_commits(values, log) -> dict[str, Any]:
+    log("[5/7] Fetching public repo commit count...")
+    with gh.budget_step("commits"):
+        public_scope_commits = gh.get_total_commits(values["repos"], use_global_fallback=True)
     if public_scope_commits is None:
-        restored = _prev_int(previous_snapshot, "public_scope_commits")
+        restored = _prev_int(values["previous_snapshot"], "public_scope_commits")
         if restored is not None:
             public_scope_commits = restored
-            logger(f"  preserved last-known-good public-scope commits: {restored}")
+            log(f"  preserved last-known-good public-scope commits: {restored}")
         else:
-            logger("  n/a public-scope commits (data unavailable for this run)")
+            log("  n/a public-scope commits (data unavailable for this run)")
     else:
-        logger(f"  {public_scope_commits} public-scope commits")
+        log(f"  {public_scope_commits} public-scope commits")
+    return {"public_scope_commits": public_scope_commits}
+
+
+def _stage_ci(values, log) -> dict[str, Any]:
+    log("[6/7] Counting CI/CD pipelines...")
+    with gh.budget_step("ci"):
+        ci_count_probe = gh.get_repos_with_ci(values["repos"])
+    log(f"  Probe found {ci_count_probe} repos with CI/CD")
+    return {"ci_count_probe": ci_count_probe}
 
-    logger("[6/7] Counting CI/CD pipelines...")
-    ci_count_probe = gh.get_repos_with_ci(repos)
-    logger(f"  Probe found {ci_count_probe} repos with CI/CD")
 
-    logger("[7/7] Fetching contribution calendar...")
-    calendar = gh.get_contribution_calendar()
+def _stage_calendar(values, log) -> dict[str, Any]:
+    log("[7/7] Fetching contribution calendar...")
+    with gh.budget_step("contribution_calendar"):
+        calendar = gh.get_contribution_calendar()
     total_contributions: int | None = None
     if calendar:
         try:
@@ -119,46 +178,164 @@ def collect_profile_data(logger=print) -> CollectedProfileData:
         except (TypeError, ValueError):
             total_contributions = None
     if total_contributions is None:
-        restored = _prev_int(previous_snapshot, "last_year_contributions")
+        restored = _prev_int(values["previous_snapshot"], "last_year_contributions")
         if restored is not None:
             total_contributions = restored
-            logger(f"  preserved last-known-good contributions: {restored}")
+            log(f"  preserved last-known-good contributions: {restored}")
         else:
-            logger("  n/a contributions in the last 12 months (calendar unavailable for this run)")
+            log("  n/a contributions in the last 12 months (calendar unavailable for this run)")
     else:
-        logger(f"  {total_contributions} contributions in the last 12 months")
+        log(f"  {total_contributions} contributions in the last 12 months")
+    return {
+        "calendar": calendar,
+        "calendar_model": ContributionCalendar.from_graphql(calendar),
+        "total_contributions": total_contributions,
+    }
 
+
+def _stage_private_repos(values, log) -> dict[str, Any]:
     # Private repos (names + metadata only, never file contents) for the
     # activity / currently-working surface. Empty unless a user PAT is present.
-    private_repos = gh.get_private_repos()
+    with gh.budget_step("private_repos"):
+        private_repos = gh.get_private_repos()
     if private_repos:
-        logger(f"  {len(private_repos)} recent private repos (metadata only)")
+        log(f"  {len(private_repos)} recent private repos (metadata only)")
+    return {"private_repos": private_repos}
+
+
+def _stage_participation(values, log) -> dict[str, Any]:
+    # compute_metrics draws weekly sparklines for the featured repos. GitHub
+    # answers 202 until it has computed those stats, so ask now and let the
+    # background poller pick the data up while the other stages run.
+    featured = [repo for repo in values["all_repos"] if repo.get("name") in FEATURED_REPOS]
+    with gh.budget_step("participation"):
+        generating = gh.warm_participation_stats(featured)
+    if generating:
+        log(f"  participation stats generating for {generating} featured repos; polling in background")
+    return {"participation_pending": generating}
+
+
+# Declaration order is log order; execution order follows the inputs.
+COLLECT_STAGES: tuple[Stage, ...] = (
+    Stage("previous_snapshot", _stage_previous_snapshot, outputs=("previous_snapshot",)),
+    Stage("scope_counts", _stage_scope_counts, outputs=("scope_counts",)),
+    Stage("repos", _stage_repos, outputs=("repos", "all_repos")),
+    Stage(
+        "repo_counts",
+        _stage_repo_counts,
+        inputs=("scope_counts", "repos", "all_repos", "previous_snapshot"),
+        outputs=("repo_counts",),
+    ),
+    Stage("languages", _stage_languages, inputs=("repos",), outputs=("language_bytes",)),
+    Stage(
+        "events",
+        _stage_events,
+        outputs=("events", "event_index", "event_aggregates", "latest_push_message_by_repo"),
+    ),
+    Stage(
+        "commits",
+        _stage_commits,
+        inputs=("repos", "previous_snapshot"),
+        outputs=("public_scope_commits",),
+    ),
+    Stage("ci", _stage_ci, inputs=("repos",), outputs=("ci_count_probe",)),
+    Stage(
+        "calendar",
+        _stage_calendar,
+        inputs=("previous_snapshot",),
+        outputs=("calendar", "calendar_model", "total_contributions"),
+    ),
+    Stage("private_repos", _stage_private_repos, outputs=("private_repos",)),
+    Stage("participation", _stage_participation, inputs=("all_repos",), outputs=("participation_pending",)),
+)
+
+
+def collect_profile_data(
+    logger=print,
+    *,
+    engine: str | None = None,
+    output_root: Path = Path("."),
+) -> CollectedProfileData:
+    """Collect every input the profile model needs.
+
+    Independent stages (scope counts, events, calendar, private repos, and the
+    per-repo fan-outs once repos are known) run concurrently; see
+    ``COLLECT_STAGES``. *engine* overrides the ``GITHUB_CLIENT_ENGINE`` setting
+    (``"threads"`` or ``"async"``) used for the per-repo fan-outs.
+    *output_root* is where the previous snapshot is read from.
+    """
+    if engine is not None:
+        gh.use_client_engine(engine)
+
+    stages = [
+        replace(stage, run=partial(_stage_previous_snapshot, output_root=output_root))
+        if stage.name == "previous_snapshot"
+        else stage
+        for stage in COLLECT_STAGES
+    ]
+    graph = run_stage_graph(stages, logger=logger, max_workers=COLLECT_STAGE_WORKERS)
+    values = graph.values
+
+    # Stale-while-revalidate reads may have queued background refreshes; let
+    # them land in the cache before outputs are written and the process exits.
+    pending = gh.wait_for_refreshes()
+    if pending:
+        logger(f"  {pending} background cache refreshes still pending")
+
+    # The session pool, limiter, cache and rate budget are process singletons;
+    # in a batch build these counts cover every user built so far, not just this one.
+    logger("  Process totals (shared by every build in this process):")
+    pool = gh.pool_stats()
+    coalesced = gh.single_flight_stats()["coalesced"]
+    logger(f"    HTTP session pool: {pool['hits']} reused, {pool['misses']} opened, {coalesced} coalesced")
+    limiter = gh.concurrency_stats()
+    logger(
+        f"    Adaptive concurrency: limit {limiter['limit']} "
+        f"(peak {limiter['peak']}, {limiter['backoffs']} backoffs)"
+    )
+    for namespace, counts in gh.cache_stats().items():
+        logger(
+            f"    Cache [{namespace}]: {counts['hit_rate']:.0%} hit rate "
+            f"({counts['hits']} fresh, {counts['stale']} stale, {counts['misses']} misses)"
+        )
+    for step, spend in gh.rate_budget().report()["steps"].items():
+        cost = ", ".join(f"{resource}={amount}" for resource, amount in sorted(spend["cost"].items()))
+        logger(f"    Rate budget [{step}]: {spend['requests']} requests ({cost or 'no cost'})")
+    logger(
+        "  Stage wall time: "
+        + ", ".join(f"{name}={seconds:.2f}s" for name, seconds in graph.timings.items())
+    )
 
     return CollectedProfileData(
-        repo_counts=repo_counts,
-        repos=repos,
-        all_repos=all_repos,
-        language_bytes=language_bytes,
-        events=events,
-        latest_push_message_by_repo=latest_push_message_by_repo,
-        public_scope_commits=public_scope_commits,
-        ci_count_probe=ci_count_probe,
-        calendar=calendar,
-        total_contributions=total_contributions,
+        repo_counts=values["repo_counts"],
+        repos=values["repos"],
+        all_repos=values["all_repos"],
+        language_bytes=values["language_bytes"],
+        events=values["events"],
+        latest_push_message_by_repo=values["latest_push_message_by_repo"],
+        public_scope_commits=values["public_scope_commits"],
+        ci_count_probe=values["ci_count_probe"],
+        calendar=values["calendar"],
+        total_contributions=values["total_contributions"],
         token_mode=detect_token_mode(),
         cache_mode=detect_cache_mode(),
-        private_repos=private_repos,
+        private_repos=values["private_repos"],
+        stage_timings=dict(graph.timings),
+        event_aggregates=values["event_aggregates"],
+        event_index=values["event_index"],
+        calendar_model=values["calendar_model"],
     )
 
 
-def _read_previous_snapshot() -> dict[str, Any] | None:
+def _read_previous_snapshot(output_root: Path = Path(".")) -> dict[str, Any] | None:
     """Return the most-trustworthy previous ``snapshot`` sub-dict.
 
     Reads ``site/data/profile_snapshot.json`` from both the working tree and
     ``git show HEAD:...`` so a degraded run can preserve last-known-good
-    user-specific metrics instead of regressing them to zero/n-a.
+    user-specific metrics instead of regressing them to zero/n-a. A batch
+    build's per-user *output_root* is not committed, so only its file is read.
     """
-    snapshot_path = Path("site/data/profile_snapshot.json")
+    snapshot_path = output_root / "site/data/profile_snapshot.json"
     payloads: list[dict[str, Any]] = []
     if snapshot_path.exists():
         try:
@@ -168,18 +345,19 @@ def _read_previous_snapshot() -> dict[str, Any] | None:
         except (OSError, ValueError):
             pass
 
-    try:
-        result = subprocess.run(
-            ["git", "show", "HEAD:site/data/profile_snapshot.json"],
-            check=True,
-            text=True,
-            capture_output=True,
-        )
-        loaded = json.loads(result.stdout)
-        if isinstance(loaded, dict):
-            payloads.append(loaded)
-    except (OSError, ValueError, subprocess.CalledProcessError):
-        pass
+    if output_root == Path("."):
+        try:
+            result = subprocess.run(
+                ["git", "show", "HEAD:site/data/profile_snapshot.json"],
+                check=True,
+                text=True,
+                capture_output=True,
+            )
+            loaded = json.loads(result.stdout)
+            if isinstance(loaded, dict):
+                payloads.append(loaded)
+        except (OSError, ValueError, subprocess.CalledProcessError):
+            pass
 
     for payload in payloads:
         snapshot = payload.get("snapshot") if isinstance(payload, dict) else None
@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
-import os
+import hashlib
+import importlib
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
 from typing import Any
-from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+from scripts.core.timestamps import activity_timezone, parse_iso, profile_timezone_name, profile_today
 from scripts.github import github_client as gh
 from scripts.pipeline.collect_data import CollectedProfileData
+from scripts.pipeline.event_index import EventIndex
+from scripts.pipeline.model_sections import (
+    ModelSection,
+    fingerprint,
+    load_model_state,
+    run_sections,
+    save_model_state,
+)
 from scripts.core.config import (
-    USERNAME,
+    active_username,
     FEATURED_REPOS,
     BG_DARK,
     BG_CARD,
@@ -33,6 +44,8 @@ from scripts.contracts import (
     ScorecardCard,
     SnapshotRow,
 )
+from scripts.contracts.contribution_calendar import ContributionCalendar
+from scripts.contracts.profile_model import ProfileModel
 from scripts.contracts.profile_contract import SCORECARD_METRICS, SNAPSHOT_METRICS, format_metric_value
 from scripts.pipeline.profile_helpers import (
     activity_label,
@@ -42,62 +55,21 @@ from scripts.pipeline.profile_helpers import (
     is_bot_commit_message,
     is_self_repo,
     time_ago,
+    time_ago_from,
 )
 
 
-def _profile_today() -> date:
-    """Today's date in the profile timezone (so streaks aren't off-by-one in UTC)."""
-    tz_name = os.environ.get("PROFILE_TIMEZONE", "America/New_York").strip() or "America/New_York"
-    try:
-        tz = ZoneInfo(tz_name)
-    except ZoneInfoNotFoundError:
-        tz = timezone.utc
-    return datetime.now(tz).date()
-
-
-def _parse_calendar_day_date(value: str) -> datetime | None:
-    if not value:
-        return None
-    try:
-        return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
-    except ValueError:
-        return None
+def _calendar_model(collected: Any) -> ContributionCalendar:
+    """The columnar calendar built by collect_data, or one built from ``calendar``."""
+    model = getattr(collected, "calendar_model", None)
+    return model if model is not None else ContributionCalendar.of(collected.calendar)
 
 
 def _compute_current_streak_days(
-    calendar: dict | None, now_utc: datetime, today_local: date | None = None
+    calendar: ContributionCalendar | dict | None, now_utc: datetime, today_local: date | None = None
 ) -> int:
-    if not isinstance(calendar, dict):
-        return 0
-
-    all_days: list[dict] = []
-    for week in calendar.get("weeks", []):
-        days = week.get("contributionDays", []) if isinstance(week, dict) else []
-        if not isinstance(days, list):
-            continue
-        for day in days:
-            if isinstance(day, dict):
-                all_days.append(day)
-
-    if not all_days:
-        return 0
-
     today_ref = today_local if today_local is not None else now_utc.date()
-    streak = 0
-    for day in reversed(all_days):
-        day_dt = _parse_calendar_day_date(str(day.get("date", "")))
-        if day_dt is not None and day_dt.date() > today_ref:
-            continue
-        try:
-            count = int(day.get("contributionCount", 0))
-        except (TypeError, ValueError):
-            count = 0
-        if count > 0:
-            streak += 1
-            continue
-        break
-
-    return streak
+    return ContributionCalendar.of(calendar).current_streak(today_ref)[0]
 
 
 def _build_recent_repos(
@@ -119,7 +91,9 @@ def _build_recent_repos(
         pushed = repo.get("pushed_at", "")
         if not pushed:
             continue
-        pushed_dt = datetime.fromisoformat(pushed.replace("Z", "+00:00"))
+        pushed_dt = parse_iso(pushed)
+        if pushed_dt is None:
+            continue
         if pushed_dt < seven_days_ago:
             break
         if name in seen:
@@ -136,13 +110,13 @@ def _build_recent_repos(
                 last_msg = ""
             if not last_msg and allow_network_calls:
                 try:
-                    commits_data = gh.paginated_get(
-                        f"repos/{repo['owner']['login']}/{name}/commits",
-                        {"per_page": 1},
-                        per_page=1,
+                    # Only the newest commit is needed: stop after the first page.
+                    latest_commit = next(
+                        gh.iter_paginated(f"repos/{repo['owner']['login']}/{name}/commits", per_page=1),
+                        None,
                     )
-                    if commits_data:
-                        candidate = commits_data[0].get("commit", {}).get("message", "").split("\n")[0].strip()
+                    if latest_commit:
+                        candidate = latest_commit.get("commit", {}).get("message", "").split("\n")[0].strip()
                         if not is_bot_commit_message(candidate):
                             last_msg = candidate
                 except Exception:
@@ -231,7 +205,7 @@ def _build_repo_overview_rows(
     featured_set = set(FEATURED_REPOS)
 
     def build_repo_row(repo: dict) -> dict:
-        owner_login = repo.get("owner", {}).get("login", USERNAME)
+        owner_login = repo.get("owner", {}).get("login", active_username())
         name = repo.get("name", "")
         full_name = f"{owner_login}/{name}" if name else ""
         pushed_raw = repo.get("pushed_at", "") or ""
@@ -286,7 +260,7 @@ def _build_repo_overview_rows(
 
 
 def _build_recent_activity(
-    events: list[dict],
+    events: EventIndex,
     recent_repos: list[dict],
     repo_overview_rows: list[dict],
     username: str,
@@ -305,16 +279,14 @@ def _build_recent_activity(
 
     contributions = []
     seen_contrib = set()
-    for event in events:
-        if event.get("type") not in contribution_event_types:
-            continue
-        repo_name = event.get("repo", {}).get("name", "")
+    for event in events.of_type(*contribution_event_types):
+        repo_name = event.repo
         if not repo_name.startswith(owned_repo_prefix):
             continue
         # Drop the profile repo itself and automation-actor events.
         if is_self_repo(None, repo_name):
             continue
-        if is_bot_actor((event.get("actor") or {}).get("login")):
+        if is_bot_actor(event.actor or None):
             continue
         if repo_name in seen_contrib:
             continue
@@ -323,9 +295,9 @@ def _build_recent_activity(
             {
                 "repo": repo_name,
                 "url": f"https://github.com/{repo_name}",
-                "activity": activity_label(event.get("type", "")),
-                "time_ago": time_ago(event.get("created_at", "")),
-                "created_at": event.get("created_at", ""),
+                "activity": activity_label(event.type),
+                "time_ago": time_ago_from(event.at),
+                "created_at": event.created_at,
             }
         )
         if len(contributions) >= 10:
@@ -345,12 +317,9 @@ def _build_recent_activity(
             )
 
     release_list = []
-    for event in events:
-        if event.get("type") != "ReleaseEvent":
-            continue
-        payload = event.get("payload", {})
-        release = payload.get("release", {})
-        repo_name = event.get("repo", {}).get("name", "")
+    for event in events.of_type("ReleaseEvent"):
+        release = event.payload.get("release", {})
+        repo_name = event.repo
         if is_self_repo(None, repo_name):
             continue
         release_tag = (release.get("tag_name") or "").strip() or "unknown"
@@ -363,19 +332,17 @@ def _build_recent_activity(
                 "repo_url": f"https://github.com/{repo_name}",
                 "tag": release_tag,
                 "url": release_url,
-                "time_ago": time_ago(event.get("created_at", "")),
-                "created_at": event.get("created_at", ""),
+                "time_ago": time_ago_from(event.at),
+                "created_at": event.created_at,
             }
         )
         if len(release_list) >= 5:
             break
 
     pr_list = []
-    for event in events:
-        if event.get("type") != "PullRequestEvent":
-            continue
-        pr = event.get("payload", {}).get("pull_request", {})
-        repo_name = event.get("repo", {}).get("name", "")
+    for event in events.of_type("PullRequestEvent"):
+        pr = event.payload.get("pull_request", {})
+        repo_name = event.repo
         if is_self_repo(None, repo_name):
             continue
         state = pr.get("state", "open").upper()
@@ -397,8 +364,8 @@ def _build_recent_activity(
                 "repo": repo_name,
                 "repo_url": f"https://github.com/{repo_name}",
                 "state": state,
-                "time_ago": time_ago(event.get("created_at", "")),
-                "created_at": event.get("created_at", ""),
+                "time_ago": time_ago_from(event.at),
+                "created_at": event.created_at,
             }
         )
         if len(pr_list) >= 5:
@@ -622,39 +589,39 @@ def _build_language_stats(
     return top_languages, lang_count, total_language_bytes
 
 
+def _parse_event_times(values: Any) -> list[datetime]:
+    return [ts for ts in map(parse_iso, values) if ts is not None]
+
+
 def _build_pr_and_release_stats(
-    events: list[dict[str, Any]],
+    events: EventIndex,
     repos: list[dict[str, Any]],
     now_utc: datetime,
     *,
     allow_network_calls: bool,
+    event_aggregates: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     """Return dict with prs_merged, releases_30d, releases_status, releases_note, avg_release_gap_days."""
-    prs_merged_from_events = sum(
-        1
-        for event in events
-        if event.get("type") == "PullRequestEvent"
-        and event.get("payload", {}).get("action") == "closed"
-        and event.get("payload", {}).get("pull_request", {}).get("merged")
-    )
+    if event_aggregates and event_aggregates.get("event_count"):
+        # The local event log reaches past the feed's 300-event horizon, so
+        # window the merged-PR fallback the same way the API count is.
+        prs_merged_from_events = sum(
+            1 for ts in _parse_event_times(event_aggregates.get("merged_pr_times", [])) if (now_utc - ts).days < 365
+        )
+        release_event_times = _parse_event_times(event_aggregates.get("release_times", []))
+    else:
+        prs_merged_from_events = sum(
+            1
+            for event in events.of_type("PullRequestEvent")
+            if event.payload.get("action") == "closed" and event.payload.get("pull_request", {}).get("merged")
+        )
+        release_event_times = events.times("ReleaseEvent")
     prs_merged = prs_merged_from_events
     if allow_network_calls:
         merged_pr_total = gh.get_merged_prs_last_n_days(days=365)
         if merged_pr_total is not None:
             prs_merged = merged_pr_total
 
-    release_event_times: list[datetime] = []
-    for event in events:
-        if event.get("type") != "ReleaseEvent":
-            continue
-        created_at = event.get("created_at", "")
-        if not created_at:
-            continue
-        try:
-            release_event_times.append(datetime.fromisoformat(created_at.replace("Z", "+00:00")))
-        except ValueError:
-            continue
-
     releases_from_events_30d = sum(1 for ts in release_event_times if (now_utc - ts).days < 30)
     releases_30d: int | None = releases_from_events_30d
     if allow_network_calls:
@@ -725,29 +692,9 @@ def _build_engineering_metrics(
     now_utc: datetime,
 ) -> dict[str, Any]:
     """Backend-developer analytics derived from already-fetched data."""
-    calendar = collected.calendar if isinstance(collected.calendar, dict) else {}
-    weeks = calendar.get("weeks", []) if isinstance(calendar, dict) else []
-
-    active_days = 0
-    for week in weeks:
-        days = week.get("contributionDays", []) if isinstance(week, dict) else []
-        for day in days:
-            try:
-                if int(day.get("contributionCount", 0)) > 0:
-                    active_days += 1
-            except (TypeError, ValueError):
-                continue
-
-    weekly_cadence: list[int] = []
-    for week in weeks[-12:]:
-        total = 0
-        days = week.get("contributionDays", []) if isinstance(week, dict) else []
-        for day in days:
-            try:
-                total += int(day.get("contributionCount", 0))
-            except (TypeError, ValueError):
-                pass
-        weekly_cadence.append(total)
+    calendar = _calendar_model(collected)
+    active_days = calendar.active_days()
+    weekly_cadence = calendar.weekly_totals(last=12)
 
     non_self = [r for r in repos if not is_self_repo(r.get("name"))]
     automation_workflows = sum(int(r.get("workflow_file_count", 0) or 0) for r in non_self)
@@ -761,9 +708,8 @@ def _build_engineering_metrics(
         pushed = r.get("pushed_at", "")
         if not pushed:
             continue
-        try:
-            pushed_dt = datetime.fromisoformat(pushed.replace("Z", "+00:00"))
-        except ValueError:
+        pushed_dt = parse_iso(pushed)
+        if pushed_dt is None:
             continue
         gaps.append((now_utc - pushed_dt).days)
     gaps.sort()
@@ -857,11 +803,8 @@ _WEB_EVENT_LABELS = {
 
 
 def _activity_timezone() -> tuple[Any, str]:
-    name = (os.environ.get("PROFILE_ACTIVITY_TZ") or "America/New_York").strip()
-    try:
-        return ZoneInfo(name), name.rsplit("/", 1)[-1].replace("_", " ")
-    except (ZoneInfoNotFoundError, ValueError):
-        return timezone.utc, "UTC"
+    tz, name = activity_timezone()
+    return tz, name.rsplit("/", 1)[-1].replace("_", " ")
 
 
 def _safe_iso_date(value: Any) -> str:
@@ -910,26 +853,35 @@ def _public_contribution_calendar(calendar: Any) -> dict | None:
     return {"total": total, "weeks": weeks_out}
 
 
-def _activity_rhythm(events: list) -> dict | None:
+def _activity_rhythm(events: EventIndex | list, hourly: dict | None = None) -> dict | None:
     """Aggregate public events into a 7x24 weekday-hour matrix + event-type mix.
-    Counts ONLY — no repo names/URLs/payloads reach the published JSON."""
+    Counts ONLY — no repo names/URLs/payloads reach the published JSON.
+
+    *hourly* is the event log's ``{"YYYY-MM-DDTHH": {type: count}}`` UTC
+    buckets; when given it replaces *events* and covers the full history."""
     from collections import Counter
 
     tz, tz_label = _activity_timezone()
     matrix = [[0] * 24 for _ in range(7)]
     mix: Counter = Counter()
     total = 0
-    for ev in events or []:
-        if not isinstance(ev, dict):
+    for hour, counts in (hourly or {}).items():
+        dt = parse_iso(f"{hour}:00:00+00:00")
+        if dt is None:
             continue
-        label = _WEB_EVENT_LABELS.get(str(ev.get("type", "")))
-        ts = str(ev.get("created_at", ""))
-        if not label or not ts:
-            continue
-        try:
-            dt = datetime.fromisoformat(ts.replace("Z", "+00:00")).astimezone(tz)
-        except ValueError:
+        dt = dt.astimezone(tz)
+        for event_type, count in counts.items():
+            label = _WEB_EVENT_LABELS.get(str(event_type))
+            if not label:
+                continue
+            matrix[dt.weekday()][dt.hour] += int(count)
+            mix[label] += int(count)
+            total += int(count)
+    for ev in () if hourly else EventIndex.of(events).events:
+        label = _WEB_EVENT_LABELS.get(ev.type)
+        if not label or ev.at is None:
             continue
+        dt = ev.at.astimezone(tz)
         matrix[dt.weekday()][dt.hour] += 1
         mix[label] += 1
         total += 1
@@ -989,93 +941,104 @@ def _build_dashboard_payload(
     }
 
 
-def compute_profile_model(
-    collected: CollectedProfileData,
-    logger=print,
-    *,
-    allow_network_calls: bool = True,
-) -> dict[str, Any]:  # returns a dict matching the ProfileModel shape
-    repos = collected.repos
-    events = collected.events
-    language_bytes = collected.language_bytes
-    calendar = collected.calendar
-    repo_counts = collected.repo_counts
+# --- Model sections -----------------------------------------------------------
+# compute_profile_model runs these in order through model_sections.run_sections.
+# Each declares the CollectedProfileData fields and earlier-section values it
+# reads, so an incremental run (see compute_profile_model) recomputes only the
+# sections whose inputs changed. Keep the declarations in step with the code:
+# a field read but not declared would let a stale section be reused.
 
-    now_utc = datetime.now(timezone.utc)
-    total_stars = sum(repo.get("stargazers_count", 0) for repo in repos)
 
-    # --- language stats ---
-    top_languages, lang_count, _total_language_bytes = _build_language_stats(repos, language_bytes)
+@dataclass(frozen=True)
+class _ModelContext:
+    collected: CollectedProfileData
+    now_utc: datetime
+    allow_network_calls: bool
+    username: str
+    event_index: EventIndex
+    calendar: ContributionCalendar
+
 
-    # --- PR & release stats ---
-    pr_release = _build_pr_and_release_stats(
-        events, repos, now_utc, allow_network_calls=allow_network_calls,
+def _section_languages(ctx: _ModelContext, values: dict[str, Any]) -> dict[str, Any]:
+    top_languages, lang_count, _total_language_bytes = _build_language_stats(
+        ctx.collected.repos, ctx.collected.language_bytes,
     )
-    prs_merged = pr_release["prs_merged"]
-    releases_30d = pr_release["releases_30d"]
-    releases_status = pr_release["releases_status"]
-    releases_note = pr_release["releases_note"]
-    avg_release_gap_days = pr_release["avg_release_gap_days"]
-
-    # --- active repos (7d) ---
-    seven_days_ago = now_utc - timedelta(days=7)
+    return {"top_languages": top_languages, "lang_count": lang_count}
+
+
+def _section_pr_release(ctx: _ModelContext, values: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "pr_release": _build_pr_and_release_stats(
+            ctx.event_index, ctx.collected.repos, ctx.now_utc, allow_network_calls=ctx.allow_network_calls,
+            event_aggregates=ctx.collected.event_aggregates,
+        )
+    }
+
+
+def _section_active_repos(ctx: _ModelContext, values: dict[str, Any]) -> dict[str, Any]:
+    seven_days_ago = ctx.now_utc - timedelta(days=7)
     active_repos_7d = 0
-    for repo in repos:
+    for repo in ctx.collected.repos:
         if is_self_repo(repo.get("name")):
             continue
         pushed = repo.get("pushed_at", "")
         if not pushed:
             continue
-        try:
-            pushed_dt = datetime.fromisoformat(pushed.replace("Z", "+00:00"))
-        except ValueError:
-            continue
-        if pushed_dt >= seven_days_ago:
+        pushed_dt = parse_iso(pushed)
+        if pushed_dt is not None and pushed_dt >= seven_days_ago:
             active_repos_7d += 1
+    return {"active_repos_7d": active_repos_7d}
+
 
-    # --- CI quality ---
+def _section_ci_quality(ctx: _ModelContext, values: dict[str, Any]) -> dict[str, Any]:
     repo_ci_lookup, ci_quality = _build_ci_quality(
-        repos,
-        allow_network_calls=allow_network_calls,
+        ctx.collected.repos,
+        allow_network_calls=ctx.allow_network_calls,
     )
-    ci_count_effective = ci_quality["ci_count_effective"]
-    ci_coverage_pct = ci_quality["ci_coverage_pct"]
+    return {"repo_ci_lookup": repo_ci_lookup, "ci_quality": ci_quality}
+
 
-    # --- commit stats ---
+def _section_commit_stats(ctx: _ModelContext, values: dict[str, Any]) -> dict[str, Any]:
     public_scope_commits, commits_status, commits_note = _build_commit_stats(
-        collected, repos, allow_network_calls=allow_network_calls,
+        ctx.collected, ctx.collected.repos, allow_network_calls=ctx.allow_network_calls,
     )
+    return {
+        "commit_stats": {
+            "public_scope_commits": public_scope_commits,
+            "commits_status": commits_status,
+            "commits_note": commits_note,
+        }
+    }
+
+
+def _section_streak(ctx: _ModelContext, values: dict[str, Any]) -> dict[str, Any]:
+    return {"streak_days": _compute_current_streak_days(ctx.calendar, ctx.now_utc, profile_today())}
 
-    stars_per_public_repo = (total_stars / len(repos)) if repos else 0.0
-    streak_days = _compute_current_streak_days(calendar, now_utc, _profile_today())
 
-    # --- recent repos ---
+def _section_recent_repos(ctx: _ModelContext, values: dict[str, Any]) -> dict[str, Any]:
     recent_repos, recent_commit_message_by_repo = _build_recent_repos(
-        repos,
-        seven_days_ago,
-        collected.latest_push_message_by_repo,
-        allow_network_calls,
-        private_repos=collected.private_repos,
+        ctx.collected.repos,
+        ctx.now_utc - timedelta(days=7),
+        ctx.collected.latest_push_message_by_repo,
+        ctx.allow_network_calls,
+        private_repos=ctx.collected.private_repos,
     )
+    return {"recent_repos": recent_repos, "recent_commit_message_by_repo": recent_commit_message_by_repo}
 
-    # --- spotlight ---
+
+def _section_spotlight(ctx: _ModelContext, values: dict[str, Any]) -> dict[str, Any]:
     spotlight_data = []
     for repo_name in FEATURED_REPOS:
-        repo = next((item for item in collected.all_repos if item["name"] == repo_name), None)
+        repo = next((item for item in ctx.collected.all_repos if item["name"] == repo_name), None)
         if not repo:
             continue
         weekly = []
-        if allow_network_calls:
+        if ctx.allow_network_calls:
             weekly = gh.get_repo_commits_last_n_weeks(repo["owner"]["login"], repo["name"])
-        has_ci = has_ci_workflow(repo, allow_network_calls=allow_network_calls)
+        has_ci = has_ci_workflow(repo, allow_network_calls=ctx.allow_network_calls)
         pushed_raw = repo.get("pushed_at") or ""
-        status = "active"
-        if pushed_raw:
-            try:
-                pushed_dt = datetime.fromisoformat(pushed_raw.replace("Z", "+00:00"))
-                status = "active" if (now_utc - pushed_dt).days <= 30 else "maintained"
-            except ValueError:
-                status = "active"
+        pushed_dt = parse_iso(pushed_raw)
+        status = "maintained" if pushed_dt is not None and (ctx.now_utc - pushed_dt).days > 30 else "active"
         spotlight_data.append(
             {
                 "name": repo["name"],
@@ -1091,16 +1054,28 @@ def compute_profile_model(
                 "has_ci": has_ci,
             }
         )
+    return {"spotlight_data": spotlight_data}
+
+
+def _section_engineering(ctx: _ModelContext, values: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "engineering": _build_engineering_metrics(
+            ctx.collected, ctx.collected.repos, values["top_languages"], ctx.now_utc,
+        )
+    }
+
 
-    # --- scorecard ---
-    engineering = _build_engineering_metrics(collected, repos, top_languages, now_utc)
+def _section_scorecard(ctx: _ModelContext, values: dict[str, Any]) -> dict[str, Any]:
+    repos = ctx.collected.repos
+    engineering = values["engineering"]
+    total_stars = sum(repo.get("stargazers_count", 0) for repo in repos)
     scorecard = {
-        "releases_30d": releases_30d,
-        "active_repos_7d": active_repos_7d,
-        "avg_release_gap_days": avg_release_gap_days,
-        "stars_per_public_repo": stars_per_public_repo,
-        "ci_coverage_pct": ci_coverage_pct,
-        "last_year_contributions": collected.total_contributions,
+        "releases_30d": values["pr_release"]["releases_30d"],
+        "active_repos_7d": values["active_repos_7d"],
+        "avg_release_gap_days": values["pr_release"]["avg_release_gap_days"],
+        "stars_per_public_repo": (total_stars / len(repos)) if repos else 0.0,
+        "ci_coverage_pct": values["ci_quality"]["ci_coverage_pct"],
+        "last_year_contributions": ctx.collected.total_contributions,
         "active_days_last_year": engineering["active_days_last_year"],
         "automation_workflows": engineering["automation_workflows"],
         "primary_lang_share_pct": engineering["primary_lang_share_pct"],
@@ -1113,17 +1088,21 @@ def compute_profile_model(
         "GREEN": GREEN,
         "ORANGE": ORANGE,
     }
-    scorecard_cards = _build_scorecard_cards(scorecard, accent_colors)
+    return {"scorecard": scorecard, "scorecard_cards": _build_scorecard_cards(scorecard, accent_colors)}
 
-    # --- repo overview ---
+
+def _section_repo_overview(ctx: _ModelContext, values: dict[str, Any]) -> dict[str, Any]:
     repo_overview_rows, featured_repo_facts = _build_repo_overview_rows(
-        repos,
-        recent_commit_message_by_repo,
-        collected.latest_push_message_by_repo,
-        repo_ci_lookup,
+        ctx.collected.repos,
+        values["recent_commit_message_by_repo"],
+        ctx.collected.latest_push_message_by_repo,
+        values["repo_ci_lookup"],
     )
+    return {"repo_overview_rows": repo_overview_rows, "featured_repo_facts": featured_repo_facts}
+
 
-    # --- data scope ---
+def _section_data_scope(ctx: _ModelContext, values: dict[str, Any]) -> dict[str, Any]:
+    repo_counts = ctx.collected.repo_counts
     data_scope: DataScope = {
         "repos_included": "public + owned + non-fork",
         "activity_metric_scope": "GitHub contributionCalendar.totalContributions (last 12 months)",
@@ -1132,15 +1111,21 @@ def compute_profile_model(
         "public_owned_nonfork_repos_total": repo_counts["public_owned_nonfork"],
         "private_owned_repos_total": repo_counts["private_owned"],
     }
+    return {"data_scope": data_scope}
 
-    # --- snapshot ---
+
+def _section_snapshot(ctx: _ModelContext, values: dict[str, Any]) -> dict[str, Any]:
     snapshot: Snapshot = _build_snapshot_dict(
-        collected, repo_counts, total_stars, lang_count,
-        prs_merged, releases_30d, ci_count_effective, streak_days,
-        public_scope_commits,
+        ctx.collected, ctx.collected.repo_counts,
+        sum(repo.get("stargazers_count", 0) for repo in ctx.collected.repos),
+        values["lang_count"],
+        values["pr_release"]["prs_merged"],
+        values["pr_release"]["releases_30d"],
+        values["ci_quality"]["ci_count_effective"],
+        values["streak_days"],
+        values["commit_stats"]["public_scope_commits"],
     )
 
-    # --- snapshot rows & cards ---
     snapshot_rows: list[SnapshotRow] = []
     for definition in SNAPSHOT_METRICS:
         key = definition["key"]
@@ -1163,11 +1148,13 @@ def compute_profile_model(
         }
         for row in snapshot_rows
     ]
+    return {"snapshot": snapshot, "snapshot_rows": snapshot_rows, "snapshot_cards": snapshot_cards}
+
 
-    # --- recent activity & focus ---
+def _section_recent_activity(ctx: _ModelContext, values: dict[str, Any]) -> dict[str, Any]:
     recent_created = []
     for r in sorted(
-        [r for r in repos if not is_self_repo(r.get("name"))],
+        [r for r in ctx.collected.repos if not is_self_repo(r.get("name"))],
         key=lambda item: item.get("created_at", ""),
         reverse=True,
     )[:10]:
@@ -1185,18 +1172,34 @@ def compute_profile_model(
         focus_next,
         focus_shipped,
         _repo_row_by_full_name,
-    ) = _build_recent_activity(events, recent_repos, repo_overview_rows, USERNAME)
+    ) = _build_recent_activity(ctx.event_index, values["recent_repos"], values["repo_overview_rows"], ctx.username)
 
     activity_feed = _build_activity_feed(
         release_list,
         pr_list,
         contributions,
         recent_created,
-        recent_repos,
-        USERNAME,
+        values["recent_repos"],
+        ctx.username,
     )
+    return {
+        "recent_created": recent_created,
+        "focus": {
+            "now": focus_now,
+            "next": focus_next,
+            "shipped": focus_shipped,
+        },
+        "activity_feed": activity_feed,
+        "recent_releases": release_list,
+        "recent_pull_requests": pr_list,
+    }
+
 
-    # --- data quality ---
+def _section_data_quality(ctx: _ModelContext, values: dict[str, Any]) -> dict[str, Any]:
+    ci_quality = values["ci_quality"]
+    commit_stats = values["commit_stats"]
+    pr_release = values["pr_release"]
+    events = ctx.collected.events
     events_status = "ok" if events else "limited"
     events_note = (
         "Public events feed available."
@@ -1206,22 +1209,24 @@ def compute_profile_model(
     data_quality: DataQuality = {
         "ci_status": ci_quality["ci_status"],
         "ci_note": ci_quality["ci_note"],
-        "commits_status": commits_status,
-        "commits_note": commits_note,
-        "releases_status": releases_status,
-        "releases_note": releases_note,
+        "commits_status": commit_stats["commits_status"],
+        "commits_note": commit_stats["commits_note"],
+        "releases_status": pr_release["releases_status"],
+        "releases_note": pr_release["releases_note"],
         "events_status": events_status,
         "events_note": events_note,
         # Coarse auth state only — the precise token mode is internal diagnostics
         # and must never appear on the public profile / published snapshot.
         "token_mode": (
             "authenticated"
-            if collected.token_mode not in {"none", "unauthenticated", ""}
+            if ctx.collected.token_mode not in {"none", "unauthenticated", ""}
             else "unauthenticated"
         ),
     }
+    return {"data_quality": data_quality}
+
 
-    # --- theme ---
+def _section_dashboard(ctx: _ModelContext, values: dict[str, Any]) -> dict[str, Any]:
     theme = {
         "bg_main": BG_DARK,
         "bg_panel": BG_CARD,
@@ -1237,64 +1242,249 @@ def compute_profile_model(
         "accent_orange": ORANGE,
         "accent_blue": BLUE,
     }
-
-    # --- dashboard payload ---
+    focus = values["focus"]
     dashboard_data = _build_dashboard_payload(
-        now_utc=now_utc,
-        username=USERNAME,
+        now_utc=ctx.now_utc,
+        username=ctx.username,
         theme=theme,
-        snapshot=snapshot,
-        snapshot_rows=snapshot_rows,
-        snapshot_cards=snapshot_cards,
-        data_quality=data_quality,
-        scorecard=scorecard,
-        scorecard_cards=scorecard_cards,
-        data_scope=data_scope,
-        featured_repo_facts=featured_repo_facts,
-        top_languages=top_languages,
-        repo_overview_rows=repo_overview_rows,
-        recent_created=recent_created,
-        focus_now=focus_now,
-        focus_next=focus_next,
-        focus_shipped=focus_shipped,
-        activity_feed=activity_feed,
-        release_list=release_list,
-        pr_list=pr_list,
+        snapshot=values["snapshot"],
+        snapshot_rows=values["snapshot_rows"],
+        snapshot_cards=values["snapshot_cards"],
+        data_quality=values["data_quality"],
+        scorecard=values["scorecard"],
+        scorecard_cards=values["scorecard_cards"],
+        data_scope=values["data_scope"],
+        featured_repo_facts=values["featured_repo_facts"],
+        top_languages=values["top_languages"],
+        repo_overview_rows=values["repo_overview_rows"],
+        recent_created=values["recent_created"],
+        focus_now=focus["now"],
+        focus_next=focus["next"],
+        focus_shipped=focus["shipped"],
+        activity_feed=values["activity_feed"],
+        release_list=values["recent_releases"],
+        pr_list=values["recent_pull_requests"],
     )
-    dashboard_data["engineering"] = engineering
-    calendar_public = _public_contribution_calendar(calendar)
+    dashboard_data["engineering"] = values["engineering"]
+    calendar_public = _public_contribution_calendar(ctx.collected.calendar)
     if calendar_public:
         dashboard_data["contribution_calendar"] = calendar_public
-    rhythm = _activity_rhythm(events)
+    rhythm = _activity_rhythm(ctx.event_index, ctx.collected.event_aggregates.get("hourly"))
     if rhythm:
         dashboard_data["activity_rhythm"] = rhythm
+    return {"dashboard_data": dashboard_data}
+
+
+MODEL_SECTIONS: tuple[ModelSection, ...] = (
+    ModelSection(
+        "languages", _section_languages,
+        fields=("repos", "language_bytes"),
+        outputs=("top_languages", "lang_count"),
+    ),
+    ModelSection(
+        "pr_release", _section_pr_release,
+        fields=("events", "event_aggregates", "repos"),
+        outputs=("pr_release",),
+        clock=True,
+    ),
+    ModelSection("active_repos", _section_active_repos, fields=("repos",), outputs=("active_repos_7d",), clock=True),
+    # CI state and the commit fallback are live API reads that can change without
+    # a push, so like the clock sections they are recomputed at least hourly.
+    ModelSection(
+        "ci_quality", _section_ci_quality,
+        fields=("repos",),
+        outputs=("repo_ci_lookup", "ci_quality"),
+        clock=True,
+    ),
+    ModelSection(
+        "commit_stats", _section_commit_stats,
+        fields=("repos", "public_scope_commits", "total_contributions"),
+        outputs=("commit_stats",),
+        clock=True,
+    ),
+    ModelSection("streak", _section_streak, fields=("calendar",), outputs=("streak_days",), clock=True),
+    ModelSection(
+        "recent_repos", _section_recent_repos,
+        fields=("repos", "latest_push_message_by_repo", "private_repos"),
+        outputs=("recent_repos", "recent_commit_message_by_repo"),
+        clock=True,
+    ),
+    ModelSection("spotlight", _section_spotlight, fields=("all_repos",), outputs=("spotlight_data",), clock=True),
+    ModelSection(
+        "engineering", _section_engineering,
+        fields=("calendar", "repos", "repo_counts", "private_repos"),
+        inputs=("top_languages",),
+        outputs=("engineering",),
+        clock=True,
+    ),
+    ModelSection(
+        "scorecard", _section_scorecard,
+        fields=("repos", "total_contributions"),
+        inputs=("pr_release", "active_repos_7d", "ci_quality", "engineering"),
+        outputs=("scorecard", "scorecard_cards"),
+    ),
+    ModelSection(
+        "repo_overview", _section_repo_overview,
+        fields=("repos", "latest_push_message_by_repo"),
+        inputs=("recent_commit_message_by_repo", "repo_ci_lookup"),
+        outputs=("repo_overview_rows", "featured_repo_facts"),
+        clock=True,
+    ),
+    ModelSection("data_scope", _section_data_scope, fields=("repo_counts",), outputs=("data_scope",)),
+    ModelSection(
+        "snapshot", _section_snapshot,
+        fields=("repos", "repo_counts", "total_contributions"),
+        inputs=("lang_count", "pr_release", "ci_quality", "streak_days", "commit_stats"),
+        outputs=("snapshot", "snapshot_rows", "snapshot_cards"),
+    ),
+    ModelSection(
+        "recent_activity", _section_recent_activity,
+        fields=("repos", "events"),
+        inputs=("recent_repos", "repo_overview_rows"),
+        outputs=("recent_created", "focus", "activity_feed", "recent_releases", "recent_pull_requests"),
+        clock=True,
+    ),
+    ModelSection(
+        "data_quality", _section_data_quality,
+        fields=("events", "token_mode"),
+        inputs=("ci_quality", "commit_stats", "pr_release"),
+        outputs=("data_quality",),
+    ),
+    ModelSection(
+        "dashboard", _section_dashboard,
+        fields=("calendar", "events", "event_aggregates"),
+        inputs=(
+            "snapshot", "snapshot_rows", "snapshot_cards", "data_quality", "scorecard", "scorecard_cards",
+            "data_scope", "featured_repo_facts", "top_languages", "repo_overview_rows", "recent_created",
+            "focus", "activity_feed", "recent_releases", "recent_pull_requests", "engineering",
+        ),
+        outputs=("dashboard_data",),
+    ),
+)
 
-    return {
-        "now_utc": now_utc,
-        "lang_count": lang_count,
-        "snapshot": snapshot,
-        "snapshot_rows": snapshot_rows,
-        "snapshot_cards": snapshot_cards,
-        "scorecard": scorecard,
-        "scorecard_cards": scorecard_cards,
-        "data_scope": data_scope,
-        "data_quality": data_quality,
-        "featured_repo_facts": featured_repo_facts,
-        "top_languages": top_languages,
-        "repo_overview_rows": repo_overview_rows,
-        "recent_created": recent_created,
-        "focus": {
-            "now": focus_now,
-            "next": focus_next,
-            "shipped": focus_shipped,
-        },
-        "activity_feed": activity_feed,
-        "recent_releases": release_list,
-        "recent_pull_requests": pr_list,
-        "dashboard_data": dashboard_data,
-        "recent_repos": recent_repos,
-        "spotlight_data": spotlight_data,
-        "engineering": engineering,
-        "token_mode": collected.token_mode,
-        "cache_mode": collected.cache_mode,
-    }
+# ProfileModel fields taken as-is from section outputs.
+_MODEL_VALUE_FIELDS = (
+    "lang_count",
+    "snapshot",
+    "snapshot_rows",
+    "snapshot_cards",
+    "scorecard",
+    "scorecard_cards",
+    "data_scope",
+    "data_quality",
+    "featured_repo_facts",
+    "top_languages",
+    "repo_overview_rows",
+    "recent_created",
+    "focus",
+    "activity_feed",
+    "recent_releases",
+    "recent_pull_requests",
+    "recent_repos",
+    "spotlight_data",
+    "engineering",
+)
+
+# Previous model state for incremental runs, relative to the output root.
+MODEL_STATE_PATH = Path("site/data/profile_model_state.json")
+
+
+# Modules whose code shapes section outputs (this one, the helpers, metric
+# definitions and theme colours it imports). Extend when adding an import.
+MODEL_CODE_MODULES: tuple[str, ...] = (
+    __name__,
+    "scripts.contracts",
+    "scripts.contracts.contribution_calendar",
+    "scripts.contracts.profile_contract",
+    "scripts.contracts.profile_model",
+    "scripts.core.config",
+    "scripts.core.timestamps",
+    "scripts.github.github_client",
+    "scripts.pipeline.collect_data",
+    "scripts.pipeline.event_index",
+    "scripts.pipeline.model_sections",
+    "scripts.pipeline.profile_helpers",
+)
+
+
+def _model_code_digest() -> str:
+    """Digest of the source of every ``MODEL_CODE_MODULES`` module."""
+    digest = hashlib.sha256()
+    for name in MODEL_CODE_MODULES:
+        digest.update(name.encode("utf-8"))
+        try:
+            digest.update(Path(importlib.import_module(name).__file__ or "").read_bytes())
+        except (ImportError, OSError):
+            digest.update(b"?")
+    return digest.hexdigest()
+
+
+def _model_salt(username: str, allow_network_calls: bool) -> str:
+    """Everything besides the declared inputs that shapes section outputs.
+
+    Hashing the model's code means editing any module it depends on
+    invalidates every persisted section rather than serving output from the
+    old code.
+    """
+    return fingerprint(
+        [
+            _model_code_digest(),
+            username,
+            list(FEATURED_REPOS),
+            profile_timezone_name(),
+            activity_timezone()[1],
+            allow_network_calls,
+        ]
+    )
+
+
+def compute_profile_model(
+    collected: CollectedProfileData,
+    logger=print,
+    *,
+    allow_network_calls: bool = True,
+    state_path: Path | None = None,
+) -> ProfileModel:
+    """Build the profile model section by section (see ``MODEL_SECTIONS``).
+
+    With *state_path*, the run is incremental: sections whose inputs match the
+    state persisted there by the previous run reuse its outputs, and the new
+    state is written back.
+    """
+    username = active_username()
+    now_utc = datetime.now(timezone.utc)
+    ctx = _ModelContext(
+        collected=collected,
+        now_utc=now_utc,
+        allow_network_calls=allow_network_calls,
+        username=username,
+        # Parsed once; every event-driven section reads this index.
+        event_index=collected.event_index if collected.event_index is not None else EventIndex(collected.events),
+        calendar=_calendar_model(collected),
+    )
+    previous = load_model_state(state_path) if state_path is not None else None
+    run = run_sections(
+        MODEL_SECTIONS,
+        ctx,
+        source=collected,
+        salt=_model_salt(username, allow_network_calls),
+        now_utc=now_utc,
+        previous=previous,
+    )
+    if state_path is not None:
+        save_model_state(state_path, run.state)
+        logger(
+            f"  Model sections: {len(run.reused)} reused, {len(run.recomputed)} recomputed"
+            + (f" ({', '.join(run.recomputed)})" if run.recomputed and run.reused else "")
+        )
+
+    values = run.values
+    # The dashboard only reads the clock for its stamp; a reused payload gets this run's.
+    dashboard_data = {**values["dashboard_data"], "generated_at": now_utc.isoformat().replace("+00:00", "Z")}
+    return ProfileModel(
+        now_utc=now_utc,
+        dashboard_data=dashboard_data,
+        token_mode=collected.token_mode,
+        cache_mode=collected.cache_mode,
+        **{name: values[name] for name in _MODEL_VALUE_FIELDS},
+    )
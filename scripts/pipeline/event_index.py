@@ -0,0 +1,77 @@
+"""Single-pass index over the public events feed.
+
+The feed is walked once: every event's ``created_at`` is parsed a single time
+and the events are grouped by type, newest first. The builders in
+``compute_metrics`` and ``collect_data``'s push-message scan read the slice
+they need from the index instead of rescanning (and re-parsing) the whole
+list, so model computation scales with the event count, not events x builders.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+from scripts.core.timestamps import parse_iso
+
+_OLDEST = datetime.min.replace(tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class IndexedEvent:
+    type: str
+    repo: str
+    actor: str
+    # Raw timestamp as published; ``at`` is its parsed form (None if unusable).
+    created_at: str
+    at: datetime | None
+    payload: dict = field(default_factory=dict)
+
+
+def _index_event(event: dict) -> IndexedEvent:
+    created_at = event.get("created_at") or ""
+    repo = event.get("repo")
+    actor = event.get("actor")
+    payload = event.get("payload")
+    return IndexedEvent(
+        type=str(event.get("type") or ""),
+        repo=str((repo.get("name") if isinstance(repo, dict) else "") or ""),
+        actor=str((actor.get("login") if isinstance(actor, dict) else "") or ""),
+        created_at=str(created_at),
+        at=parse_iso(created_at),
+        payload=payload if isinstance(payload, dict) else {},
+    )
+
+
+class EventIndex:
+    """Events parsed once, sorted newest first, and grouped by type."""
+
+    def __init__(self, events: Iterable[Any] | None = None):
+        indexed = [_index_event(event) for event in events or () if isinstance(event, dict)]
+        # Stable: events with equal (or unusable) timestamps keep feed order.
+        indexed.sort(key=lambda event: event.at or _OLDEST, reverse=True)
+        self.events: tuple[IndexedEvent, ...] = tuple(indexed)
+        by_type: dict[str, list[IndexedEvent]] = {}
+        for event in self.events:
+            by_type.setdefault(event.type, []).append(event)
+        self._by_type = {event_type: tuple(group) for event_type, group in by_type.items()}
+
+    @classmethod
+    def of(cls, events: "EventIndex | Iterable[Any] | None") -> "EventIndex":
+        """Return *events* if it is already an index, else index it."""
+        return events if isinstance(events, EventIndex) else cls(events)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def of_type(self, *event_types: str) -> tuple[IndexedEvent, ...]:
+        """Events of the given type(s), newest first."""
+        if len(event_types) == 1:
+            return self._by_type.get(event_types[0], ())
+        wanted = set(event_types)
+        return tuple(event for event in self.events if event.type in wanted)
+
+    def times(self, event_type: str) -> list[datetime]:
+        """Parsed timestamps of *event_type* events, newest first."""
+        return [event.at for event in self.of_type(event_type) if event.at is not None]
@@ -0,0 +1,147 @@
+"""Incremental recomputation of profile-model sections.
+
+The profile model is built as a sequence of named sections. Each section
+declares the ``CollectedProfileData`` fields it reads (``fields``), the values
+earlier sections produced that it reads (``inputs``), the values it produces
+(``outputs``), and whether it reads the clock (``clock``: relative times,
+rolling windows). A section's fingerprint hashes exactly those inputs -- plus
+the current hour for clock sections and a caller-supplied salt for code and
+configuration -- so when a previous model state is supplied, a section whose
+fingerprint is unchanged reuses its persisted outputs instead of running.
+
+Upstream sections are fingerprinted by the values they produced, not by their
+own inputs: a section recomputed for the new hour whose outputs came out the
+same does not force its dependents to recompute.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+# Bump when the persisted state layout changes; older states are ignored.
+MODEL_STATE_VERSION = 1
+
+SectionFn = Callable[[Any, dict[str, Any]], dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class ModelSection:
+    name: str
+    build: SectionFn
+    fields: tuple[str, ...] = ()
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    clock: bool = False
+
+
+@dataclass
+class SectionRun:
+    values: dict[str, Any]
+    state: dict[str, Any]
+    reused: list[str] = field(default_factory=list)
+    recomputed: list[str] = field(default_factory=list)
+
+
+def fingerprint(value: Any) -> str:
+    """Stable short digest of a JSON-shaped *value*."""
+    blob = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:20]
+
+
+def clock_bucket(now_utc: datetime) -> str:
+    """Granularity at which clock sections are recomputed (one hour)."""
+    return now_utc.strftime("%Y-%m-%dT%H")
+
+
+def _validate(sections: tuple[ModelSection, ...] | list[ModelSection]) -> None:
+    produced: set[str] = set()
+    for section in sections:
+        missing = [value for value in section.inputs if value not in produced]
+        if missing:
+            raise ValueError(f"section {section.name} reads values no earlier section produces: {', '.join(missing)}")
+        clash = produced.intersection(section.outputs)
+        if clash:
+            raise ValueError(f"section {section.name} re-produces: {', '.join(sorted(clash))}")
+        produced.update(section.outputs)
+
+
+def run_sections(
+    sections: tuple[ModelSection, ...] | list[ModelSection],
+    ctx: Any,
+    *,
+    source: Any,
+    salt: str,
+    now_utc: datetime,
+    previous: dict[str, Any] | None = None,
+) -> SectionRun:
+    """Run *sections* in order, passing *ctx* to each ``build``.
+
+    Section ``fields`` are attributes of *source* (the collected data).
+
+    With *previous* (a state returned by an earlier run), sections whose
+    fingerprint is unchanged reuse the stored outputs. The returned ``state``
+    holds every section's fingerprint and outputs for the next run.
+    """
+    _validate(sections)
+    stored = (previous or {}).get("sections") if (previous or {}).get("version") == MODEL_STATE_VERSION else None
+    stored = stored if isinstance(stored, dict) else {}
+    bucket = clock_bucket(now_utc)
+    field_prints: dict[str, str] = {}
+    value_prints: dict[str, str] = {}
+    values: dict[str, Any] = {}
+    run = SectionRun(values=values, state={"version": MODEL_STATE_VERSION, "sections": {}})
+
+    for section in sections:
+        for name in section.fields:
+            if name not in field_prints:
+                field_prints[name] = fingerprint(getattr(source, name))
+        key = fingerprint(
+            [
+                salt,
+                section.name,
+                [field_prints[name] for name in section.fields],
+                [value_prints[name] for name in section.inputs],
+                bucket if section.clock else "",
+            ]
+        )
+        prior = stored.get(section.name)
+        prior_outputs = prior.get("outputs") if isinstance(prior, dict) and prior.get("fingerprint") == key else None
+        if isinstance(prior_outputs, dict) and set(prior_outputs) == set(section.outputs):
+            produced = prior_outputs
+            run.reused.append(section.name)
+        else:
+            produced = section.build(ctx, {name: values[name] for name in section.inputs}) or {}
+            if set(produced) != set(section.outputs):
+                raise ValueError(
+                    f"section {section.name} outputs mismatch "
+                    f"(expected {sorted(section.outputs)}, got {sorted(produced)})"
+                )
+            run.recomputed.append(section.name)
+        values.update(produced)
+        for name in section.outputs:
+            value_prints[name] = fingerprint(produced[name])
+        run.state["sections"][section.name] = {"fingerprint": key, "outputs": produced}
+    return run
+
+
+def load_model_state(path: Path) -> dict[str, Any] | None:
+    """Read a persisted model state; ``None`` when missing or unreadable."""
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def save_model_state(path: Path, state: dict[str, Any]) -> None:
+    """Write *state* atomically (a crash never leaves a half-written file)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(state, separators=(",", ":"), default=str) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
@@ -5,7 +5,8 @@ from __future__ import annotations
 from datetime import datetime, timezone
 
 from scripts.github import github_client as gh
-from scripts.core.config import BOT_ACTOR_PREFIXES, BOT_COMMIT_MARKERS, SELF_REPO, USERNAME
+from scripts.core.config import BOT_ACTOR_PREFIXES, BOT_COMMIT_MARKERS, active_username
+from scripts.core.timestamps import parse_iso
 
 
 def is_bot_commit_message(message: str | None) -> bool:
@@ -26,17 +27,22 @@ def is_bot_actor(login: str | None) -> bool:
 
 def is_self_repo(name: str | None, full_name: str | None = None) -> bool:
     """True when the repo is the profile repo itself (username/username)."""
-    if name and name == SELF_REPO:
+    username = active_username()
+    if name and name == username:
         return True
-    if full_name and full_name == f"{USERNAME}/{SELF_REPO}":
+    if full_name and full_name == f"{username}/{username}":
         return True
     return False
 
 
 def time_ago(iso_str: str) -> str:
-    if not iso_str:
+    return time_ago_from(parse_iso(iso_str))
+
+
+def time_ago_from(dt: datetime | None) -> str:
+    """``time_ago`` for an already-parsed (aware) timestamp."""
+    if dt is None:
         return "unknown"
-    dt = datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
     delta = datetime.now(timezone.utc) - dt
     days = delta.days
     if days == 0:
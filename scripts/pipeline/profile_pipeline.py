@@ -5,9 +5,10 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+from scripts.core.runtime_env import incremental_model_from_env
 from scripts.pipeline.collect_data import collect_profile_data
 from scripts.pipeline.collect_data import CollectedProfileData
-from scripts.pipeline.compute_metrics import compute_profile_model
+from scripts.pipeline.compute_metrics import MODEL_STATE_PATH, compute_profile_model
 from scripts.pipeline.render_outputs import ensure_output_dirs, generate_assets, render_readme, write_dashboard_json
 
 
@@ -16,28 +17,31 @@ def run_profile_pipeline_with_collected(
     logger=print,
     *,
     allow_network_calls: bool = True,
+    output_root: Path = Path("."),
 ) -> dict:
-    ensure_output_dirs()
+    ensure_output_dirs(output_root)
     model = compute_profile_model(
         collected,
         logger=logger,
         allow_network_calls=allow_network_calls,
+        state_path=output_root / MODEL_STATE_PATH if incremental_model_from_env() else None,
     )
-    generate_assets(collected, model, logger=logger)
-    write_dashboard_json(model, logger=logger)
-    render_readme(model, logger=logger)
+    generate_assets(collected, model, logger=logger, root=output_root)
+    write_dashboard_json(model, logger=logger, root=output_root)
+    render_readme(model, logger=logger, root=output_root)
     return {
         "collected": collected,
         "model": model,
     }
 
 
-def run_profile_pipeline(logger=print) -> dict:
-    collected = collect_profile_data(logger=logger)
+def run_profile_pipeline(logger=print, *, output_root: Path = Path(".")) -> dict:
+    collected = collect_profile_data(logger=logger, output_root=output_root)
     return run_profile_pipeline_with_collected(
         collected,
         logger=logger,
         allow_network_calls=True,
+        output_root=output_root,
     )
 
 
@@ -7,6 +7,8 @@ from pathlib import Path
 
 import jinja2
 
+from scripts.contracts.contribution_calendar import ContributionCalendar
+from scripts.contracts.profile_model import ProfileModel, public_dashboard_data
 from scripts.pipeline.collect_data import CollectedProfileData
 from scripts.rendering.generate_activity_heatmap import generate as gen_heatmap
 from scripts.rendering.generate_badges import generate as gen_badges
@@ -22,80 +24,94 @@ from scripts.rendering.generate_snapshot_panel import generate as gen_snapshot_p
 from scripts.rendering.generate_streak_summary import generate as gen_streak_summary
 
 
-def ensure_output_dirs() -> None:
-    Path("assets").mkdir(exist_ok=True)
-    Path("site/data").mkdir(parents=True, exist_ok=True)
+def ensure_output_dirs(root: Path = Path(".")) -> None:
+    (root / "assets").mkdir(parents=True, exist_ok=True)
+    (root / "site/data").mkdir(parents=True, exist_ok=True)
 
 
-def _primary_language(model: dict) -> str:
-    """The dominant language NAME (e.g. 'Python') from the shared snapshot, or ''.
-
-    Null-safe: a missing/None name or a non-list top_languages yields '' (never the
-    literal 'None' or a crash), so the tile falls back to its generic noun.
-    """
-    langs = model.get("top_languages")
-    if isinstance(langs, list) and langs and isinstance(langs[0], dict):
-        return str(langs[0].get("name") or "").strip()
-    return ""
-
-
-def generate_assets(collected: CollectedProfileData, model: dict, logger=print) -> None:
+def generate_assets(
+    collected: CollectedProfileData,
+    model: ProfileModel,
+    logger=print,
+    *,
+    root: Path = Path("."),
+) -> None:
+    """Write every SVG under *root* (the repo checkout unless a batch build
+    gives each user its own directory); logged paths are relative to *root*."""
     logger("\n[8/8] Generating SVGs...")
-    primary_language = _primary_language(model)
+    primary_language = model.primary_language
 
     gen_badges(
         public_nonfork_repos=collected.repo_counts["public_owned_nonfork"],
         public_forks=collected.repo_counts["public_owned_forks"],
         private_owned_repos=collected.repo_counts["private_owned"],
-        ci_count=model["snapshot"]["ci_repos"],
+        ci_count=model.snapshot["ci_repos"],
         last_year_contributions=collected.total_contributions,
+        output_path=str(root / "assets/badges.svg"),
     )
     logger("  -> assets/badges.svg")
 
-    gen_lang_chart(collected.language_bytes)
+    gen_lang_chart(collected.language_bytes, output_path=str(root / "assets/lang_breakdown.svg"))
     logger("  -> assets/lang_breakdown.svg")
 
-    gen_working(model["recent_repos"])
+    gen_working(model.recent_repos, output_path=str(root / "assets/currently_working.svg"))
     logger("  -> assets/currently_working.svg")
 
-    gen_heatmap(collected.events)
+    gen_heatmap(collected.events, output_path=str(root / "assets/activity_heatmap.svg"))
     logger("  -> assets/activity_heatmap.svg")
 
-    gen_contribution_panel(collected.calendar)
+    # One columnar calendar feeds both calendar cards (fixture runs build it here).
+    calendar = (
+        collected.calendar_model
+        if collected.calendar_model is not None
+        else ContributionCalendar.from_graphql(collected.calendar)
+    )
+    gen_contribution_panel(calendar, output_path=str(root / "assets/contribution_calendar.svg"))
     logger("  -> assets/contribution_calendar.svg")
 
-    gen_spotlight(model["spotlight_data"])
+    gen_spotlight(model.spotlight_data, output_path=str(root / "assets/repo_spotlight.svg"))
     logger("  -> assets/repo_spotlight.svg")
 
-    gen_scorecard(model["scorecard"], tiles=model["scorecard_cards"], primary_language=primary_language)
+    gen_scorecard(
+        model.scorecard,
+        tiles=model.scorecard_cards,
+        primary_language=primary_language,
+        output_path=str(root / "assets/builder_scorecard.svg"),
+    )
     logger("  -> assets/builder_scorecard.svg")
 
-    gen_cadence(model["engineering"], primary_language=primary_language)
+    gen_cadence(
+        model.engineering,
+        primary_language=primary_language,
+        output_path=str(root / "assets/engineering_cadence.svg"),
+    )
     logger("  -> assets/engineering_cadence.svg")
 
-    gen_focus_board(model["focus"])
+    gen_focus_board(model.focus, output_path=str(root / "assets/now_next_shipped.svg"))
     logger("  -> assets/now_next_shipped.svg")
 
     gen_streak_summary(
-        calendar=collected.calendar,
-        current_streak_days=model["snapshot"]["streak_days"],
+        calendar=calendar,
+        current_streak_days=model.snapshot["streak_days"],
         total_contributions=collected.total_contributions,
+        output_path=str(root / "assets/streak_summary.svg"),
     )
     logger("  -> assets/streak_summary.svg")
 
     gen_snapshot_panel(
-        model["snapshot_rows"],
-        model["data_quality"],
-        data_scope=model["data_scope"],
+        model.snapshot_rows,
+        model.data_quality,
+        data_scope=model.data_scope,
+        output_path=str(root / "assets/raw_snapshot.svg"),
     )
     logger("  -> assets/raw_snapshot.svg")
 
     gen_metrics_general(
-        username=model["dashboard_data"]["username"],
-        snapshot=model["snapshot"],
-        data_scope=model["data_scope"],
-        generated_at=model["dashboard_data"]["generated_at"],
-        output_path="metrics.general.svg",
+        username=model.username,
+        snapshot=model.snapshot,
+        data_scope=model.data_scope,
+        generated_at=model.generated_at,
+        output_path=str(root / "metrics.general.svg"),
     )
     logger("  -> metrics.general.svg")
 
@@ -105,27 +121,19 @@ def _public_dashboard_data(dashboard_data: dict) -> dict:
     on GitHub Pages (one curl away), so it is part of the public profile: the internal
     token mode (whether the bot ran authenticated) must never leak there. Counts and
     public-source health stay; only the credential-posture field is stripped."""
-    import copy
-
-    public = copy.deepcopy(dashboard_data)
-    dq = public.get("data_quality")
-    if isinstance(dq, dict):
-        for key in list(dq):
-            if "token" in key.lower():  # token_mode and any future token_* field
-                dq.pop(key, None)
-    return public
+    return public_dashboard_data(dashboard_data)
 
 
-def write_dashboard_json(model: dict, logger=print) -> None:
-    output_path = Path("site/data/profile_snapshot.json")
+def write_dashboard_json(model: ProfileModel, logger=print, *, root: Path = Path(".")) -> None:
+    output_path = root / "site/data/profile_snapshot.json"
     output_path.write_text(
-        json.dumps(_public_dashboard_data(model["dashboard_data"]), indent=2, ensure_ascii=True) + "\n",
+        json.dumps(model.public_dashboard(), indent=2, ensure_ascii=True) + "\n",
         encoding="utf-8",
     )
     logger("  -> site/data/profile_snapshot.json")
 
 
-def render_readme(model: dict, logger=print) -> None:
+def render_readme(model: ProfileModel, logger=print, *, root: Path = Path(".")) -> None:
     logger("\nRendering README.md...")
 
     env = jinja2.Environment(
@@ -134,7 +142,7 @@ def render_readme(model: dict, logger=print) -> None:
     )
     template = env.get_template("README.md.tpl")
 
-    cache_bust = str(model["dashboard_data"].get("generated_at", "")).replace("-", "").replace(":", "").replace("T", "").replace("Z", "")
+    cache_bust = model.generated_at.replace("-", "").replace(":", "").replace("T", "").replace("Z", "")
     if not cache_bust:
         cache_bust = "latest"
 
@@ -156,32 +164,32 @@ def render_readme(model: dict, logger=print) -> None:
                 break
         return unique
 
-    featured_links = [row for row in model["repo_overview_rows"] if row.get("featured")][:6]
+    featured_links = [row for row in model.repo_overview_rows if row.get("featured")][:6]
 
     readme = template.render(
-        username=model["dashboard_data"]["username"],
-        dashboard_url=model["dashboard_data"]["dashboard_url"],
+        username=model.username,
+        dashboard_url=model.dashboard_data["dashboard_url"],
         cache_bust=cache_bust,
-        recent_created=model["recent_created"],
-        focus_now=model["focus"]["now"],
-        focus_next=model["focus"]["next"],
-        focus_shipped=model["focus"]["shipped"],
-        focus_links_now=_dedupe_links(model["focus"]["now"], 3),
-        focus_links_next=_dedupe_links(model["focus"]["next"], 3),
-        focus_links_shipped=_dedupe_links(model["focus"]["shipped"], 3),
+        recent_created=model.recent_created,
+        focus_now=model.focus["now"],
+        focus_next=model.focus["next"],
+        focus_shipped=model.focus["shipped"],
+        focus_links_now=_dedupe_links(model.focus["now"], 3),
+        focus_links_next=_dedupe_links(model.focus["next"], 3),
+        focus_links_shipped=_dedupe_links(model.focus["shipped"], 3),
         featured_links=featured_links,
-        recent_releases=model["recent_releases"],
-        recent_pull_requests=model["recent_pull_requests"],
-        snapshot=model["snapshot"],
-        snapshot_rows=model["snapshot_rows"],
-        data_quality=model["data_quality"],
-        scorecard=model["scorecard"],
-        scorecard_cards=model["scorecard_cards"],
-        data_scope=model["data_scope"],
-        top_languages=model["top_languages"],
-        repo_overview_rows=model["repo_overview_rows"],
-        activity_feed=model["activity_feed"],
+        recent_releases=model.recent_releases,
+        recent_pull_requests=model.recent_pull_requests,
+        snapshot=model.snapshot,
+        snapshot_rows=model.snapshot_rows,
+        data_quality=model.data_quality,
+        scorecard=model.scorecard,
+        scorecard_cards=model.scorecard_cards,
+        data_scope=model.data_scope,
+        top_languages=model.top_languages,
+        repo_overview_rows=model.repo_overview_rows,
+        activity_feed=model.activity_feed,
     )
 
-    Path("README.md").write_text(readme, encoding="utf-8")
+    (root / "README.md").write_text(readme, encoding="utf-8")
     logger("-> README.md written")
@@ -0,0 +1,123 @@
+"""Dependency-graph executor for named pipeline stages.
+
+Each stage declares the values it reads (``inputs``) and the values it
+produces (``outputs``). Stages whose inputs are ready run concurrently on a
+small thread pool. Log lines are buffered per stage and flushed in declaration
+order, so the console output reads exactly as if the stages ran in sequence.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable
+
+StageFn = Callable[[dict[str, Any], Callable[[str], None]], dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    run: StageFn
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class StageGraphResult:
+    values: dict[str, Any]
+    timings: dict[str, float]
+
+
+def _dependencies(stages: list[Stage]) -> dict[str, set[str]]:
+    producers: dict[str, str] = {}
+    names: set[str] = set()
+    for stage in stages:
+        if stage.name in names:
+            raise ValueError(f"duplicate stage name: {stage.name}")
+        names.add(stage.name)
+        for output in stage.outputs:
+            if output in producers:
+                raise ValueError(f"value {output!r} produced by both {producers[output]} and {stage.name}")
+            producers[output] = stage.name
+    deps: dict[str, set[str]] = {}
+    for stage in stages:
+        missing = [value for value in stage.inputs if value not in producers]
+        if missing:
+            raise ValueError(f"stage {stage.name} reads undeclared values: {', '.join(missing)}")
+        deps[stage.name] = {producers[value] for value in stage.inputs}
+
+    # Reject cycles up front rather than deadlocking at run time.
+    remaining = {name: set(d) for name, d in deps.items()}
+    while remaining:
+        ready = [name for name, d in remaining.items() if not d]
+        if not ready:
+            raise ValueError(f"stage graph has a cycle among: {', '.join(sorted(remaining))}")
+        for name in ready:
+            del remaining[name]
+        for d in remaining.values():
+            d.difference_update(ready)
+    return deps
+
+
+def run_stage_graph(stages: list[Stage], *, logger=print, max_workers: int = 4) -> StageGraphResult:
+    """Run *stages* as a dependency graph; return produced values and wall times.
+
+    The first stage failure is re-raised once already-running stages finish;
+    stages that were not started yet are skipped.
+    """
+    deps = _dependencies(stages)
+    by_name = {stage.name: stage for stage in stages}
+    values: dict[str, Any] = {}
+    timings: dict[str, float] = {}
+    logs: dict[str, list[str]] = {stage.name: [] for stage in stages}
+    done: set[str] = set()
+    flushed = 0
+    failure: BaseException | None = None
+
+    def execute(stage: Stage) -> tuple[dict[str, Any], float]:
+        started = time.perf_counter()
+        inputs = {value: values[value] for value in stage.inputs}
+        produced = stage.run(inputs, logs[stage.name].append) or {}
+        return produced, time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="stage") as pool:
+        running: dict[Future, str] = {}
+        pending = [stage.name for stage in stages]
+        while pending or running:
+            if failure is None:
+                for name in [n for n in pending if deps[n] <= done]:
+                    pending.remove(name)
+                    # Stages see the caller's context (budget step, profile user).
+                    running[pool.submit(contextvars.copy_context().run, execute, by_name[name])] = name
+            elif not running:
+                break
+            finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    produced, elapsed = future.result()
+                except BaseException as exc:  # re-raised below, after running stages drain
+                    if failure is None:
+                        failure = exc
+                    continue
+                unexpected = set(produced) - set(by_name[name].outputs)
+                missing = set(by_name[name].outputs) - set(produced)
+                if unexpected or missing:
+                    failure = failure or ValueError(
+                        f"stage {name} outputs mismatch (missing={sorted(missing)}, unexpected={sorted(unexpected)})"
+                    )
+                    continue
+                values.update(produced)
+                timings[name] = elapsed
+                done.add(name)
+            while flushed < len(stages) and stages[flushed].name in done:
+                for line in logs[stages[flushed].name]:
+                    logger(line)
+                flushed += 1
+
+    if failure is not None:
+        raise failure
+    return StageGraphResult(values=values, timings=timings)
@@ -5,10 +5,7 @@ halos. The day x hour intensity matrix keeps the heatmap shape; the two side pan
 are on-ladder bar lists. Section header carries the total + timezone.
 """
 
-import os
 from collections import Counter, defaultdict
-from datetime import datetime, timezone
-from zoneinfo import ZoneInfo
 
 from scripts.core.config import (
     CYAN,
@@ -20,6 +17,7 @@ from scripts.core.config import (
     TEXT_BRIGHT,
     TEXT_DIM,
 )
+from scripts.core.timestamps import activity_timezone, parse_iso
 from scripts.rendering.components import empty_state, section_header
 from scripts.rendering.glass_kit import glass_panel, glass_tile, icon, progress_bar
 
@@ -39,14 +37,6 @@ def _ramp_level(count: int, max_count: int) -> int:
     return 1 if r <= 0.25 else 2 if r <= 0.5 else 3 if r <= 0.75 else 4
 
 
-def _timezone() -> tuple[timezone | ZoneInfo, str]:
-    tz_name = (os.environ.get("PROFILE_ACTIVITY_TZ") or "America/New_York").strip()
-    try:
-        return ZoneInfo(tz_name), tz_name
-    except Exception:
-        return timezone.utc, "UTC"
-
-
 def _txt(s, x, y, *, size, fill, weight=400, anchor="start") -> str:
     a = f' text-anchor="{anchor}"' if anchor != "start" else ""
     w = f' font-weight="{weight}"' if weight != 400 else ""
@@ -75,7 +65,7 @@ def _bar_panel(parts, x, y, w, h, title, rows, total_events):
 
 
 def generate(events: list, output_path: str = "assets/activity_heatmap.svg"):
-    tz, tz_label = _timezone()
+    tz, tz_label = activity_timezone()
     grid = defaultdict(lambda: defaultdict(int))
     block_totals, event_mix = Counter(), Counter()
     for event in events or []:
@@ -83,10 +73,10 @@ def generate(events: list, output_path: str = "assets/activity_heatmap.svg"):
         ts = event.get("created_at", "")
         if label is None or not ts:
             continue
-        try:
-            dt = datetime.fromisoformat(ts.replace("Z", "+00:00")).astimezone(tz)
-        except ValueError:
+        dt = parse_iso(ts)
+        if dt is None:
             continue
+        dt = dt.astimezone(tz)
         grid[dt.weekday()][dt.hour] += 1
         event_mix[label] += 1
         for name, hrs in TIME_BLOCKS:
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
+from scripts.contracts.contribution_calendar import ContributionCalendar
 from scripts.core.config import (
     CONTRIB_EMPTY,
     CONTRIB_RAMP,
@@ -33,38 +34,9 @@ def _month_label(date_str: str) -> str:
 
 
 def _compute_streaks(days: list[dict]) -> tuple[int, int]:
-    if not days:
-        return 0, 0
+    calendar = ContributionCalendar.from_weeks([{"contributionDays": days}])
     today = datetime.now(timezone.utc).date()
-    counts = []
-    for day in days:
-        try:
-            parsed = datetime.fromisoformat(str(day.get("date", ""))).date()
-        except ValueError:
-            parsed = None
-        if parsed is None or parsed <= today:
-            try:
-                counts.append(int(day.get("contributionCount", 0)))
-            except (TypeError, ValueError):
-                counts.append(0)
-    longest = run = 0
-    for c in counts:
-        run = run + 1 if c > 0 else 0
-        longest = max(longest, run)
-    current = 0
-    for c in reversed(counts):
-        if c > 0:
-            current += 1
-        else:
-            break
-    return current, longest
-
-
-def _level(count: int, max_count: int) -> int:
-    if count <= 0 or max_count <= 0:
-        return 0
-    r = count / max_count
-    return 4 if r >= 0.75 else 3 if r >= 0.5 else 2 if r >= 0.25 else 1
+    return calendar.current_streak(today)[0], calendar.longest_streak(today)[0]
 
 
 def _cell(x: float, y: float, size: float, level: int) -> str:
@@ -79,20 +51,19 @@ def _cell(x: float, y: float, size: float, level: int) -> str:
     )
 
 
-def generate(calendar: dict | None, output_path: str = "assets/contribution_calendar.svg") -> str:
+def generate(
+    calendar: ContributionCalendar | dict | None, output_path: str = "assets/contribution_calendar.svg"
+) -> str:
     width = SVG_WIDTH
     pad = 28
-    weeks = calendar.get("weeks") if isinstance(calendar, dict) and isinstance(calendar.get("weeks"), list) else []
-    try:
-        total = int(calendar.get("totalContributions", 0)) if isinstance(calendar, dict) else 0
-    except (TypeError, ValueError):
-        total = 0
+    calendar = ContributionCalendar.of(calendar)
+    total = calendar.total
 
     header_svg, content_top = section_header(
         pad, 46, "Contribution Calendar", width=width, eyebrow="Last 12 Months", pad=pad
     )
 
-    if not weeks:
+    if not len(calendar):
         empty_header, _ = section_header(pad, 46, "Contribution Calendar", width=width, eyebrow="Last 12 Months", pad=pad)
         height = int(content_top + 92)
         body = "".join([glass_panel(width, height), empty_header,
@@ -102,9 +73,11 @@ def generate(calendar: dict | None, output_path: str = "assets/contribution_cale
                     f'viewBox="0 0 {width} {height}">{body}</svg>')
         return output_path
 
-    all_days = [d for wk in weeks if isinstance(wk, dict) for d in (wk.get("contributionDays") or []) if isinstance(d, dict)]
-    max_count = max((int(d.get("contributionCount", 0)) for d in all_days if str(d.get("contributionCount", 0)).lstrip("-").isdigit()), default=0)
-    current_streak, longest_streak = _compute_streaks(all_days)
+    today = datetime.now(timezone.utc).date()
+    current_streak = calendar.current_streak(today)[0]
+    longest_streak = calendar.longest_streak(today)[0]
+    levels = calendar.intensity_levels()
+    weeks = calendar.week_slices()
 
     cell, gap = 11, 3
     cols = len(weeks)
@@ -129,9 +102,8 @@ def generate(calendar: dict | None, output_path: str = "assets/contribution_cale
 
     # month labels (>=12, sparse so they don't crowd)
     prev, last_x = "", -1e9
-    for idx, wk in enumerate(weeks):
-        days = wk.get("contributionDays") or [] if isinstance(wk, dict) else []
-        month = _month_label(days[0].get("date", "") if days and isinstance(days[0], dict) else "")
+    for idx, days in enumerate(weeks):
+        month = _month_label(calendar.date_at(days[0]).isoformat() if days else "")
         if month and month != prev:
             prev = month
             lx = grid_x + idx * (cell + gap)
@@ -139,17 +111,10 @@ def generate(calendar: dict | None, output_path: str = "assets/contribution_cale
                 last_x = lx
                 parts.append(text(month, lx, grid_y - 8, token="caption", color=TEXT_DIM))
 
-    for w_idx, wk in enumerate(weeks):
-        days = wk.get("contributionDays") if isinstance(wk, dict) else []
-        if not isinstance(days, list):
-            continue
+    for w_idx, days in enumerate(weeks):
         cx = grid_x + w_idx * (cell + gap)
         for d_idx, day in enumerate(days[:7]):
-            try:
-                count = int(day.get("contributionCount", 0))
-            except (TypeError, ValueError):
-                count = 0
-            parts.append(_cell(cx, grid_y + d_idx * (cell + gap), cell, _level(count, max_count)))
+            parts.append(_cell(cx, grid_y + d_idx * (cell + gap), cell, levels[day]))
 
     # legend: Less [ramp] More (>=12)
     sw, sgap, n = 12, 4, 5
@@ -11,6 +11,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 
 from scripts.core.config import SPACE, SVG_WIDTH, TEXT_DIM
+from scripts.core.timestamps import parse_iso
 from scripts.rendering.components import (
     empty_state,
     primary_kpi,
@@ -27,9 +28,8 @@ ROW_H = 50
 
 def _time_ago(iso_str: str) -> str:
     """Compact relative time ('just now' / 'Xh ago' / 'Xd ago') from an ISO ts."""
-    try:
-        dt = datetime.fromisoformat((iso_str or "").replace("Z", "+00:00"))
-    except (ValueError, AttributeError):
+    dt = parse_iso(iso_str)
+    if dt is None:
         return ""
     delta = datetime.now(timezone.utc) - dt
     hours = delta.total_seconds() / 3600
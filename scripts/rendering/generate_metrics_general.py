@@ -9,9 +9,8 @@ so the metrics validator (scripts/quality/metrics_svg.py) reads them back.
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-
 from scripts.core.config import SVG_WIDTH, SPACE, TEXT_DIM
+from scripts.core.timestamps import parse_iso
 from scripts.rendering.components import metric_tile, primary_kpi, section_header, text
 from scripts.rendering.glass_kit import glass_panel
 from scripts.rendering.svg_utils import fmt_int, truncate, xml_escape
@@ -20,13 +19,10 @@ from scripts.rendering.svg_utils import fmt_int, truncate, xml_escape
 def _fmt_iso_date(iso_value: str | None) -> str:
     if not iso_value:
         return "unknown"
-    try:
-        dt = datetime.fromisoformat(str(iso_value).replace("Z", "+00:00"))
-    except ValueError:
+    dt = parse_iso(iso_value)
+    if dt is None:
         return xml_escape(str(iso_value))
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-    return dt.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+    return dt.strftime("%Y-%m-%d %H:%M UTC")
 
 
 def _int(value: object) -> int:
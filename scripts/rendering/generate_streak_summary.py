@@ -4,21 +4,13 @@ from __future__ import annotations
 
 from datetime import date, datetime, timezone
 
+from scripts.contracts.contribution_calendar import ContributionCalendar
 from scripts.core.config import SPACE, SVG_WIDTH, TEXT_DIM
 from scripts.rendering.components import empty_state, metric_tile, primary_kpi, section_header
 from scripts.rendering.glass_kit import glass_panel
 from scripts.rendering.svg_utils import fmt_compact
 
 
-def _parse_day_date(value: str) -> date | None:
-    if not value:
-        return None
-    try:
-        return datetime.fromisoformat(value).date()
-    except ValueError:
-        return None
-
-
 def _fmt_day(value: date, with_year: bool = False) -> str:
     fmt = "%b %d, %Y" if with_year else "%b %d"
     return value.strftime(fmt).replace(" 0", " ")
@@ -32,96 +24,22 @@ def _fmt_range(start: date | None, end: date | None) -> str:
     return f"{_fmt_day(start, with_year=True)} - {_fmt_day(end, with_year=True)}"
 
 
-def _collect_days(calendar: dict | None, today_utc: date) -> list[tuple[date, int]]:
-    rows: list[tuple[date, int]] = []
-    if not isinstance(calendar, dict):
-        return rows
-
-    weeks = calendar.get("weeks") if isinstance(calendar.get("weeks"), list) else []
-    for week in weeks:
-        if not isinstance(week, dict):
-            continue
-        days = week.get("contributionDays")
-        if not isinstance(days, list):
-            continue
-        for day in days:
-            if not isinstance(day, dict):
-                continue
-            parsed = _parse_day_date(str(day.get("date", "")))
-            if parsed is None or parsed > today_utc:
-                continue
-            try:
-                count = int(day.get("contributionCount", 0))
-            except (TypeError, ValueError):
-                count = 0
-            rows.append((parsed, max(0, count)))
-    rows.sort(key=lambda item: item[0])
-    return rows
-
-
-def _streak_ranges(days: list[tuple[date, int]]) -> tuple[int, date | None, date | None, int, date | None, date | None]:
-    if not days:
-        return 0, None, None, 0, None, None
-
-    best_len = 0
-    best_start: date | None = None
-    best_end: date | None = None
-
-    run_len = 0
-    run_start: date | None = None
-    run_end: date | None = None
-
-    for day, count in days:
-        if count > 0:
-            if run_len == 0:
-                run_start = day
-            run_len += 1
-            run_end = day
-            if run_len > best_len:
-                best_len = run_len
-                best_start = run_start
-                best_end = run_end
-        else:
-            run_len = 0
-            run_start = None
-            run_end = None
-
-    current_len = 0
-    current_start: date | None = None
-    current_end: date | None = None
-    for day, count in reversed(days):
-        if count > 0:
-            current_len += 1
-            current_start = day
-            if current_end is None:
-                current_end = day
-        else:
-            break
-
-    return current_len, current_start, current_end, best_len, best_start, best_end
-
-
 def generate(
     *,
-    calendar: dict | None,
+    calendar: ContributionCalendar | dict | None,
     current_streak_days: int,
     total_contributions: int | None,
     output_path: str = "assets/streak_summary.svg",
 ) -> str:
     today_utc = datetime.now(timezone.utc).date()
-    day_rows = _collect_days(calendar, today_utc)
-    (
-        streak_days_computed,
-        current_start,
-        current_end,
-        longest_days,
-        longest_start,
-        longest_end,
-    ) = _streak_ranges(day_rows)
+    calendar = ContributionCalendar.of(calendar)
+    shown_days = calendar.end_index(today_utc)
+    streak_days_computed, current_start, current_end = calendar.current_streak(today_utc)
+    longest_days, longest_start, longest_end = calendar.longest_streak(today_utc)
 
     current_days = max(int(current_streak_days or 0), streak_days_computed)
-    contrib_start = day_rows[0][0] if day_rows else None
-    contrib_end = day_rows[-1][0] if day_rows else None
+    contrib_start = calendar.date_at(0) if shown_days else None
+    contrib_end = calendar.date_at(shown_days - 1) if shown_days else None
 
     width = SVG_WIDTH
     pad = 28
@@ -137,7 +55,7 @@ def generate(
     )
 
     # Honest empty state: no contribution days -> one explanatory line, no zeros.
-    if not day_rows:
+    if not shown_days:
         empty_header, _ = section_header(
             pad, 46, "Streak Summary", width=width, eyebrow="Contribution Calendar", pad=pad
         )
@@ -20,13 +20,6 @@ def _noop(*a, **k):
     pass
 
 
-def _primary_lang(model: dict) -> str:
-    langs = model.get("top_languages")
-    if isinstance(langs, list) and langs and isinstance(langs[0], dict):
-        return str(langs[0].get("name") or "").strip()
-    return ""
-
-
 def _model():
     payload = json.loads((ROOT / "tests/fixtures/sample_collected_data.json").read_text())
     collected = CollectedProfileData(**payload)
@@ -40,36 +33,36 @@ def _render(card, out):
     m, c = MODEL, COLLECTED
     if card == "metrics_general":
         from scripts.rendering.generate_metrics_general import generate
-        return generate(username=m["dashboard_data"]["username"], snapshot=m["snapshot"],
-                        data_scope=m["data_scope"], generated_at=m["dashboard_data"]["generated_at"],
+        return generate(username=m.username, snapshot=m.snapshot,
+                        data_scope=m.data_scope, generated_at=m.generated_at,
                         output_path=out)
     if card == "badges":
         from scripts.rendering.generate_badges import generate
         return generate(public_nonfork_repos=c.repo_counts["public_owned_nonfork"],
                         public_forks=c.repo_counts["public_owned_forks"],
                         private_owned_repos=c.repo_counts["private_owned"],
-                        ci_count=m["snapshot"]["ci_repos"],
+                        ci_count=m.snapshot["ci_repos"],
                         last_year_contributions=c.total_contributions, output_path=out)
     if card == "scorecard":
         from scripts.rendering.generate_builder_scorecard import generate
-        return generate(m["scorecard"], output_path=out, tiles=m["scorecard_cards"],
-                        primary_language=_primary_lang(m))
+        return generate(m.scorecard, output_path=out, tiles=m.scorecard_cards,
+                        primary_language=m.primary_language)
     if card == "engineering":
         from scripts.rendering.generate_engineering_cadence import generate
-        return generate(m["engineering"], output_path=out, primary_language=_primary_lang(m))
+        return generate(m.engineering, output_path=out, primary_language=m.primary_language)
     if card == "focus":
         from scripts.rendering.generate_focus_board import generate
-        return generate(m["focus"], output_path=out)
+        return generate(m.focus, output_path=out)
     if card == "currently_working":
         from scripts.rendering.generate_currently_working import generate
-        return generate(m["recent_repos"], output_path=out)
+        return generate(m.recent_repos, output_path=out)
     if card == "streak":
         from scripts.rendering.generate_streak_summary import generate
-        return generate(calendar=c.calendar, current_streak_days=m["snapshot"]["streak_days"],
+        return generate(calendar=c.calendar, current_streak_days=m.snapshot["streak_days"],
                         total_contributions=c.total_contributions, output_path=out)
     if card == "snapshot":
         from scripts.rendering.generate_snapshot_panel import generate
-        return generate(m["snapshot_rows"], m["data_quality"], data_scope=m["data_scope"], output_path=out)
+        return generate(m.snapshot_rows, m.data_quality, data_scope=m.data_scope, output_path=out)
     if card == "lang":
         from scripts.rendering.generate_language_chart import generate
         return generate(c.language_bytes, output_path=out)
@@ -81,7 +74,7 @@ def _render(card, out):
         return generate(c.calendar, output_path=out)
     if card == "spotlight":
         from scripts.rendering.generate_repo_spotlight import generate
-        return generate(m["spotlight_data"], output_path=out)
+        return generate(m.spotlight_data, output_path=out)
     raise ValueError(card)
 
 
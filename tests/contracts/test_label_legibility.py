@@ -145,10 +145,10 @@ def _render_stress() -> dict[str, str]:
     with tempfile.TemporaryDirectory() as d:
         from scripts.rendering.generate_builder_scorecard import generate as bld
         from scripts.rendering.generate_engineering_cadence import generate as eng
-        eng(MODEL["engineering"], output_path=str(Path(d) / "e.svg"), primary_language="JavaScript")
+        eng(MODEL.engineering, output_path=str(Path(d) / "e.svg"), primary_language="JavaScript")
         out["engineering(JavaScript)"] = Path(str(Path(d) / "e.svg")).read_text(encoding="utf-8")
-        bld(MODEL["scorecard"], output_path=str(Path(d) / "b.svg"),
-            tiles=MODEL["scorecard_cards"], primary_language="TypeScript")
+        bld(MODEL.scorecard, output_path=str(Path(d) / "b.svg"),
+            tiles=MODEL.scorecard_cards, primary_language="TypeScript")
         out["scorecard(TypeScript)"] = Path(str(Path(d) / "b.svg")).read_text(encoding="utf-8")
     return out
 
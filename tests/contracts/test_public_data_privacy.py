@@ -95,6 +95,16 @@ class PublicDataPrivacyContract(unittest.TestCase):
         self.assertEqual("ok", out["data_quality"]["ci_status"], "public source health must be preserved")
         self.assertEqual("u", out["username"], "non-sensitive fields must pass through")
 
+    def test_public_projection_shares_values_and_leaves_model_intact(self):
+        from scripts.contracts.profile_model import public_dashboard_data
+        rows = [{"key": "total_stars"}]
+        source = {"data_quality": {"token_mode": "personal_github_token", "ci_status": "ok"}, "snapshot_rows": rows}
+        out = public_dashboard_data(source)
+        self.assertNotIn("token_mode", out["data_quality"])
+        self.assertIs(rows, out["snapshot_rows"], "projection must not copy the payload")
+        self.assertEqual("personal_github_token", source["data_quality"]["token_mode"],
+                         "projection must not mutate the model it publishes")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,16 +2,34 @@ import tempfile
 import json
 from pathlib import Path
 from contextlib import redirect_stdout
+from functools import partial
 import io
 import unittest
 from unittest.mock import patch
 
 from scripts.github.branch_protection import BranchProtectionAudit
 from scripts.cli.profile_cli import main
+from scripts.quality.diagnostics import write_run_diagnostics
 from scripts.quality.validate_generated_profile import ValidationResult
 
 
 class ProfileCliTests(unittest.TestCase):
+    def setUp(self):
+        # Every command writes run diagnostics; keep them out of the tracked site/data.
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        diagnostics = patch(
+            "scripts.quality.diagnostics.write_run_diagnostics",
+            partial(
+                write_run_diagnostics,
+                output_path=str(self.tmp / "run_diagnostics.json"),
+                history_path=str(self.tmp / "run_diagnostics_history.jsonl"),
+            ),
+        )
+        diagnostics.start()
+        self.addCleanup(diagnostics.stop)
+
     def test_cli_sanity_check_metrics_passes_with_repository_value(self):
         with tempfile.TemporaryDirectory() as tmp_dir:
             svg = Path(tmp_dir) / "metrics.general.svg"
@@ -27,7 +45,7 @@ class ProfileCliTests(unittest.TestCase):
 
     def test_cli_doctor_runs(self):
         with redirect_stdout(io.StringIO()):
-            rc = main(["doctor"])
+            rc = main(["doctor", "--output", str(self.tmp / "doctor_report.json")])
         self.assertEqual(rc, 0)
 
     def test_cli_triage_runs_with_mocked_inputs(self):
@@ -39,7 +57,9 @@ class ProfileCliTests(unittest.TestCase):
             return_value=[],
         ):
             with redirect_stdout(io.StringIO()):
-                rc = main(["triage", "--limit", "2", "--fail-on", "none"])
+                rc = main(
+                    ["triage", "--limit", "2", "--fail-on", "none", "--output", str(self.tmp / "triage_report.json")]
+                )
         self.assertEqual(rc, 0)
 
     def test_cli_generate_profile_fixture_runs(self):
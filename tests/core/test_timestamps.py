@@ -0,0 +1,41 @@
+import os
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from scripts.core.timestamps import (
+    activity_timezone,
+    localize_many,
+    parse_iso,
+    parse_iso_many,
+    profile_timezone,
+    resolve_timezone,
+)
+
+
+class TimestampTests(unittest.TestCase):
+    def test_parse_iso_normalizes_to_utc_and_interns(self):
+        parsed = parse_iso("2026-10-01T08:00:00Z")
+        self.assertEqual(parsed, datetime(2026, 10, 1, 8, tzinfo=timezone.utc))
+        self.assertIs(parse_iso("2026-10-01T08:00:00Z"), parsed)
+        self.assertEqual(parse_iso("2026-10-01T10:00:00+02:00").tzinfo, timezone.utc)
+        self.assertEqual(parse_iso("2026-10-01T10:00:00+02:00"), parsed)
+        self.assertEqual(parse_iso("2026-10-01T08:00:00"), parsed)
+        for bad in ("", None, "not-a-date", 0):
+            self.assertIsNone(parse_iso(bad))
+
+    def test_bulk_helpers(self):
+        values = ["2026-10-01T08:00:00Z", "junk", None]
+        self.assertEqual(parse_iso_many(values)[1:], [None, None])
+        est = timezone(timedelta(hours=-4))
+        self.assertEqual([dt.hour for dt in localize_many(values, est)], [4])
+
+    def test_timezones_resolve_from_env_and_fall_back_to_utc(self):
+        with patch.dict(os.environ, {"PROFILE_TIMEZONE": "Europe/Paris", "PROFILE_ACTIVITY_TZ": "No/Such_Zone"}):
+            self.assertEqual(str(profile_timezone()), "Europe/Paris")
+            self.assertEqual(activity_timezone(), (timezone.utc, "UTC"))
+        self.assertIs(resolve_timezone("Europe/Paris")[0], resolve_timezone("Europe/Paris")[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,244 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from dataclasses import replace
+from pathlib import Path
+from unittest import mock
+
+from scripts.core.settings import Settings
+from scripts.github import github_cache
+
+
+class _BackendContract:
+    backend = "files"
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.settings = Settings(
+            username="u",
+            token="",
+            cache_dir=Path(self._tmp.name),
+            cache_ttl_seconds=60,
+            bypass_cache=False,
+            cache_backend=self.backend,
+        )
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_round_trip_and_ttl(self):
+        github_cache.write_cache("langs_o_r", {"Python": 10}, self.settings)
+        self.assertEqual(github_cache.read_cache("langs_o_r", self.settings), {"Python": 10})
+
+        later = time.time() + 120
+        with mock.patch.object(github_cache.time, "time", return_value=later):
+            self.assertIsNone(github_cache.read_cache("langs_o_r", self.settings))
+            self.assertEqual(github_cache.read_stale_cache("langs_o_r", self.settings), {"Python": 10})
+
+    def test_touch_refreshes_freshness(self):
+        github_cache.write_cache("langs_o_r", {}, self.settings)
+        later = time.time() + 120
+        with mock.patch.object(github_cache.time, "time", return_value=later):
+            github_cache.touch_cache("langs_o_r", self.settings)
+            self.assertEqual(github_cache.read_cache("langs_o_r", self.settings), {})
+
+    def test_validators_are_replaced_with_the_body(self):
+        github_cache.write_cache("k", [1], self.settings, validators={"etag": '"a"'})
+        self.assertEqual(github_cache.read_cache_validators("k", self.settings), {"etag": '"a"'})
+        github_cache.write_cache("k", [2], self.settings)
+        self.assertEqual(github_cache.read_cache_validators("k", self.settings), {})
+
+    def test_prefix_lookup_is_newest_first_and_scoped(self):
+        clock = [1_000.0]
+        with mock.patch.object(github_cache.time, "time", side_effect=lambda: clock[0]):
+            for sig in ("aaa", "bbb", "ccc"):
+                clock[0] += 10
+                github_cache.write_cache(f"releases_last_30_{sig}", {"total": sig}, self.settings)
+                if self.backend == "files":
+                    path = github_cache._cache_path(f"releases_last_30_{sig}", self.settings.cache_dir)
+                    os.utime(path, (clock[0], clock[0]))
+            github_cache.write_cache("releases_last_7_zzz", {"total": 1}, self.settings)
+
+        found = github_cache.read_cache_prefix("releases_last_30_", self.settings)
+        self.assertEqual([key for key, _ in found], ["releases_last_30_ccc", "releases_last_30_bbb", "releases_last_30_aaa"])
+
+    def test_compressed_entries_round_trip_and_mix_with_plain_ones(self):
+        github_cache.write_cache("langs_o_plain", {"Go": 1}, self.settings)
+        for compression in ("gzip", "zstd"):
+            settings = replace(self.settings, cache_compression=compression)
+            github_cache.write_cache(f"langs_o_{compression}", {"Go": 2}, settings)
+            self.assertEqual(github_cache.read_cache(f"langs_o_{compression}", self.settings), {"Go": 2})
+        self.assertEqual(github_cache.read_cache("langs_o_plain", replace(self.settings, cache_compression="gzip")), {"Go": 1})
+
+    def test_projected_namespaces_drop_unread_fields(self):
+        repo = {"name": "r", "owner": {"login": "u", "avatar_url": "x"}, "node_id": "n", "permissions": {}}
+        github_cache.write_cache("paginated_users/u/repos_{}", [repo], self.settings)
+        self.assertEqual(
+            github_cache.read_cache("paginated_users/u/repos_{}", self.settings),
+            [{"name": "r", "owner": {"login": "u"}}],
+        )
+        github_cache.write_cache("langs_o_r", {"node_id": 1}, self.settings)
+        self.assertEqual(github_cache.read_cache("langs_o_r", self.settings), {"node_id": 1})
+
+
+class FileBackendTests(_BackendContract, unittest.TestCase):
+    backend = "files"
+
+
+class SqliteBackendTests(_BackendContract, unittest.TestCase):
+    backend = "sqlite"
+
+    def test_concurrent_writers_stay_consistent(self):
+        def writer(n):
+            for i in range(20):
+                github_cache.write_cache(f"repo_ci_state_o_r{n}_{i}", i % 2 == 0, self.settings)
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        found = github_cache.read_cache_prefix("repo_ci_state_", self.settings)
+        self.assertEqual(len(found), 120)
+        self.assertFalse(any(self.settings.cache_dir.glob("*.json")))
+
+    def test_rows_carry_namespace(self):
+        github_cache.write_cache("repo_user_commits_v2_o_r_u", {"count": 1}, self.settings)
+        backend = github_cache.cache_backend(self.settings)
+        row = backend._conn().execute("SELECT namespace FROM cache_entries").fetchone()
+        self.assertEqual(row[0], "repo_user_commits_v2")
+
+
+class StaleWhileRevalidateTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.settings = Settings(
+            username="u",
+            token="",
+            cache_dir=Path(self._tmp.name),
+            cache_ttl_seconds=60,
+            bypass_cache=False,
+            cache_stale_grace_seconds=300,
+        )
+
+    def tearDown(self):
+        github_cache.wait_for_refreshes()
+        self._tmp.cleanup()
+
+    def test_stale_value_is_served_while_one_refresh_runs(self):
+        github_cache.write_cache("events_100_3", ["old"], self.settings)
+        release = threading.Event()
+        calls = []
+
+        def refresh():
+            calls.append(github_cache.read_cache("events_100_3", self.settings))
+            release.wait(5)
+            github_cache.write_cache("events_100_3", ["new"], self.settings)
+
+        later = time.time() + 120
+        with mock.patch.object(github_cache.time, "time", return_value=later):
+            first = github_cache.read_cache("events_100_3", self.settings, refresh=refresh)
+            second = github_cache.read_cache("events_100_3", self.settings, refresh=refresh)
+        release.set()
+        self.assertEqual(github_cache.wait_for_refreshes(timeout=5), 0)
+
+        self.assertEqual(first, ["old"])
+        self.assertEqual(second, ["old"])
+        # One de-duplicated refresh, which saw a cache miss for its own key.
+        self.assertEqual(calls, [None])
+        self.assertEqual(github_cache.read_cache("events_100_3", self.settings), ["new"])
+
+    def test_entries_past_the_grace_window_miss(self):
+        github_cache.write_cache("events_100_3", ["old"], self.settings)
+        refresh = mock.Mock()
+        later = time.time() + 60 + 300 + 5
+        with mock.patch.object(github_cache.time, "time", return_value=later):
+            self.assertIsNone(github_cache.read_cache("events_100_3", self.settings, refresh=refresh))
+        refresh.assert_not_called()
+
+
+class CacheEncodingTests(unittest.TestCase):
+    def test_gzip_shrinks_bodies_and_corrupt_ones_read_as_misses(self):
+        text = '[{"login": "someone", "contributions": 1}]' * 50
+        packed = github_cache.encode_body(text, "gzip")
+        self.assertLess(len(packed), len(text) // 5)
+        self.assertEqual(github_cache.decode_body(packed), text)
+        self.assertEqual(github_cache.encode_body(text, "none"), text)
+        self.assertIsNone(github_cache._parse(github_cache.CacheEntry(packed[:-8], 0.0)))
+
+    def test_zstd_falls_back_to_gzip_without_zstandard(self):
+        with mock.patch.object(github_cache, "zstandard", None):
+            packed = github_cache.encode_body("{}", "zstd")
+        self.assertTrue(packed.startswith(b"\x1f\x8b"))
+
+
+class CacheNamespaceTests(unittest.TestCase):
+    def test_longest_known_prefix_wins(self):
+        self.assertEqual(github_cache.cache_namespace("repo_releases_since_o_r_2026-01-01"), "repo_releases_since")
+        self.assertEqual(github_cache.cache_namespace("releases_last_30_abc"), "releases_last")
+        self.assertEqual(github_cache.cache_namespace("mystery_key"), "mystery")
+
+    def test_user_scoped_keys_keep_their_namespace(self):
+        scoped = github_cache.user_scoped_key("events_100_3", "alice")
+        self.assertEqual(scoped, "events@alice_100_3")
+        self.assertEqual(github_cache.cache_namespace(scoped), "events")
+        # Repo-level entries stay shared between users.
+        self.assertEqual(github_cache.user_scoped_key("langs_o_r", "alice"), "langs_o_r")
+
+
+class TtlPolicyTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.settings = Settings(
+            username="u",
+            token="",
+            cache_dir=Path(self._tmp.name),
+            cache_ttl_seconds=6 * 3600,
+            bypass_cache=False,
+        )
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_closed_windows_never_expire_and_volatile_keys_expire_early(self):
+        github_cache.write_cache("total_commit_contributions_graphql_year_2019", 120, self.settings)
+        github_cache.write_cache("events_100_3", ["e"], self.settings)
+        github_cache.write_cache("langs_o_r", {"Go": 1}, self.settings)
+
+        in_an_hour = time.time() + 3600
+        with mock.patch.object(github_cache.time, "time", return_value=in_an_hour):
+            self.assertIsNone(github_cache.read_cache("events_100_3", self.settings))
+            self.assertEqual(github_cache.read_cache("langs_o_r", self.settings), {"Go": 1})
+        in_ten_years = time.time() + 10 * 365 * 86400
+        with mock.patch.object(github_cache.time, "time", return_value=in_ten_years):
+            self.assertEqual(
+                github_cache.read_cache("total_commit_contributions_graphql_year_2019", self.settings), 120
+            )
+
+    def test_policy_ttl_is_capped_by_the_configured_default(self):
+        short = Settings(
+            username="u",
+            token="",
+            cache_dir=Path(self._tmp.name),
+            cache_ttl_seconds=60,
+            bypass_cache=False,
+        )
+        self.assertEqual(github_cache.ttl_for_key("events_100_3", short), 60)
+        self.assertEqual(github_cache.ttl_for_key("events_100_3", self.settings), 15 * 60)
+        self.assertIsNone(github_cache.ttl_for_key("user_node_id_u", short))
+
+    def test_hit_rate_is_reported_per_namespace(self):
+        stats = github_cache.CacheStats()
+        stats.record("langs_a_b", "hits")
+        stats.record("langs_c_d", "misses")
+        stats.record("events@alice_100_3", "stale")
+        report = stats.report()
+        self.assertEqual(report["langs"], {"hits": 1, "stale": 0, "misses": 1, "hit_rate": 0.5})
+        self.assertEqual(report["events"]["hit_rate"], 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import gzip
+import json
+import tempfile
+import unittest
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
+
+import requests
+
+from scripts.github import github_client as gh
+from scripts.github import github_transport
+from scripts.github.github_cassette import Cassette, use_cassette
+
+
+def _live(status, payload, headers=None):
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = json.dumps(payload).encode("utf-8")
+    resp.headers.update(headers or {})
+    resp.url = "https://api.github.com/x"
+    return resp
+
+
+class CassetteTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "run.json.gz"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _record(self, exchanges):
+        recorder = Cassette(self.path, "record")
+        for method, url, kwargs, resp in exchanges:
+            recorder.handle(method, url, send=lambda resp=resp: resp, **kwargs)
+        recorder.save()
+
+    def test_replay_serves_recorded_exchanges_in_order(self):
+        url = "https://api.github.com/users/u/repos"
+        self._record(
+            [
+                ("GET", url, {"headers": {"Authorization": "Bearer secret"}, "params": {"page": 1}},
+                 _live(200, [{"name": "a"}], {"ETag": '"e1"', "Set-Cookie": "s=1"})),
+                ("GET", url, {"headers": {}, "params": {"page": 1}}, _live(200, [{"name": "b"}])),
+                ("POST", "https://api.github.com/graphql", {"headers": {}, "body": {"query": "q"}},
+                 _live(200, {"data": {"ok": True}})),
+            ]
+        )
+        raw = gzip.open(self.path, "rt", encoding="utf-8").read()
+        self.assertNotIn("secret", raw)
+        self.assertNotIn("s=1", raw)
+
+        player = Cassette(self.path, "replay")
+        first = player.handle("GET", url, headers={}, params={"page": "1"}, send=None)
+        second = player.handle("GET", url, headers={}, params={"page": 1}, send=None)
+        third = player.handle("GET", url, headers={}, params={"page": 1}, send=None)
+        self.assertEqual(first.json(), [{"name": "a"}])
+        self.assertEqual(first.headers["etag"], '"e1"')
+        self.assertEqual(second.json(), [{"name": "b"}])
+        self.assertEqual(third.json(), [{"name": "b"}])
+        post = player.handle("POST", "https://api.github.com/graphql", headers={}, body={"query": "q"}, send=None)
+        self.assertEqual(post.json(), {"data": {"ok": True}})
+
+    def test_replay_conditional_falls_back_and_unknown_raises(self):
+        url = "https://api.github.com/repos/o/r/languages"
+        self._record([("GET", url, {"headers": {}}, _live(404, {"message": "Not Found"}))])
+        player = Cassette(self.path, "replay")
+        resp = player.handle("GET", url, headers={"If-None-Match": '"old"'}, send=None)
+        self.assertEqual(resp.status_code, 404)
+        with self.assertRaises(requests.HTTPError):
+            resp.raise_for_status()
+        with self.assertRaises(requests.ConnectionError):
+            player.handle("GET", url + "/missing", headers={}, send=None)
+
+    def test_replay_injects_rate_limit_headers_and_latency(self):
+        url = "https://api.github.com/users/u"
+        self._record([("GET", url, {"headers": {}}, _live(200, {}, {"X-RateLimit-Remaining": "4999"}))])
+        player = Cassette(self.path, "replay", latency=0.25, rate_limit=3)
+        with mock.patch("scripts.github.github_cassette.time.sleep") as sleep:
+            remaining = [player.handle("GET", url, headers={}, send=None).headers["X-RateLimit-Remaining"]
+                         for _ in range(4)]
+        self.assertEqual(remaining, ["2", "1", "0", "0"])
+        sleep.assert_called_with(0.25)
+
+    def test_transport_routes_through_active_cassette(self):
+        url = "https://api.github.com/users/u"
+        self._record([("GET", url, {"headers": {}}, _live(200, {"login": "u"}))])
+        with use_cassette(Cassette(self.path, "replay")), mock.patch.object(
+            github_transport, "_new_session", side_effect=AssertionError("network used"),
+        ):
+            resp = github_transport.http_get(url, headers={"Authorization": "Bearer t"})
+        self.assertEqual(resp.json(), {"login": "u"})
+
+    def test_contribution_calendar_records_then_replays(self):
+        calendar = {"totalContributions": 3, "weeks": []}
+        live = _live(200, {"data": {"user": {"contributionsCollection": {"contributionCalendar": calendar}}}})
+        with mock.patch.object(gh, "_get_cached", return_value=None), mock.patch.object(gh, "_set_cached"):
+            recorder = Cassette(self.path, "record")
+            with use_cassette(recorder), mock.patch.object(requests.Session, "post", return_value=live):
+                self.assertEqual(gh.get_contribution_calendar(days=365), calendar)
+            recorder.save()
+
+            # Same day, then a later day whose rolling window differs: both replay offline.
+            window = gh._calendar_window(365)
+            later = (window[0] + timedelta(days=1), window[1] + timedelta(days=1), "2099-01-01")
+            with use_cassette(Cassette(self.path, "replay")), mock.patch.object(
+                requests.Session, "post", side_effect=AssertionError("network used"),
+            ):
+                self.assertEqual(gh.get_contribution_calendar(days=365), calendar)
+                with mock.patch.object(gh, "_calendar_window", return_value=later):
+                    self.assertEqual(gh.get_contribution_calendar(days=365), calendar)
+
+
+if __name__ == "__main__":
+    unittest.main()
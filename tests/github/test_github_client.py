@@ -1,15 +1,25 @@
+import os
+import tempfile
+import threading
+import time
 import unittest
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from unittest.mock import patch
 
+from scripts.core.settings import Settings
+from scripts.github import github_cache
 from scripts.github import github_client as gh
+from scripts.github.github_deferred import DeferredPoller
+from scripts.github.github_repo_index import RepoChangeIndex
 
 
 class _FakeResponse:
-    def __init__(self, status_code: int, payload):
+    def __init__(self, status_code: int, payload, headers=None):
         self.status_code = status_code
         self._payload = payload
-        self.headers = {}
+        self.headers = dict(headers or {})
 
     def json(self):
         return self._payload
@@ -22,7 +32,9 @@ class GitHubClientTests(unittest.TestCase):
         old = (now - timedelta(days=45)).isoformat().replace("+00:00", "Z")
         repos = [{"owner": {"login": "jguida941"}, "name": "voiceterm"}]
 
-        with patch("scripts.github.github_client._get_cached", return_value=None), patch(
+        with patch("scripts.github.github_client.TOKEN", ""), patch(
+            "scripts.github.github_client._get_cached", return_value=None,
+        ), patch(
             "scripts.github.github_client._set_cached",
         ), patch(
             "scripts.github.github_client._request_with_retry",
@@ -99,7 +111,7 @@ class GitHubClientTests(unittest.TestCase):
             "scripts.github.github_client._calendar_window",
             return_value=(start, end, "2026-03-06"),
         ), patch(
-            "scripts.github.github_client.requests.post",
+            "scripts.github.github_graphql.http_post",
             return_value=_FakeResponse(200, graphql_payload),
         ) as post_mock:
             calendar = gh.get_contribution_calendar(days=365)
@@ -111,5 +123,407 @@ class GitHubClientTests(unittest.TestCase):
         self.assertEqual(variables["to"], "2026-03-06T23:59:59Z")
 
 
+    def test_async_engine_matches_thread_engine_totals(self):
+        repos = [{"owner": {"login": "jguida941"}, "name": f"r{i}"} for i in range(12)]
+        counts = {f"r{i}": i for i in range(12)}
+        counts["r5"] = None
+
+        def fake_count(owner, name):
+            return counts[name]
+
+        totals = {}
+        for engine in ("threads", "async"):
+            with patch.object(gh, "_settings", replace(gh._settings, client_engine=engine)), patch(
+                "scripts.github.github_client.TOKEN", "",
+            ), patch(
+                "scripts.github.github_client._get_cached", return_value=None,
+            ), patch("scripts.github.github_client._set_cached"), patch(
+                "scripts.github.github_client.get_repo_user_commit_count", side_effect=fake_count,
+            ):
+                totals[engine] = (gh.get_total_commits(repos), gh.get_total_commits(repos[:5]))
+
+        self.assertEqual(totals["threads"], (None, 10))
+        self.assertEqual(totals["async"], totals["threads"])
+
+    def test_batched_prefetch_fills_per_repo_cache_entries(self):
+        repos = [{"owner": {"login": "jguida941"}, "name": name} for name in ("a", "b", "c")]
+        cache = {}
+
+        def fake_post(url, headers=None, json=None):
+            query = json["query"]
+            self.assertEqual(query.count(": repository("), 3)
+            self.assertIn("$authorId: ID!", query)
+            return _FakeResponse(
+                200,
+                {
+                    "data": {
+                        "r0": {"defaultBranchRef": {"target": {"history": {"totalCount": 7}}}},
+                        "r1": {"defaultBranchRef": None},
+                        "r2": None,
+                        "rateLimit": {"cost": 1, "remaining": 4999, "resetAt": "2030-01-01T00:00:00Z"},
+                    },
+                    "errors": [{"type": "NOT_FOUND", "path": ["r2"]}],
+                },
+            )
+
+        with patch("scripts.github.github_client.TOKEN", "x"), patch(
+            "scripts.github.github_client._get_cached", side_effect=cache.get,
+        ), patch(
+            "scripts.github.github_client._set_cached", side_effect=cache.__setitem__,
+        ), patch(
+            "scripts.github.github_client._user_node_id", return_value="U_1",
+        ), patch("scripts.github.github_graphql.http_post", side_effect=fake_post):
+            resolved = gh._prefetch_commit_counts_batched(repos)
+
+        self.assertEqual(resolved, {("jguida941", "a"): 7, ("jguida941", "b"): 0})
+        self.assertEqual(cache["repo_user_commits_v2_jguida941_a_jguida941"], {"count": 7})
+        self.assertEqual(cache["repo_user_commits_v2_jguida941_b_jguida941"], {"count": 0})
+        self.assertNotIn("repo_user_commits_v2_jguida941_c_jguida941", cache)
+
+    def test_batched_results_reach_the_fan_out_with_the_cache_bypassed(self):
+        repos = [{"owner": {"login": "jguida941"}, "name": name} for name in ("a", "b", "c")]
+        found = {("jguida941", "a"): 7, ("jguida941", "b"): 0}
+        rest_calls = []
+
+        def rest_count(owner, name):
+            rest_calls.append(name)
+            return 5
+
+        with patch("scripts.github.github_client.TOKEN", "x"), patch(
+            "scripts.github.github_client._get_cached", return_value=None,
+        ), patch("scripts.github.github_client._set_cached"), patch(
+            "scripts.github.github_client._expire_cached",
+        ), patch(
+            "scripts.github.github_client._prefetch_commit_counts_batched", return_value=found,
+        ), patch(
+            "scripts.github.github_client.get_repo_user_commit_count", side_effect=rest_count,
+        ):
+            self.assertEqual(gh.get_total_commits(repos, max_workers=1), 12)
+        self.assertEqual(rest_calls, ["c"])
+
+    def test_repository_batch_respects_node_limit(self):
+        documents = []
+
+        def fake_query(query, variables, settings, allow_partial=False):
+            documents.append(query)
+            return {}
+
+        repos = [("o", f"r{i}") for i in range(250)]
+        with patch("scripts.github.github_graphql.graphql_query", side_effect=fake_query):
+            result = gh.graphql_repository_batch(repos, "name", gh._settings, nodes_per_repo=100)
+
+        self.assertEqual(len(result), 250)
+        self.assertTrue(all(value is None for value in result.values()))
+        per_doc = [doc.count(": repository(") for doc in documents]
+        self.assertEqual(sum(per_doc), 250)
+        self.assertLessEqual(max(per_doc) * 100, 10_000)
+
+    def test_stuck_participation_poll_falls_back_to_zeros(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+        poller = DeferredPoller(initial_delay=0.01, deadline=0.05)
+        with patch.object(gh, "_PARTICIPATION_POLLER", poller), patch.object(
+            gh, "PARTICIPATION_WAIT_GRACE_SECONDS", 0.1,
+        ), patch.object(gh, "_get_cached", return_value=None), patch("builtins.print"):
+            # The in-flight poll hangs well past the deadline.
+            poller.submit(gh._scoped("participation_o_r"), lambda: release.wait(5))
+            started = time.monotonic()
+            self.assertEqual(gh.get_repo_commits_last_n_weeks("o", "r", weeks=3), [0, 0, 0])
+        self.assertLess(time.monotonic() - started, 2)
+
+    def test_cold_participation_202_returns_zeros_without_waiting(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+        calls = []
+
+        def fetch(owner, repo):
+            calls.append(repo)
+            if len(calls) > 1:
+                release.wait(5)  # the background poll hangs
+            return None  # 202: still generating
+
+        poller = DeferredPoller(initial_delay=0.01, deadline=0.3)
+        with patch.object(gh, "_PARTICIPATION_POLLER", poller), patch.object(
+            gh, "_get_cached", return_value=None,
+        ), patch.object(gh, "_fetch_participation", side_effect=fetch), patch("builtins.print"):
+            started = time.monotonic()
+            self.assertEqual(gh.get_repo_commits_last_n_weeks("o", "r", weeks=2), [0, 0])
+            self.assertLess(time.monotonic() - started, 1)
+            key = gh._scoped("participation_o_r")
+            self.assertTrue(poller.tracking(key))
+            release.set()
+            self.assertIsNone(poller.result(key, timeout=5))
+
+    def test_use_client_engine_rejects_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            gh.use_client_engine("gevent")
+
+
+class ConditionalCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.settings = Settings(
+            username="jguida941",
+            token="",
+            cache_dir=Path(self._tmp.name),
+            cache_ttl_seconds=60,
+            bypass_cache=False,
+        )
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _expire(self, key):
+        path = github_cache._cache_path(key, self.settings.cache_dir)
+        old = time.time() - 3600
+        os.utime(path, (old, old))
+
+    def test_paginated_get_reuses_body_on_304(self):
+        key = 'paginated_repos/o/r/contributors_{}_2'
+        pages = [
+            _FakeResponse(200, [{"login": "a"}, {"login": "b"}], {"ETag": '"p1"'}),
+            _FakeResponse(200, [{"login": "c"}], {"ETag": '"p2"'}),
+        ]
+        with patch.object(gh, "_settings", self.settings), patch.object(
+            gh, "_request_with_retry", side_effect=pages,
+        ):
+            first = gh.paginated_get("repos/o/r/contributors", per_page=2)
+        self.assertEqual([c["login"] for c in first], ["a", "b", "c"])
+        self.assertEqual(
+            github_cache.read_cache_validators(key, self.settings),
+            {"pages": [{"etag": '"p1"'}, {"etag": '"p2"'}]},
+        )
+
+        self._expire(key)
+        self.assertIsNone(github_cache.read_cache(key, self.settings))
+
+        seen = []
+
+        def not_modified(url, params=None, conditional=None):
+            seen.append(conditional)
+            return _FakeResponse(304, None)
+
+        with patch.object(gh, "_settings", self.settings), patch.object(
+            gh, "_request_with_retry", side_effect=not_modified,
+        ):
+            second = gh.paginated_get("repos/o/r/contributors", per_page=2)
+
+        self.assertEqual(second, first)
+        self.assertEqual(seen, [{"If-None-Match": '"p1"'}, {"If-None-Match": '"p2"'}])
+        # Freshness was refreshed, so a plain read hits again.
+        self.assertEqual(github_cache.read_cache(key, self.settings), first)
+
+    def test_paginated_get_page_size_is_part_of_the_cache_key(self):
+        pages = [
+            _FakeResponse(200, [{"login": "a"}, {"login": "b"}], {"ETag": '"p1"'}),
+            _FakeResponse(200, [{"login": "c"}], {"ETag": '"p2"'}),
+        ]
+        with patch.object(gh, "_settings", self.settings), patch.object(
+            gh, "_request_with_retry", side_effect=pages,
+        ):
+            gh.paginated_get("repos/o/r/contributors", per_page=2)
+        self._expire('paginated_repos/o/r/contributors_{}_2')
+
+        seen = []
+        listing = [[{"login": "a"}], [{"login": "b"}], [{"login": "c"}], []]
+
+        def fetch(url, params=None, conditional=None):
+            seen.append(conditional)
+            return _FakeResponse(200, listing[params["page"] - 1], {"ETag": f'"q{params["page"]}"'})
+
+        with patch.object(gh, "_settings", self.settings), patch.object(
+            gh, "_request_with_retry", side_effect=fetch,
+        ):
+            # A different page size never revalidates against the per_page=2 slices.
+            result = gh.paginated_get("repos/o/r/contributors", per_page=1)
+        self.assertEqual([c["login"] for c in result], ["a", "b", "c"])
+        self.assertEqual(seen, [None] * 4)
+
+    def test_write_without_validators_drops_stale_sidecar(self):
+        github_cache.write_cache("k", [1], self.settings, validators={"etag": '"x"'})
+        self.assertEqual(github_cache.read_cache_validators("k", self.settings), {"etag": '"x"'})
+        github_cache.write_cache("k", [2], self.settings)
+        self.assertEqual(github_cache.read_cache_validators("k", self.settings), {})
+
+
+    def test_commit_contributions_query_only_open_years_once_past_years_cached(self):
+        this_year = datetime.now(timezone.utc).year
+        queries = []
+
+        def fake_graphql(query, variables):
+            queries.append(query)
+            if "createdAt" in query:
+                return {"user": {"createdAt": f"{this_year - 2}-05-01T00:00:00Z"}}
+            years = [y for y in range(this_year - 2, this_year + 1) if f"y{y}:" in query]
+            return {"user": {f"y{y}": {"totalCommitContributions": 10} for y in years}}
+
+        with patch.object(gh, "_settings", self.settings), patch.object(gh, "TOKEN", "t"), patch.object(
+            gh, "_graphql_query", side_effect=fake_graphql,
+        ):
+            self.assertEqual(gh.get_total_commit_contributions_via_graphql(), 30)
+            self.assertEqual(len(queries), 2)  # createdAt + one aliased document
+            self.assertEqual(queries[1].count("contributionsCollection"), 3)
+
+            self._expire("total_commit_contributions_graphql_all_time")
+            queries.clear()
+            self.assertEqual(gh.get_total_commit_contributions_via_graphql(), 30)
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(queries[0].count("contributionsCollection"), 1)
+        self.assertIn(f"y{this_year}:", queries[0])
+
+
+    def test_iter_paginated_resumes_after_an_interrupted_run(self):
+        pages = {
+            1: [{"login": "a"}, {"login": "b"}],
+            2: [{"login": "c"}, {"login": "d"}],
+            3: [{"login": "e"}],
+        }
+        requested = []
+
+        def fake_request(url, params=None, **kwargs):
+            requested.append(params["page"])
+            return _FakeResponse(200, pages[params["page"]])
+
+        with patch.object(gh, "_settings", self.settings), patch.object(
+            gh, "_request_with_retry", side_effect=fake_request,
+        ):
+            for item in gh.iter_paginated("repos/o/r/contributors", per_page=2):
+                if item["login"] == "c":
+                    break  # interrupted mid-listing
+            self.assertEqual(requested, [1, 2])
+
+            requested.clear()
+            logins = [item["login"] for item in gh.iter_paginated("repos/o/r/contributors", per_page=2)]
+            self.assertEqual(logins, ["a", "b", "c", "d", "e"])
+            self.assertEqual(requested, [3])
+
+            requested.clear()
+            self.assertEqual(len(list(gh.iter_paginated("repos/o/r/contributors", per_page=2))), 5)
+            self.assertEqual(requested, [])
+
+    def test_iter_paginated_reopens_a_complete_listing_that_grew(self):
+        pages = {1: [{"login": "a"}]}
+
+        def fake_request(url, params=None, **kwargs):
+            return _FakeResponse(200, pages[params["page"]])
+
+        with patch.object(gh, "_settings", self.settings), patch.object(
+            gh, "_request_with_retry", side_effect=fake_request,
+        ):
+            self.assertEqual(len(list(gh.iter_paginated("repos/o/r/contributors", per_page=2))), 1)
+
+            # The listing grew: the stale last page is now full and a second page exists.
+            pages.update({1: [{"login": "a"}, {"login": "b"}], 2: [{"login": "c"}]})
+            self._expire('paginated_page_repos/o/r/contributors_{}_2_1')
+            logins = [item["login"] for item in gh.iter_paginated("repos/o/r/contributors", per_page=2)]
+        self.assertEqual(logins, ["a", "b", "c"])
+
+    def test_cached_latest_commit_keeps_its_message(self):
+        commit = {"sha": "abc", "commit": {"message": "Fix parser\n\nbody", "author": {"name": "a"}}, "url": "u"}
+        requested = []
+
+        def fake_request(url, params=None, **kwargs):
+            requested.append(params["page"])
+            return _FakeResponse(200, [commit])
+
+        with patch.object(gh, "_settings", self.settings), patch.object(
+            gh, "_request_with_retry", side_effect=fake_request,
+        ):
+            first = next(gh.iter_paginated("repos/o/r/commits", per_page=1), None)
+            second = next(gh.iter_paginated("repos/o/r/commits", per_page=1), None)
+        self.assertEqual(requested, [1])
+        self.assertEqual(first, commit)
+        self.assertEqual(second, {"sha": "abc", "commit": {"message": "Fix parser\n\nbody"}})
+
+    def test_user_commit_count_stops_at_the_page_holding_the_user(self):
+        first_page = [{"login": f"dev{i}", "contributions": 100 - i} for i in range(100)]
+        first_page[3] = {"login": "jguida941", "contributions": 42}
+        with patch.object(gh, "_settings", self.settings), patch.object(gh, "USERNAME", "jguida941"), patch.object(
+            gh, "_request_with_retry", return_value=_FakeResponse(200, first_page),
+        ) as request:
+            self.assertEqual(gh.get_repo_user_commit_count("o", "busy"), 42)
+        self.assertEqual(request.call_count, 1)
+
+
+    def test_fork_inclusive_listing_feeds_both_repo_views(self):
+        nodes = [
+            {"name": "tool", "isFork": False, "owner": {"login": "jguida941"}},
+            {"name": "upstream-fix", "isFork": True, "owner": {"login": "jguida941"}},
+        ]
+        page = {"user": {"repositories": {"nodes": nodes, "pageInfo": {"hasNextPage": False}}}}
+        with patch.object(gh, "_settings", self.settings), patch.object(gh, "TOKEN", "t"), patch.object(
+            gh, "_graphql_query", return_value=page,
+        ) as query:
+            nonfork = gh.get_repos(include_forks=False)
+            everything = gh.get_repos(include_forks=True)
+        self.assertEqual(query.call_count, 1)
+        self.assertEqual([repo["name"] for repo in nonfork], ["tool"])
+        self.assertEqual([repo["name"] for repo in everything], ["tool", "upstream-fix"])
+
+
+class RepoChangeIndexTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.settings = Settings(
+            username="jguida941",
+            token="",
+            cache_dir=Path(self._tmp.name),
+            cache_ttl_seconds=60,
+            bypass_cache=False,
+        )
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    @staticmethod
+    def _repos(pushed_b="2026-01-01T00:00:00Z"):
+        return [
+            {"name": name, "owner": {"login": "jguida941"}, "pushed_at": pushed, "updated_at": "2026-01-01T00:00:00Z"}
+            for name, pushed in (("a", "2026-01-01T00:00:00Z"), ("b", pushed_b), ("c", "2026-01-01T00:00:00Z"))
+        ]
+
+    def test_ci_count_reprobes_only_moved_repos(self):
+        probed = []
+
+        def ci_state(owner, repo):
+            probed.append(repo)
+            return repo != "c"
+
+        with patch.object(gh, "_settings", self.settings), patch.object(gh, "TOKEN", ""), patch.object(
+            gh, "get_repo_ci_state", side_effect=ci_state,
+        ):
+            self.assertEqual(gh.get_repos_with_ci(self._repos()), 2)
+            self.assertEqual(sorted(probed), ["a", "b", "c"])
+            probed.clear()
+            self.assertEqual(gh.get_repos_with_ci(self._repos(pushed_b="2026-02-01T00:00:00Z")), 2)
+        self.assertEqual(probed, ["b"])
+
+    def test_moved_repo_bypasses_fresh_per_repo_cache(self):
+        def languages(url, conditional=None, **_kwargs):
+            name = url.rsplit("/", 2)[-2]
+            return _FakeResponse(200, {"Python": 10 if name == "b" else 1})
+
+        with patch.object(gh, "_settings", self.settings), patch.object(
+            gh, "_request_with_retry", side_effect=languages,
+        ) as request:
+            self.assertEqual(gh.get_all_languages(self._repos()), {"Python": 12})
+            github_cache.expire_cache("all_languages_aggregated", self.settings)
+            request.reset_mock()
+            # langs_jguida941_b is still fresh, but the push must be seen.
+            self.assertEqual(gh.get_all_languages(self._repos(pushed_b="2026-02-01T00:00:00Z")), {"Python": 12})
+        self.assertEqual(request.call_count, 1)
+        self.assertTrue(request.call_args.args[0].endswith("/repos/jguida941/b/languages"))
+
+    def test_zero_release_count_carries_across_days(self):
+        index = RepoChangeIndex()
+        repo = self._repos()[0]
+        index.record(repo, "releases_30", {"day": "2026-01-01", "count": 0})
+        known, changed = index.split([repo], "releases_30", reusable=lambda v: v["count"] == 0)
+        self.assertEqual((len(known), changed), (1, []))
+        index.record(repo, "releases_30", {"day": "2026-01-01", "count": 2})
+        known, changed = index.split([repo], "releases_30", reusable=lambda v: v["count"] == 0)
+        self.assertEqual((known, changed), ([], [repo]))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,70 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+from scripts.github import github_concurrency
+from scripts.github.github_concurrency import AdaptiveLimiter, is_backoff_response
+
+
+class AdaptiveLimiterTests(unittest.TestCase):
+    def _request(self, limiter, status=200, headers=None):
+        with limiter.slot() as slot:
+            slot.observe(status, headers or {})
+
+    def test_healthy_responses_widen_the_limit_up_to_maximum(self):
+        limiter = AdaptiveLimiter(4, minimum=2, maximum=6)
+        for _ in range(4):
+            self._request(limiter)
+        self.assertEqual(limiter.limit, 4)  # +1/limit per response: 4.92 after four
+        self._request(limiter)
+        self.assertEqual(limiter.limit, 5)
+        for _ in range(50):
+            self._request(limiter)
+        self.assertEqual(limiter.stats()["limit"], 6)
+        self.assertEqual(limiter.stats()["peak"], 6)
+
+    def test_backoff_halves_once_per_cooldown_and_respects_minimum(self):
+        limiter = AdaptiveLimiter(16, minimum=3, maximum=32)
+        clock = [100.0]
+        with mock.patch.object(github_concurrency.time, "monotonic", side_effect=lambda: clock[0]):
+            self._request(limiter, 429)
+            self._request(limiter, 502)  # same burst: ignored
+            self.assertEqual(limiter.limit, 8)
+            clock[0] += 2
+            self._request(limiter, 403, {"Retry-After": "30"})
+            clock[0] += 2
+            with self.assertRaises(RuntimeError), limiter.slot():
+                raise RuntimeError("connection reset")
+        self.assertEqual(limiter.limit, 3)
+        self.assertEqual(limiter.stats()["backoffs"], 3)
+
+    def test_classifies_backoff_responses(self):
+        self.assertTrue(is_backoff_response(403, {"X-RateLimit-Remaining": "0"}))
+        self.assertFalse(is_backoff_response(403, {"X-RateLimit-Remaining": "12"}))
+        self.assertFalse(is_backoff_response(404, {}))
+        self.assertFalse(is_backoff_response(202, {}))
+
+    def test_in_flight_never_exceeds_the_limit(self):
+        limiter = AdaptiveLimiter(2, minimum=2, maximum=2)
+        peak = []
+        lock = threading.Lock()
+
+        def worker():
+            with limiter.slot() as slot:
+                with lock:
+                    peak.append(limiter.stats()["in_flight"])
+                time.sleep(0.02)
+                slot.observe(200, {})
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLessEqual(max(peak), 2)
+        self.assertEqual(limiter.stats()["in_flight"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
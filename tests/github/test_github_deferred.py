@@ -0,0 +1,44 @@
+import unittest
+
+from scripts.github.github_deferred import DeferredPoller
+
+
+class DeferredPollerTests(unittest.TestCase):
+    def test_polls_with_backoff_until_a_value_arrives(self):
+        poller = DeferredPoller(initial_delay=0.001, max_delay=0.004, deadline=5)
+        answers = iter([None, None, [1, 2, 3]])
+        calls = []
+
+        def poll():
+            calls.append(1)
+            return next(answers)
+
+        poller.submit("k", poll)
+        self.assertIs(poller.submit("k", lambda: self.fail("second poll started")), poller.submit("k", poll))
+        self.assertEqual(poller.result("k", timeout=5), [1, 2, 3])
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(poller.pending(), 0)
+
+    def test_deadline_and_errors_resolve_to_none(self):
+        poller = DeferredPoller(initial_delay=0.001, max_delay=0.002, deadline=0.05)
+        poller.submit("never", lambda: None)
+        poller.submit("broken", lambda: 1 / 0)
+        self.assertIsNone(poller.result("never", timeout=5))
+        self.assertIsNone(poller.result("broken", timeout=5))
+        self.assertIsNone(poller.result("untracked"))
+        self.assertFalse(poller.tracking("untracked"))
+
+    def test_unresolved_keys_are_forgotten_and_polled_again(self):
+        poller = DeferredPoller(initial_delay=0.001, max_delay=0.002, deadline=0.02)
+        first = poller.submit("k", lambda: None)
+        self.assertIsNone(first.result(timeout=5))
+        self.assertFalse(poller.tracking("k"))
+        second = poller.submit("k", lambda: [4])
+        self.assertIsNot(second, first)
+        self.assertEqual(poller.result("k", timeout=5), [4])
+        # Resolved keys stay tracked, so their value is not polled for twice.
+        self.assertTrue(poller.tracking("k"))
+
+
+if __name__ == "__main__":
+    unittest.main()
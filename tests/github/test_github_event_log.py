@@ -0,0 +1,93 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.core.settings import Settings
+from scripts.github import github_client as gh
+from scripts.github.github_event_log import EventLog
+from scripts.pipeline.compute_metrics import _activity_rhythm
+from tests.github.test_github_client import _FakeResponse
+
+
+def _event(event_id, event_type="PushEvent", created_at="2026-10-14T13:05:00Z", **payload):
+    return {"id": str(event_id), "type": event_type, "created_at": created_at, "payload": payload}
+
+
+class EventLogTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.log = EventLog(Path(self._tmp.name) / "event_log")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_append_skips_ids_at_or_below_high_water(self):
+        self.assertEqual(self.log.append([_event(2), _event(1)]), 2)
+        self.assertEqual(self.log.append([_event(3), _event(2)]), 1)
+        self.assertEqual(self.log.high_water_id(), 3)
+        self.assertEqual([e["id"] for e in self.log.events()], ["3", "2", "1"])
+        self.assertEqual([e["id"] for e in self.log.events(limit=2)], ["3", "2"])
+
+    def test_aggregates_fold_releases_and_merged_prs(self):
+        self.log.append(
+            [
+                _event(1, "ReleaseEvent", "2026-10-01T08:00:00Z"),
+                _event(2, "PullRequestEvent", "2026-10-02T09:00:00Z", action="closed", pull_request={"merged": True}),
+                _event(3, "PullRequestEvent", "2026-10-02T09:30:00Z", action="closed", pull_request={"merged": False}),
+            ]
+        )
+        aggregates = self.log.aggregates()
+        self.assertEqual(aggregates["event_count"], 3)
+        self.assertEqual(aggregates["release_times"], ["2026-10-01T08:00:00Z"])
+        self.assertEqual(aggregates["merged_pr_times"], ["2026-10-02T09:00:00Z"])
+        self.assertEqual(aggregates["hourly"]["2026-10-02T09"], {"PullRequestEvent": 2})
+
+    def test_rhythm_from_hourly_buckets_matches_raw_events(self):
+        events = [
+            _event(1, "PushEvent", "2026-10-14T13:05:00Z"),
+            _event(2, "PushEvent", "2026-10-14T13:45:00Z"),
+            _event(3, "IssuesEvent", "2026-10-15T02:10:00Z"),
+        ]
+        self.log.append(events)
+        self.assertEqual(
+            _activity_rhythm([], self.log.aggregates()["hourly"]),
+            _activity_rhythm(events),
+        )
+
+
+class IncrementalGetEventsTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.settings = Settings(
+            username="jguida941",
+            token="",
+            cache_dir=Path(self._tmp.name),
+            cache_ttl_seconds=60,
+            bypass_cache=True,
+        )
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_second_run_stops_at_first_seen_id(self):
+        first_page = [_event(i) for i in range(10, 8, -1)]
+        with patch.object(gh, "_settings", self.settings), patch.object(
+            gh, "_request_with_retry", side_effect=[_FakeResponse(200, first_page), _FakeResponse(200, [])],
+        ):
+            self.assertEqual([e["id"] for e in gh.get_events(per_page=2, max_pages=3)], ["10", "9"])
+
+        # Newest page overlaps the log: one request, no further paging.
+        second_page = [_event(11), _event(10)]
+        with patch.object(gh, "_settings", self.settings), patch.object(
+            gh, "_request_with_retry", side_effect=[_FakeResponse(200, second_page)],
+        ) as request:
+            events = gh.get_events(per_page=2, max_pages=3)
+        self.assertEqual(request.call_count, 1)
+        self.assertEqual([e["id"] for e in events], ["11", "10", "9"])
+        with patch.object(gh, "_settings", self.settings):
+            self.assertEqual(gh.get_event_aggregates()["event_count"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
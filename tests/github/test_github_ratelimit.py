@@ -0,0 +1,128 @@
+import threading
+import unittest
+from unittest import mock
+
+from scripts.github import github_ratelimit as rl
+from scripts.github import github_transport
+from tests.github.test_token_fallback import _Resp, _settings
+
+
+class _Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def _headers(remaining, reset, limit=5000, resource="core"):
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(int(reset)),
+        "X-RateLimit-Resource": resource,
+    }
+
+
+class RateBudgetTests(unittest.TestCase):
+    def test_healthy_budget_never_sleeps(self):
+        clock = _Clock()
+        budget = rl.RateBudget(sleep=clock.sleep, clock=clock)
+        budget.record("t", "core", _headers(4000, clock.now + 600))
+        self.assertEqual(budget.before_request("t", "core"), 0.0)
+        self.assertEqual(clock.slept, [])
+
+    def test_low_budget_paces_and_exhausted_budget_waits_for_reset(self):
+        clock = _Clock()
+        budget = rl.RateBudget(sleep=clock.sleep, clock=clock)
+        budget.record("t", "core", _headers(100, clock.now + 50))
+        self.assertAlmostEqual(budget.before_request("t", "core"), 0.5)
+
+        reset = 1_000_040
+        budget.record("t", "core", _headers(3, reset))
+        expected = reset - clock.now + 1.0
+        self.assertAlmostEqual(budget.before_request("t", "core"), expected)
+
+    def test_reset_too_far_away_waits_the_maximum(self):
+        clock = _Clock()
+        budget = rl.RateBudget(sleep=clock.sleep, clock=clock)
+        budget.record("t", "core", _headers(0, clock.now + 3600))
+        self.assertEqual(budget.before_request("t", "core"), rl.MAX_THROTTLE_SECONDS)
+
+    def test_concurrent_callers_queue_behind_one_pacing_interval(self):
+        clock = _Clock()
+        slept = []
+        budget = rl.RateBudget(sleep=slept.append, clock=clock)
+        budget.record("t", "core", _headers(100, clock.now + 50))
+        # Nobody has slept yet (the clock has not moved): each caller takes the next slot.
+        waits = [budget.before_request("t", "core") for _ in range(3)]
+        self.assertEqual([round(w, 3) for w in waits], [0.5, 1.005, 1.515])
+
+    def test_exhausted_tokens_are_tried_last(self):
+        clock = _Clock()
+        budget = rl.RateBudget(sleep=clock.sleep, clock=clock)
+        budget.record(rl.token_key("pat"), "core", _headers(1, clock.now + 600))
+        budget.record(rl.token_key("gh"), "core", _headers(900, clock.now + 600))
+        self.assertEqual(budget.order_tokens(("pat", "gh"), "core"), ("gh", "pat"))
+        self.assertEqual(budget.order_tokens(("pat", "gh"), "search"), ("pat", "gh"))
+
+    def test_used_pat_stays_ahead_of_the_fallback_token(self):
+        clock = _Clock()
+        budget = rl.RateBudget(sleep=clock.sleep, clock=clock)
+        budget.record(rl.token_key("pat"), "core", _headers(4999, clock.now + 600))
+        self.assertEqual(budget.order_tokens(("pat", "gh"), "core"), ("pat", "gh"))
+        budget.record(rl.token_key("gh"), "core", _headers(900, clock.now + 600, limit=1000))
+        budget.record(rl.token_key("pat"), "core", _headers(rl.RESERVE_REQUESTS + 1, clock.now + 600))
+        self.assertEqual(budget.order_tokens(("pat", "gh"), "core"), ("pat", "gh"))
+        # Only once the PAT is down to its reserve does the fallback lead.
+        budget.record(rl.token_key("pat"), "core", _headers(rl.RESERVE_REQUESTS, clock.now + 600))
+        self.assertEqual(budget.order_tokens(("pat", "gh"), "core"), ("gh", "pat"))
+
+    def test_spend_is_attributed_to_the_bound_step(self):
+        budget = rl.RateBudget()
+        with rl.budget_step("commits"):
+            worker = rl.bind_step(lambda: budget.record("t", "core", {}))
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        budget.record("t", "graphql", {}, cost=7)
+        budget.record("t", "core", {}, status=304)
+
+        steps = budget.report()["steps"]
+        self.assertEqual(steps["commits"]["cost"], {"core": 1})
+        self.assertEqual(steps["unscoped"]["cost"], {"graphql": 7, "core": 0})
+
+    def test_graphql_rate_limit_field_sets_cost(self):
+        budget = rl.RateBudget()
+        cost = budget.record_graphql_cost("t", {"cost": 3, "remaining": 4990, "resetAt": "2030-01-01T00:00:00Z"})
+        self.assertEqual(cost, 3)
+        window = budget.report()["windows"][0]
+        self.assertEqual(window["remaining"], 4990)
+
+
+class TransportRateLimitTests(unittest.TestCase):
+    def test_secondary_limit_403_is_retried_after_retry_after(self):
+        responses = [_Resp(403), _Resp(200)]
+        responses[0].headers = {"Retry-After": "2"}
+
+        with mock.patch.object(github_transport, "http_get", side_effect=responses), mock.patch.object(
+            github_transport.time, "sleep",
+        ) as sleep_mock:
+            resp = github_transport.request_with_retry("https://x", _settings(["tok"]))
+
+        self.assertEqual(resp.status_code, 200)
+        sleep_mock.assert_called_once_with(2.0)
+
+    def test_plain_403_still_raises(self):
+        with mock.patch.object(github_transport, "http_get", return_value=_Resp(403)):
+            with self.assertRaises(Exception):
+                github_transport.request_with_retry("https://x", _settings(["tok"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import requests
+
+from scripts.core.config import profile_user
+from scripts.core.settings import Settings
+from scripts.github import github_client as gh
+from scripts.github import github_graphql
+from scripts.github.github_deferred import DeferredPoller
+from scripts.github.github_standin import GitHubStandin, StandinConfig
+
+
+class GitHubStandinTests(unittest.TestCase):
+    def setUp(self):
+        self.standin = GitHubStandin(StandinConfig(username="loadtest", repos=12, seed=7)).start()
+        self.addCleanup(self.standin.stop)
+
+    def test_rest_pages_link_headers_and_etags(self):
+        url = f"{self.standin.url}/users/loadtest/repos"
+        first = requests.get(url, params={"per_page": 5, "page": 1})
+        self.assertEqual(len(first.json()), 5)
+        self.assertIn('page=3>; rel="last"', first.headers["Link"])
+        again = requests.get(url, params={"per_page": 5, "page": 1}, headers={"If-None-Match": first.headers["ETag"]})
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(len(requests.get(url, params={"per_page": 5, "page": 3}).json()), 2)
+
+        stats = f"{self.standin.url}/repos/loadtest/repo-00000/stats/participation"
+        self.assertEqual(requests.get(stats).status_code, 202)
+        self.assertEqual(len(requests.get(stats).json()["owner"]), 52)
+        self.assertEqual(requests.get(f"{self.standin.url}/repos/someone/else/languages").status_code, 404)
+        self.assertEqual(self.standin.request_counts()["GET repos/*/*/stats/participation"], 2)
+
+    def test_rate_limit_and_error_injection(self):
+        limited = GitHubStandin(StandinConfig(repos=1, rate_limit=2)).start()
+        self.addCleanup(limited.stop)
+        url = f"{limited.url}/users/standin-user/repos"
+        statuses = [requests.get(url).status_code for _ in range(3)]
+        self.assertEqual(statuses, [200, 200, 403])
+        self.assertEqual(requests.get(url).headers["X-RateLimit-Remaining"], "0")
+
+        failing = GitHubStandin(StandinConfig(repos=1, error_rate=1.0)).start()
+        self.addCleanup(failing.stop)
+        self.assertEqual(requests.get(f"{failing.url}/users/standin-user/repos").status_code, 502)
+
+    def test_client_aggregates_match_synthetic_account(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        settings = Settings(
+            username="jguida941", token="t", cache_dir=Path(tmp.name), cache_ttl_seconds=60, bypass_cache=False,
+        )
+        owned = [repo for repo in self.standin.account.repos if not repo.fork]
+        with patch.object(gh, "_settings", settings), patch.object(gh, "TOKEN", "t"), patch.object(
+            gh, "API", self.standin.url,
+        ), patch.object(github_graphql, "GRAPHQL_ENDPOINT", f"{self.standin.url}/graphql"), profile_user("loadtest"):
+            repos = gh.get_repos(include_forks=False)
+            self.assertEqual(sorted(r["name"] for r in repos), sorted(r.name for r in owned))
+            self.assertEqual(gh.get_total_commits(repos), sum(r.user_commits for r in owned))
+            self.assertEqual(gh.get_repos_with_ci(repos), sum(1 for r in owned if r.workflows))
+            self.assertEqual(gh.get_owned_repo_scope_counts()["public_owned_total"], 12)
+        counts = self.standin.request_counts()
+        self.assertNotIn("GET repos/*/*/contributors", counts)
+
+    def test_participation_202_is_polled_in_the_background(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        settings = Settings(
+            username="loadtest", token="t", cache_dir=Path(tmp.name), cache_ttl_seconds=60, bypass_cache=False,
+        )
+        repos = [{"name": r.name, "owner": {"login": "loadtest"}} for r in self.standin.account.repos[:3]]
+        expected = self.standin.account.repos[1].participation[-12:]
+        poller = DeferredPoller(initial_delay=0.01, max_delay=0.02, deadline=5)
+        with patch.object(gh, "_settings", settings), patch.object(gh, "USERNAME", "loadtest"), patch.object(
+            gh, "API", self.standin.url,
+        ), patch.object(gh, "_PARTICIPATION_POLLER", poller):
+            self.assertEqual(gh.warm_participation_stats(repos), 3)
+            self.assertEqual(gh.get_repo_commits_last_n_weeks("loadtest", repos[1]["name"]), expected)
+            for repo in repos:
+                gh.get_repo_commits_last_n_weeks("loadtest", repo["name"])
+            self.assertEqual(gh.warm_participation_stats(repos), 0)
+            # Resolved stats are cached: no further requests.
+            served = self.standin.request_counts()["GET repos/*/*/stats/participation"]
+            self.assertEqual(gh.get_repo_commits_last_n_weeks("loadtest", repos[1]["name"]), expected)
+        self.assertEqual(self.standin.request_counts()["GET repos/*/*/stats/participation"], served)
+        self.assertEqual(served, 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
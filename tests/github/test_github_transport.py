@@ -0,0 +1,120 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+from scripts.github import github_transport
+
+
+class SessionPoolTests(unittest.TestCase):
+    def test_sequential_checkouts_reuse_one_session(self):
+        pool = github_transport.SessionPool(max_size=4)
+        with pool.session() as first:
+            pass
+        with pool.session() as second:
+            pass
+        self.assertIs(first, second)
+        self.assertEqual(pool.stats()["hits"], 1)
+        self.assertEqual(pool.stats()["misses"], 1)
+        pool.close()
+
+    def test_concurrent_checkouts_never_exceed_max_size(self):
+        pool = github_transport.SessionPool(max_size=2)
+        live = []
+        peak = []
+        lock = threading.Lock()
+
+        def worker():
+            with pool.session() as sess:
+                with lock:
+                    live.append(sess)
+                    peak.append(len(live))
+                time.sleep(0.02)
+                with lock:
+                    live.remove(sess)
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertLessEqual(max(peak), 2)
+        stats = pool.stats()
+        self.assertEqual(stats["hits"] + stats["misses"], 6)
+        self.assertLessEqual(stats["misses"], 2)
+        pool.close()
+
+    def test_http_get_goes_through_shared_pool(self):
+        pool = github_transport.SessionPool(max_size=1)
+        fake_session = mock.Mock()
+        fake_session.get.return_value = "resp"
+        with mock.patch.object(github_transport, "_POOL", pool), mock.patch.object(
+            github_transport, "_new_session", return_value=fake_session,
+        ):
+            self.assertEqual(github_transport.http_get("https://x", headers={}), "resp")
+            self.assertEqual(github_transport.http_get("https://x", headers={}), "resp")
+        fake_session.get.assert_called_with("https://x", headers={}, params=None)
+        self.assertEqual(pool.stats()["misses"], 1)
+        self.assertEqual(pool.stats()["hits"], 1)
+
+
+class _JsonCountingResponse:
+    status_code = 200
+
+    def __init__(self):
+        self.parses = 0
+
+    def json(self):
+        self.parses += 1
+        return {"ok": True}
+
+
+class SingleFlightTests(unittest.TestCase):
+    def test_concurrent_identical_calls_share_one_request_and_one_parse(self):
+        flight = github_transport.SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return _JsonCountingResponse()
+
+        results = []
+        leader = threading.Thread(
+            target=lambda: results.append(flight.do("k", fetch, share=github_transport._share_response))
+        )
+        leader.start()
+        started.wait(5)
+        followers = [
+            threading.Thread(
+                target=lambda: results.append(flight.do("k", fetch, share=github_transport._share_response))
+            )
+            for _ in range(3)
+        ]
+        for thread in followers:
+            thread.start()
+        while flight.stats()["coalesced"] < 3:
+            time.sleep(0.001)
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len({id(result) for result in results}), 1)
+        self.assertEqual([result.json() for result in results], [{"ok": True}] * 4)
+        self.assertEqual(results[0]._response.parses, 1)
+        self.assertEqual(flight.stats(), {"coalesced": 3, "in_flight": 0})
+
+    def test_failure_reaches_every_waiter_and_is_not_remembered(self):
+        flight = github_transport.SingleFlight()
+        with self.assertRaises(RuntimeError):
+            flight.do("k", mock.Mock(side_effect=RuntimeError("boom")))
+        self.assertEqual(flight.do("k", lambda: "fresh"), "fresh")
+
+
+if __name__ == "__main__":
+    unittest.main()
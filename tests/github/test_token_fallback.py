@@ -43,7 +43,7 @@ class TransportFallbackTests(unittest.TestCase):
             seen.append(headers.get("Authorization"))
             return _Resp(401) if "bad" in headers.get("Authorization", "") else _Resp(200)
 
-        with mock.patch.object(github_transport.requests, "get", side_effect=fake_get):
+        with mock.patch.object(github_transport, "http_get", side_effect=fake_get):
             resp = github_transport.request_with_retry("https://x", _settings(["bad", "good"]))
         self.assertEqual(resp.status_code, 200)
         self.assertEqual(seen, ["Bearer bad", "Bearer good"])
@@ -52,7 +52,7 @@ class TransportFallbackTests(unittest.TestCase):
         def fake_get(url, headers=None, params=None):
             return _Resp(401)
 
-        with mock.patch.object(github_transport.requests, "get", side_effect=fake_get):
+        with mock.patch.object(github_transport, "http_get", side_effect=fake_get):
             with self.assertRaises(requests.HTTPError):
                 github_transport.request_with_retry("https://x", _settings(["bad"]))
 
@@ -67,7 +67,7 @@ class GraphqlFallbackTests(unittest.TestCase):
                 return _Resp(401)
             return _Resp(200, {"data": {"ok": True}})
 
-        with mock.patch.object(github_graphql.requests, "post", side_effect=fake_post):
+        with mock.patch.object(github_graphql, "http_post", side_effect=fake_post):
             data = github_graphql.graphql_query("q", {}, _settings(["bad", "good"]))
         self.assertEqual(data, {"ok": True})
         self.assertEqual(calls, ["Bearer bad", "Bearer good"])
@@ -76,7 +76,7 @@ class GraphqlFallbackTests(unittest.TestCase):
         def fake_post(url, headers=None, json=None):
             return _Resp(401)
 
-        with mock.patch.object(github_graphql.requests, "post", side_effect=fake_post):
+        with mock.patch.object(github_graphql, "http_post", side_effect=fake_post):
             self.assertIsNone(github_graphql.graphql_query("q", {}, _settings(["bad"])))
 
 
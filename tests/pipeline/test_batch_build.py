@@ -0,0 +1,81 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.core.config import USERNAME, active_username, profile_log
+from scripts.github import github_client as gh
+from scripts.pipeline.batch_build import read_users_file, run_batch_build
+
+
+class ReadUsersFileTests(unittest.TestCase):
+    def test_comments_blanks_and_duplicates_are_dropped(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "users.txt"
+            path.write_text("alice\n# team b\n\nbob  # lead\nalice\n", encoding="utf-8")
+            self.assertEqual(read_users_file(path), ["alice", "bob"])
+
+    def test_invalid_login_is_rejected(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "users.txt"
+            path.write_text("alice\n../etc\n", encoding="utf-8")
+            with self.assertRaises(ValueError):
+                read_users_file(path)
+
+
+class RunBatchBuildTests(unittest.TestCase):
+    def test_each_user_builds_under_its_own_identity_and_directory(self):
+        seen = {}
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_pipeline(logger=print, *, output_root):
+            barrier.wait()  # both users in flight at once
+            seen[active_username()] = (output_root, gh._user())
+            logger(f"built {active_username()}")
+            return {}
+
+        lines = []
+        with tempfile.TemporaryDirectory() as tmp, patch(
+            "scripts.pipeline.batch_build.run_profile_pipeline", side_effect=fake_pipeline,
+        ):
+            results = run_batch_build(["alice", "bob"], Path(tmp), workers=2, logger=lines.append)
+
+            self.assertEqual([r.username for r in results], ["alice", "bob"])
+            self.assertTrue(all(r.ok for r in results))
+            self.assertEqual(seen["alice"], (Path(tmp) / "alice", "alice"))
+            self.assertEqual(seen["bob"], (Path(tmp) / "bob", "bob"))
+        self.assertIn("built alice", lines)
+        self.assertEqual(active_username(), USERNAME)
+
+    def test_client_warnings_land_in_the_users_own_log_block(self):
+        def fake_pipeline(logger=print, *, output_root):
+            profile_log(f"  Warning: something odd for {active_username()}")
+            return {}
+
+        lines = []
+        with tempfile.TemporaryDirectory() as tmp, patch(
+            "scripts.pipeline.batch_build.run_profile_pipeline", side_effect=fake_pipeline,
+        ), patch("builtins.print") as stdout:
+            run_batch_build(["alice", "bob"], Path(tmp), workers=2, logger=lines.append)
+        stdout.assert_not_called()
+        for user in ("alice", "bob"):
+            block = lines[lines.index(f"\n=== {user} ===") + 1]
+            self.assertEqual(block, f"  Warning: something odd for {user}")
+
+    def test_one_failure_does_not_abort_the_batch(self):
+        def fake_pipeline(logger=print, *, output_root):
+            if active_username() == "broken":
+                raise RuntimeError("rate limited")
+            return {}
+
+        with tempfile.TemporaryDirectory() as tmp, patch(
+            "scripts.pipeline.batch_build.run_profile_pipeline", side_effect=fake_pipeline,
+        ):
+            results = run_batch_build(["broken", "fine"], Path(tmp), workers=1, logger=lambda _line: None)
+        self.assertEqual([(r.username, r.ok) for r in results], [("broken", False), ("fine", True)])
+        self.assertEqual(results[0].error, "rate limited")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -91,14 +91,14 @@ class AccuracyTests(unittest.TestCase):
 
     def setUp(self):
         self.model = compute_profile_model(self._collected(), logger=_noop, allow_network_calls=False)
-        self.blob = json.dumps(self.model, default=str)
+        self.blob = json.dumps(self.model.to_dict(), default=str)
 
     def test_self_repo_excluded_everywhere(self):
-        names = [r["name"] for r in self.model["recent_repos"]]
+        names = [r["name"] for r in self.model.recent_repos]
         self.assertNotIn("jguida941", names)
-        matrix = [r["name"] for r in self.model["repo_overview_rows"]]
+        matrix = [r["name"] for r in self.model.repo_overview_rows]
         self.assertNotIn("jguida941", matrix)
-        created = [r["name"] for r in self.model["recent_created"]]
+        created = [r["name"] for r in self.model.recent_created]
         self.assertNotIn("jguida941", created)
 
     def test_no_bot_commit_text_anywhere(self):
@@ -106,11 +106,11 @@ class AccuracyTests(unittest.TestCase):
         self.assertNotIn("[skip ci]", self.blob)
 
     def test_no_fabricated_next(self):
-        for item in self.model["focus"]["next"]:
+        for item in self.model.focus["next"]:
             self.assertFalse(item["title"].startswith("Next pass:"))
 
     def test_private_repo_named_but_no_headline_leak(self):
-        priv = [r for r in self.model["recent_repos"] if r.get("is_private")]
+        priv = [r for r in self.model.recent_repos if r.get("is_private")]
         self.assertTrue(any(r["name"] == "secret-api" for r in priv))
         secret = next(r for r in priv if r["name"] == "secret-api")
         self.assertEqual(secret["last_commit_msg"], "")  # never leak private commit text
@@ -118,13 +118,13 @@ class AccuracyTests(unittest.TestCase):
         self.assertNotIn("private internal commit text", self.blob)
 
     def test_now_reflects_recent_pushes(self):
-        now_titles = [i["title"] for i in self.model["focus"]["now"]]
+        now_titles = [i["title"] for i in self.model.focus["now"]]
         self.assertIn("pub1", now_titles)
         self.assertIn("secret-api", now_titles)
         self.assertNotIn("jguida941", now_titles)
 
     def test_engineering_block_present(self):
-        eng = self.model["engineering"]
+        eng = self.model.engineering
         self.assertIn("weekly_cadence", eng)
         self.assertGreaterEqual(eng["automation_workflows"], 2)
         self.assertEqual(eng["private_repos_total"], 1)
@@ -3,6 +3,7 @@ from pathlib import Path
 import unittest
 from unittest.mock import patch
 
+from scripts.contracts.profile_model import ProfileModel
 from scripts.pipeline.collect_data import CollectedProfileData
 from scripts.pipeline.compute_metrics import compute_profile_model
 
@@ -25,15 +26,13 @@ class ComputeMetricsIntegrationTests(unittest.TestCase):
         ):
             model = compute_profile_model(collected, logger=lambda *_args, **_kwargs: None)
 
-        self.assertIn("snapshot", model)
-        self.assertIn("scorecard", model)
-        self.assertIn("dashboard_data", model)
-        self.assertEqual(model["snapshot"]["total_stars"], 7)
-        self.assertEqual(model["snapshot"]["public_scope_commits"], 123)
-        self.assertEqual(model["snapshot"]["prs_merged"], 9)
-        self.assertEqual(model["scorecard"]["last_year_contributions"], 321)
-        self.assertEqual(model["data_quality"]["commits_status"], "ok")
-        self.assertEqual(model["dashboard_data"]["username"], "jguida941")
+        self.assertIsInstance(model, ProfileModel)
+        self.assertEqual(model.snapshot["total_stars"], 7)
+        self.assertEqual(model.snapshot["public_scope_commits"], 123)
+        self.assertEqual(model.snapshot["prs_merged"], 9)
+        self.assertEqual(model.scorecard["last_year_contributions"], 321)
+        self.assertEqual(model.data_quality["commits_status"], "ok")
+        self.assertEqual(model.dashboard_data["username"], "jguida941")
 
     def test_current_streak_ignores_future_zero_days(self):
         fixture_path = Path("tests/fixtures/sample_collected_data.json")
@@ -59,7 +58,7 @@ class ComputeMetricsIntegrationTests(unittest.TestCase):
             allow_network_calls=False,
         )
 
-        self.assertEqual(model["snapshot"]["streak_days"], 3)
+        self.assertEqual(model.snapshot["streak_days"], 3)
 
 
 if __name__ == "__main__":
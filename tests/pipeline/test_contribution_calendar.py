@@ -0,0 +1,45 @@
+import unittest
+from datetime import date
+
+from scripts.contracts.contribution_calendar import ContributionCalendar, intensity_level
+
+
+def _calendar(counts, start="2026-03-01"):
+    first = date.fromisoformat(start).toordinal()
+    days = [{"date": date.fromordinal(first + i).isoformat(), "contributionCount": c} for i, c in enumerate(counts)]
+    weeks = [{"contributionDays": days[i:i + 7]} for i in range(0, len(days), 7)]
+    return {"totalContributions": sum(counts), "weeks": weeks}
+
+
+class ContributionCalendarTests(unittest.TestCase):
+    def test_streaks_and_ranges(self):
+        # Mar 1-14: two runs of 3, a gap, then a run of 4 ending on Mar 13.
+        cal = ContributionCalendar.from_graphql(_calendar([1, 2, 3, 0, 5, 5, 5, 0, 0, 1, 1, 1, 1, 0]))
+        self.assertEqual(cal.longest_streak(), (4, date(2026, 3, 10), date(2026, 3, 13)))
+        self.assertEqual(cal.current_streak(date(2026, 3, 13)), (4, date(2026, 3, 10), date(2026, 3, 13)))
+        self.assertEqual(cal.current_streak(date(2026, 3, 14))[0], 0)
+        self.assertEqual(cal.current_streak(date(2026, 3, 3))[0], 3)
+        self.assertEqual(cal.longest_streak(date(2026, 3, 8)), (3, date(2026, 3, 1), date(2026, 3, 3)))
+
+    def test_totals_windows_and_levels(self):
+        cal = ContributionCalendar.from_graphql(_calendar([0, 4, 8, 1, 0, 0, 2] + [3] * 7))
+        self.assertEqual(cal.total, 36)
+        self.assertEqual(cal.active_days(), 11)
+        self.assertEqual(cal.weekly_totals(), [15, 21])
+        self.assertEqual(cal.weekly_totals(last=1), [21])
+        self.assertEqual(cal.window_total(1, 3), 12)
+        self.assertEqual(list(cal.intensity_levels())[:4], [0, 3, 4, 1])
+        self.assertEqual(intensity_level(6, 8), 4)
+
+    def test_tolerates_malformed_input(self):
+        raw = {"weeks": [{"contributionDays": [{"date": "bad", "contributionCount": 3}, "x",
+                                               {"date": "2026-03-01", "contributionCount": "-2"}]}, None]}
+        cal = ContributionCalendar.of(raw)
+        self.assertEqual(len(cal), 1)
+        self.assertEqual(cal.weekly_totals(), [0, 0])
+        self.assertEqual(ContributionCalendar.of(None).current_streak(), (0, None, None))
+        self.assertIs(ContributionCalendar.of(cal), cal)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from scripts.pipeline import event_index
+from scripts.pipeline.event_index import EventIndex
+
+
+def _event(event_type, created_at, repo="u/r", **payload):
+    return {"type": event_type, "created_at": created_at, "repo": {"name": repo}, "actor": {"login": "u"}, "payload": payload}
+
+
+class EventIndexTests(unittest.TestCase):
+    def test_groups_by_type_newest_first_and_skips_junk(self):
+        index = EventIndex(
+            [
+                _event("PushEvent", "2026-10-01T08:00:00Z"),
+                "not-a-dict",
+                None,
+                _event("ReleaseEvent", "2026-10-03T08:00:00Z"),
+                _event("PushEvent", "2026-10-02T08:00:00Z", repo="u/other"),
+                {"type": "PushEvent"},
+            ]
+        )
+        self.assertEqual(len(index), 4)
+        pushes = index.of_type("PushEvent")
+        self.assertEqual([event.created_at for event in pushes], ["2026-10-02T08:00:00Z", "2026-10-01T08:00:00Z", ""])
+        self.assertEqual(pushes[0].repo, "u/other")
+        self.assertEqual(index.of_type("ReleaseEvent", "PushEvent")[0].type, "ReleaseEvent")
+        self.assertEqual(index.times("ReleaseEvent"), [datetime(2026, 10, 3, 8, tzinfo=timezone.utc)])
+        self.assertEqual(index.of_type("IssuesEvent"), ())
+        self.assertIs(EventIndex.of(index), index)
+
+    def test_each_timestamp_is_parsed_once(self):
+        events = [_event("PushEvent", f"2026-10-0{day}T08:00:00Z") for day in range(1, 6)]
+        with patch.object(event_index, "parse_iso", wraps=event_index.parse_iso) as parse:
+            index = EventIndex(events)
+            index.of_type("PushEvent")
+            index.times("PushEvent")
+        self.assertEqual(parse.call_count, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import ast
+import importlib
+import json
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from scripts.pipeline.collect_data import CollectedProfileData
+from scripts.pipeline import compute_metrics
+from scripts.pipeline.compute_metrics import MODEL_CODE_MODULES, compute_profile_model
+from scripts.pipeline.model_sections import ModelSection, run_sections
+
+_NOON = datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _sections(calls):
+    def total(ctx, values):
+        calls.append("total")
+        return {"total": sum(ctx.numbers)}
+
+    def label(ctx, values):
+        calls.append("label")
+        return {"label": f"{ctx.name}: {values['total']}"}
+
+    def stamp(ctx, values):
+        calls.append("stamp")
+        return {"stamp": ctx.name}
+
+    return (
+        ModelSection("total", total, fields=("numbers",), outputs=("total",)),
+        ModelSection("label", label, fields=("name",), inputs=("total",), outputs=("label",)),
+        ModelSection("stamp", stamp, fields=("name",), outputs=("stamp",), clock=True),
+    )
+
+
+class RunSectionsTests(unittest.TestCase):
+    def _run(self, source, previous=None, now=_NOON, salt="s"):
+        calls = []
+        run = run_sections(_sections(calls), source, source=source, salt=salt, now_utc=now, previous=previous)
+        return run, calls
+
+    def test_reuses_unchanged_sections_and_recomputes_dependents(self):
+        first, calls = self._run(SimpleNamespace(numbers=[1, 2], name="a"))
+        self.assertEqual(calls, ["total", "label", "stamp"])
+        state = json.loads(json.dumps(first.state))
+
+        same, calls = self._run(SimpleNamespace(numbers=[1, 2], name="a"), state)
+        self.assertEqual(calls, [])
+        self.assertEqual(same.values, first.values)
+
+        # A different list with the same sum: "total" reruns, "label" does not.
+        changed, calls = self._run(SimpleNamespace(numbers=[3], name="a"), state)
+        self.assertEqual(calls, ["total"])
+        self.assertEqual(changed.values["label"], "a: 3")
+
+        _run, calls = self._run(SimpleNamespace(numbers=[1, 2], name="b"), state)
+        self.assertEqual(calls, ["label", "stamp"])
+
+    def test_clock_salt_and_version_invalidate(self):
+        source = SimpleNamespace(numbers=[1], name="a")
+        state = self._run(source)[0].state
+        self.assertEqual(self._run(source, state, now=_NOON.replace(hour=13))[1], ["stamp"])
+        self.assertEqual(len(self._run(source, state, salt="other")[1]), 3)
+        self.assertEqual(len(self._run(source, {**state, "version": 0})[1]), 3)
+
+    def test_rejects_undeclared_inputs_and_outputs(self):
+        bad_input = (ModelSection("x", lambda ctx, values: {"x": 1}, inputs=("missing",), outputs=("x",)),)
+        with self.assertRaises(ValueError):
+            run_sections(bad_input, None, source=None, salt="", now_utc=_NOON)
+        bad_output = (ModelSection("x", lambda ctx, values: {"y": 1}, outputs=("x",)),)
+        with self.assertRaises(ValueError):
+            run_sections(bad_output, None, source=None, salt="", now_utc=_NOON)
+
+
+class IncrementalProfileModelTests(unittest.TestCase):
+    def _payload(self):
+        return json.loads(Path("tests/fixtures/sample_collected_data.json").read_text(encoding="utf-8"))
+
+    def test_code_salt_covers_every_imported_scripts_module(self):
+        tree = ast.parse(Path(compute_metrics.__file__).read_text(encoding="utf-8"))
+        imported = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ImportFrom) and (node.module or "").startswith("scripts"):
+                for alias in node.names:
+                    try:
+                        imported.add(importlib.import_module(f"{node.module}.{alias.name}").__name__)
+                    except ImportError:
+                        imported.add(node.module)
+        self.assertEqual(sorted(imported - set(MODEL_CODE_MODULES)), [])
+
+    def test_helper_code_change_invalidates_persisted_sections(self):
+        helpers = Path(importlib.import_module("scripts.pipeline.profile_helpers").__file__)
+        real_read_bytes = Path.read_bytes
+
+        def edited(path):
+            data = real_read_bytes(path)
+            return data + b"\n# edited\n" if path == helpers else data
+
+        with tempfile.TemporaryDirectory() as tmp:
+            state_path = Path(tmp) / "profile_model_state.json"
+            logs = []
+            compute_profile_model(
+                CollectedProfileData(**self._payload()), logger=logs.append, allow_network_calls=False,
+                state_path=state_path,
+            )
+            with patch.object(Path, "read_bytes", edited):
+                compute_profile_model(
+                    CollectedProfileData(**self._payload()), logger=logs.append, allow_network_calls=False,
+                    state_path=state_path,
+                )
+        self.assertIn("0 reused", logs[-1])
+
+    def test_reused_model_matches_full_build(self):
+        payload = self._payload()
+        with tempfile.TemporaryDirectory() as tmp:
+            state_path = Path(tmp) / "profile_model_state.json"
+            logs = []
+            full = compute_profile_model(
+                CollectedProfileData(**payload), logger=logs.append, allow_network_calls=False, state_path=state_path,
+            )
+            reused = compute_profile_model(
+                CollectedProfileData(**payload), logger=logs.append, allow_network_calls=False, state_path=state_path,
+            )
+            self.assertTrue(state_path.exists())
+
+        self.assertIn("0 recomputed", logs[-1])
+        full, reused = full.to_dict(), reused.to_dict()
+        for model in (full, reused):
+            model.pop("now_utc")
+            model["dashboard_data"] = {**model["dashboard_data"], "generated_at": ""}
+        self.assertEqual(reused, full)
+
+
+if __name__ == "__main__":
+    unittest.main()
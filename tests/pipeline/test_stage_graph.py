@@ -0,0 +1,93 @@
+import threading
+import unittest
+
+from scripts.pipeline.stage_graph import Stage, run_stage_graph
+
+
+class StageGraphTests(unittest.TestCase):
+    def test_independent_stages_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def left(values, log):
+            barrier.wait()
+            return {"left": 1}
+
+        def right(values, log):
+            barrier.wait()
+            return {"right": 2}
+
+        def total(values, log):
+            return {"total": values["left"] + values["right"]}
+
+        result = run_stage_graph(
+            [
+                Stage("left", left, outputs=("left",)),
+                Stage("right", right, outputs=("right",)),
+                Stage("total", total, inputs=("left", "right"), outputs=("total",)),
+            ],
+            logger=lambda _line: None,
+            max_workers=2,
+        )
+        self.assertEqual(result.values["total"], 3)
+        self.assertEqual(set(result.timings), {"left", "right", "total"})
+
+    def test_logs_flush_in_declaration_order(self):
+        second_done = threading.Event()
+        lines: list[str] = []
+
+        def first(values, log):
+            second_done.wait(timeout=5)
+            log("first")
+            return {}
+
+        def second(values, log):
+            log("second")
+            second_done.set()
+            return {}
+
+        run_stage_graph([Stage("first", first), Stage("second", second)], logger=lines.append, max_workers=2)
+        self.assertEqual(lines, ["first", "second"])
+
+    def test_cycle_is_rejected_before_running(self):
+        ran: list[str] = []
+
+        def stage(name):
+            def run(values, log):
+                ran.append(name)
+                return {name: 1}
+
+            return run
+
+        with self.assertRaises(ValueError):
+            run_stage_graph(
+                [
+                    Stage("a", stage("a"), inputs=("b",), outputs=("a",)),
+                    Stage("b", stage("b"), inputs=("a",), outputs=("b",)),
+                ],
+                logger=lambda _line: None,
+            )
+        self.assertEqual(ran, [])
+
+    def test_failure_skips_dependent_stages(self):
+        ran: list[str] = []
+
+        def boom(values, log):
+            raise RuntimeError("upstream failed")
+
+        def downstream(values, log):
+            ran.append("downstream")
+            return {}
+
+        with self.assertRaisesRegex(RuntimeError, "upstream failed"):
+            run_stage_graph(
+                [
+                    Stage("boom", boom, outputs=("x",)),
+                    Stage("downstream", downstream, inputs=("x",)),
+                ],
+                logger=lambda _line: None,
+            )
+        self.assertEqual(ran, [])
+
+
+if __name__ == "__main__":
+    unittest.main()